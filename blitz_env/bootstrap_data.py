@@ -5,20 +5,36 @@ Two phases:
   scrape       -> data/stats/{year}/stats.db        (network; the scrape cache)
   build-season -> data/game_states/{year}/season.db (offline; the live per-season DB)
 
+`build-all --years ...` runs build-season for several years in parallel and skips
+a year whose season.manifest.json shows the same inputs (rank CSV, stats.db tables).
+It does not replace a season.db that holds league state (drafted players, the
+engine's tables) unless given --force; build-season always rebuilds, warning first.
+`refresh --year --week` copies one week of the weekly tables into an existing
+season.db in place (players and league state untouched).
+
 `build_season` copies the reference tables (stats/projections/injuries) from the
 scrape cache and materializes the draftable `players` pool. It does NOT create
 league-state tables (bots/matchups/...); the engine and harness own those.
 """
 
 import argparse
+import hashlib
+import json
 import os
 import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.dialects import sqlite as sqlite_dialect
+from sqlalchemy.schema import CreateTable
 
+from blitz_env import columnar
 from blitz_env.models import Player
-from blitz_env.load_players import load_players
+from blitz_env.load_players import insert_players, ranks_path
+from blitz_env.player_utils import parse_positions
+from blitz_env.positions import position_mask
+from blitz_env.reference_schema import INTEGER, REAL, SEASON_SCHEMA_VERSION, column_type
 
 _REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -31,6 +47,13 @@ _REFERENCE_TABLES = (
     "weekly_injuries",
 )
 
+# The per-week tables ``refresh`` updates one (year, week) at a time.
+_WEEKLY_TABLES = tuple(t for t in _REFERENCE_TABLES if t.startswith("weekly_"))
+
+
+# build_season's timed phases, in order
+BUILD_PHASES = ("players", "reference", "indexes", "vacuum", "analyze")
+
 
 def get_stats_cache_path(year: int) -> str:
     """The scraped reference DB (build input; bots never read this)."""
@@ -42,10 +65,24 @@ def get_season_db_path(year: int) -> str:
     return os.path.join(_REPO_ROOT, "data", "game_states", str(year), "season.db")
 
 
-def build_season(year: int, stats_path: str = None, season_path: str = None) -> str:
-    """Create a fresh season.db: players pool + reference tables from the scrape cache."""
+def get_manifest_path(season_path: str) -> str:
+    """``.../season.db`` -> ``.../season.manifest.json`` (what build-all compares against)."""
+    return os.path.splitext(season_path)[0] + ".manifest.json"
+
+
+def build_season(year: int, stats_path: str = None, season_path: str = None,
+                 timings: dict = None) -> str:
+    """Create a fresh season.db: players pool + reference tables from the scrape cache.
+
+    Everything is written through one raw sqlite3 connection in a single
+    transaction with the journal and fsyncs off, into ``season.db.build``. It is
+    VACUUMed and ANALYZEd, then renamed over season.db, so a crashed build never
+    leaves a half-written file behind. Pass ``timings`` to get milliseconds per
+    phase (``BUILD_PHASES``).
+    """
     stats_path = stats_path or get_stats_cache_path(year)
     season_path = season_path or get_season_db_path(year)
+    timings = {} if timings is None else timings
 
     if not os.path.isfile(stats_path):
         raise FileNotFoundError(
@@ -54,74 +91,437 @@ def build_season(year: int, stats_path: str = None, season_path: str = None) ->
         )
 
     os.makedirs(os.path.dirname(season_path), exist_ok=True)
-    if os.path.exists(season_path):
-        os.remove(season_path)
+    build_path = season_path + ".build"
+    if os.path.exists(build_path):
+        os.remove(build_path)
 
-    # 1) players pool via the ORM schema, populated from the rank CSV
-    engine = create_engine(f"sqlite:///{season_path}")
-    session = None
+    # autocommit mode: the transaction boundaries below are explicit
+    conn = sqlite3.connect(build_path, isolation_level=None)
     try:
-        Player.__table__.create(engine)
-        session = sessionmaker(bind=engine)()
-        for p in load_players(year):
-            session.add(Player(
-                id=p.id,
-                full_name=p.full_name,
-                professional_team=p.professional_team,
-                player_bye_week=p.player_bye_week,
-                rank=p.rank,
-                tier=p.tier,
-                position_rank=p.position_rank,
-                position_tier=p.position_tier,
-                gsis_id=p.gsis_id,
-                allowed_positions=list(p.allowed_positions),
-                availability="AVAILABLE",
-            ))
-        session.commit()
+        # the file is scratch until the rename, so durability buys nothing here
+        conn.execute("PRAGMA journal_mode = OFF")
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -65536")
+        conn.execute("ATTACH DATABASE ? AS cache", (stats_path,))  # not allowed inside a transaction
+
+        conn.execute("BEGIN")
+        # 1) the draftable pool: the ORM's players DDL (what the engine and harness
+        #    expect), bulk-inserted column-wise from the rank CSV, then its position forms
+        with _phase(timings, "players"):
+            conn.execute(str(CreateTable(Player.__table__).compile(dialect=sqlite_dialect.dialect())))
+            insert_players(conn, year)
+            _materialize_positions(conn)
+
+        # 2) reference tables from the scrape cache, with typed keys and a canonical
+        #    `season` column; indexed only once they are fully loaded
+        copied = {}
+        with _phase(timings, "reference"):
+            for table in _REFERENCE_TABLES:
+                present = conn.execute(
+                    "SELECT 1 FROM cache.sqlite_master WHERE type='table' AND name=?",
+                    (table,),
+                ).fetchone()
+                if present:
+                    copied[table] = _copy_reference_table(conn, table)
+        with _phase(timings, "indexes"):
+            for table, columns in copied.items():
+                _create_indexes(conn, table, columns)
+        conn.execute(f"PRAGMA user_version = {SEASON_SCHEMA_VERSION}")
+        conn.execute("COMMIT")
+        conn.execute("DETACH DATABASE cache")
+
+        # 3) compact the file, then planner statistics for the new indexes
+        with _phase(timings, "vacuum"):
+            conn.execute("VACUUM")
+        with _phase(timings, "analyze"):
+            conn.execute("ANALYZE")
+    except BaseException:
+        conn.close()
+        os.remove(build_path)
+        raise
+    conn.close()
+
+    os.replace(build_path, season_path)
+    return season_path
+
+
+@contextmanager
+def _phase(timings: dict, name: str):
+    start = time.perf_counter()
+    try:
+        yield
     finally:
-        if session is not None:
-            session.close()
-        engine.dispose()
+        timings[name] = round((time.perf_counter() - start) * 1000, 3)
 
-    # 2) reference tables copied from the scrape cache (raw sqlite3 for clean ATTACH)
-    conn = sqlite3.connect(season_path)
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _integer_key(col: str) -> str:
+    c = _quote(col)
+    return (f"CASE WHEN typeof({c}) IN ('integer', 'real') OR (typeof({c}) = 'text' "
+            f"AND trim({c}) GLOB '[0-9]*' AND trim({c}) NOT GLOB '*[^0-9]*') "
+            f"THEN CAST({c} AS INTEGER) END")
+
+
+def _real_value(col: str) -> str:
+    # blank cells become NULL; numeric text is converted by the REAL affinity
+    c = _quote(col)
+    return f"CASE WHEN typeof({c}) = 'text' THEN NULLIF(trim({c}), '') ELSE {c} END"
+
+
+def _text_value(col: str) -> str:
+    # whole-number ids stored as REAL (sleeper_id 1234.0) keep their integer spelling
+    c = _quote(col)
+    return (f"CASE WHEN typeof({c}) = 'real' AND {c} = CAST({c} AS INTEGER) "
+            f"THEN CAST(CAST({c} AS INTEGER) AS TEXT) ELSE {c} END")
+
+
+def _reference_columns(conn, table: str) -> list:
+    """``(name, type, select expression)`` for every column of cache.<table> under
+    the typed reference schema (blitz_env.reference_schema), plus `season`
+    (= year) when the scrape didn't write one."""
+    # the schema goes in the second argument: a `cache.` prefix would still read main's table
+    names = [row[0] for row in conn.execute("SELECT name FROM pragma_table_info(?, 'cache')", (table,))]
+    sources = list(names)
+    if "season" not in names and "year" in names:
+        names.append("season")
+        sources.append("year")
+    columns = []
+    for name, source in zip(names, sources):
+        kind = column_type(table, name)
+        if kind == INTEGER:
+            select = _integer_key(source)
+        elif kind == REAL:
+            select = _real_value(source)
+        else:
+            select = _text_value(source)
+        columns.append((name, kind, select))
+    return columns
+
+
+def _copy_reference_table(conn, table: str) -> list:
+    """Copy cache.<table> into season.db with the typed reference schema. Returns the columns."""
+    columns = _reference_columns(conn, table)
+    conn.execute(f"CREATE TABLE {_quote(table)} ({', '.join(f'{_quote(n)} {k}' for n, k, _ in columns)})")
+    conn.execute(f"INSERT INTO {_quote(table)} SELECT {', '.join(s for _, _, s in columns)} "
+                 f"FROM cache.{_quote(table)}")
+    return [name for name, _, _ in columns]
+
+
+def _materialize_positions(conn):
+    """players.position_mask and the normalized player_positions table, derived
+    from the allowed_positions JSON once here instead of per pick in every bot."""
+    rows = [(pid, parse_positions(raw)) for pid, raw in conn.execute("SELECT id, allowed_positions FROM players")]
+    conn.execute("ALTER TABLE players ADD COLUMN position_mask INTEGER NOT NULL DEFAULT 0")
+    conn.executemany("UPDATE players SET position_mask = ? WHERE id = ?",
+                     [(position_mask(positions), pid) for pid, positions in rows])
+    conn.execute("CREATE TABLE player_positions (player_id TEXT NOT NULL, position TEXT NOT NULL, "
+                 "PRIMARY KEY (player_id, position)) WITHOUT ROWID")
+    conn.executemany("INSERT OR IGNORE INTO player_positions VALUES (?, ?)",
+                     [(pid, position) for pid, positions in rows for position in positions])
+    conn.execute("CREATE INDEX idx_player_positions_position ON player_positions (position, player_id)")
+
+
+def _create_indexes(conn, table: str, columns: list):
+    """Indexes for the two read shapes: one player's rows (DatabaseManager accessors,
+    keyed by fantasypros_id then season/week) and one season/week for every player
+    (bots filtering on year/week)."""
+    has = set(columns).__contains__
+    if not table.startswith("weekly_"):
+        # season-level tables carry an unused (NULL) week column
+        has = lambda c, _has=has: c != "week" and _has(c)
+    wanted = []
+    if has("fantasypros_id"):
+        wanted.append(["fantasypros_id"] + [c for c in ("season", "week") if has(c)])
+    period = [c for c in ("year", "week") if has(c)]
+    if period:
+        wanted.append(period + (["fantasypros_id"] if has("fantasypros_id") else []))
+    for cols in wanted:
+        name = f"idx_{table}_{'_'.join(cols)}"
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {_quote(name)} ON {_quote(table)} "
+                     f"({', '.join(_quote(c) for c in cols)})")
+
+
+def _sha256_file(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _table_digest(conn, table: str) -> str:
+    """Hash of a table's DDL and rows (in rowid order). Unlike the file bytes, it
+    does not change when SQLite reuses pages or a write rewrites identical rows."""
+    digest = hashlib.sha256()
+    digest.update(conn.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name=?",
+                               (table,)).fetchone()[0].encode())
+    cursor = conn.execute(f"SELECT * FROM {_quote(table)}")
+    while True:
+        rows = cursor.fetchmany(10000)
+        if not rows:
+            break
+        digest.update(repr(rows).encode())
+    return digest.hexdigest()
+
+
+def input_hashes(year: int, stats_path: str = None) -> dict:
+    """What a season.db is built from: the rank CSV, each reference table in the
+    scrape cache, and the build's SEASON_SCHEMA_VERSION."""
+    stats_path = stats_path or get_stats_cache_path(year)
+    return {
+        "schema_version": SEASON_SCHEMA_VERSION,
+        "player_ranks": _sha256_file(ranks_path(year)),
+        "stats_tables": _table_digests(stats_path, _REFERENCE_TABLES),
+    }
+
+
+def _table_digests(stats_path: str, tables) -> dict:
+    """``{table: _table_digest}`` for those of ``tables`` present in the scrape cache."""
+    conn = sqlite3.connect(f"file:{os.path.abspath(stats_path)}?mode=ro", uri=True)
     try:
-        conn.execute("ATTACH DATABASE ? AS cache", (stats_path,))
-        for table in _REFERENCE_TABLES:
-            present = conn.execute(
-                "SELECT 1 FROM cache.sqlite_master WHERE type='table' AND name=?",
-                (table,),
-            ).fetchone()
-            if present:
-                conn.execute(f"CREATE TABLE {table} AS SELECT * FROM cache.{table}")
-        conn.commit()
+        present = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        return {t: _table_digest(conn, t) for t in tables if t in present}
     finally:
+        conn.close()
+
+
+def read_manifest(season_path: str):
+    """The manifest recorded by the last build of ``season_path`` (None if there is none)."""
+    try:
+        with open(get_manifest_path(season_path)) as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def _write_manifest(season_path: str, manifest: dict):
+    path = get_manifest_path(season_path)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def league_state(season_path: str) -> list:
+    """What in ``season_path`` a rebuild would lose: the tables build_season does not
+    create (the engine's bots, matchups, transactions, ...), plus "players" if any
+    player has been drafted. Empty for a fresh build or a missing file."""
+    if not os.path.isfile(season_path):
+        return []
+    conn = sqlite3.connect(f"file:{os.path.abspath(season_path)}?mode=ro", uri=True)
+    try:
+        built = {"players", "player_positions", *_REFERENCE_TABLES}
+        found = sorted(r[0] for r in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'")
+            if r[0] not in built)
+        if conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'players'").fetchone()[0]:
+            drafted = conn.execute("SELECT EXISTS (SELECT 1 FROM players WHERE availability != 'AVAILABLE' "
+                                   "OR current_bot_id IS NOT NULL)").fetchone()[0]
+            if drafted:
+                found.insert(0, "players")
+    finally:
+        conn.close()
+    return found
+
+
+def build_if_changed(year: int, stats_path: str = None, season_path: str = None,
+                     force: bool = False) -> dict:
+    """Build season.db unless its manifest shows the same inputs. Returns the
+    manifest, with ``status`` "built", "skipped", or "kept".
+
+    season.db is also the engine's live league DB, so once drafted or played it is
+    expected to differ from what the build wrote; only the inputs decide. A season.db
+    holding league state (``league_state``) is "kept", with a warning, even when the
+    inputs changed; ``force`` rebuilds it anyway (and still warns)."""
+    stats_path = stats_path or get_stats_cache_path(year)
+    season_path = season_path or get_season_db_path(year)
+    if not os.path.isfile(stats_path):
+        raise FileNotFoundError(
+            f"Scrape cache not found at '{stats_path}'. Run "
+            f"`python3 -m blitz_env.bootstrap_data scrape --year {year}` first."
+        )
+
+    inputs = input_hashes(year, stats_path)
+    previous = read_manifest(season_path)
+    if (not force and previous is not None and previous.get("inputs") == inputs
+            and os.path.isfile(season_path)):
+        return {**previous, "status": "skipped"}
+
+    state = league_state(season_path)
+    if state and not force:
+        print(f"Warning: {season_path} holds league state ({', '.join(state)}); "
+              f"not rebuilding it. Pass --force to rebuild and lose it.")
+        return {**(previous or {"year": year}), "status": "kept", "league_state": state}
+    if state:
+        print(f"Warning: rebuilding {season_path} discards its league state ({', '.join(state)})")
+
+    timings = {}
+    build_season(year, stats_path=stats_path, season_path=season_path, timings=timings)
+    manifest = {
+        "year": year,
+        "inputs": inputs,
+        "output": {"sha256": _sha256_file(season_path), "bytes": os.path.getsize(season_path)},
+        "timings_ms": timings,
+    }
+    _write_manifest(season_path, manifest)
+    return {**manifest, "status": "built"}
+
+
+def _build_one(year: int, stats_path: str, season_path: str, force: bool) -> dict:
+    start = time.perf_counter()
+    try:
+        result = build_if_changed(year, stats_path=stats_path, season_path=season_path, force=force)
+    except Exception as e:
+        result = {"year": year, "status": "failed", "error": f"{type(e).__name__}: {e}"}
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
+
+def build_all(years, workers: int = None, force: bool = False, paths=None) -> dict:
+    """``build_if_changed`` for every year, one process per season. ``paths(year)``
+    may return ``(stats_path, season_path)`` (default: the standard locations).
+    Returns ``{year: manifest}``; a failed season has status "failed" and an
+    ``error`` instead of stopping the others."""
+    years = sorted(set(int(y) for y in years))
+    paths = paths or (lambda year: (get_stats_cache_path(year), get_season_db_path(year)))
+    jobs = [(year, *paths(year), force) for year in years]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+    if workers == 1:
+        results = [_build_one(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_build_one, *zip(*jobs)))
+    return {result["year"]: result for result in results}
+
+
+def refresh(year: int, week: int, stats_path: str = None, season_path: str = None) -> dict:
+    """Replace one (year, week) of the weekly reference tables in an existing
+    season.db with the scrape cache's rows, in place and in one transaction.
+
+    Only that week's rows are deleted and re-inserted (through the
+    ``(year, week, fantasypros_id)`` indexes), so the cost is one week rather than a
+    rebuild. ``players`` and league state are left alone. New stat columns are
+    added, and the indexes are kept (and created for a table the cache gained).
+    A season.arrow sidecar next to season.db gets only that week's partitions
+    rewritten, and a season.manifest.json gets the new digests of the copied
+    tables. Returns ``{table: rows copied}``.
+    """
+    stats_path = stats_path or get_stats_cache_path(year)
+    season_path = season_path or get_season_db_path(year)
+    for path, hint in ((stats_path, f"python3 -m blitz_env.bootstrap_data scrape --year {year}"),
+                       (season_path, f"make bootstrap-data-build-season YEAR={year}")):
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"'{path}' not found. Run `{hint}` first.")
+    version = get_schema_version(season_path)
+    if version != SEASON_SCHEMA_VERSION:
+        raise ValueError(
+            f"{season_path} has schema version {version}, expected {SEASON_SCHEMA_VERSION}; "
+            f"rebuild it with `make bootstrap-data-build-season YEAR={year}` before refreshing."
+        )
+
+    copied = {}
+    conn = sqlite3.connect(season_path, isolation_level=None)
+    try:
+        conn.execute("ATTACH DATABASE ? AS cache", (stats_path,))
+        conn.execute("BEGIN IMMEDIATE")
         try:
-            conn.execute("DETACH DATABASE cache")
-        except sqlite3.Error:
-            pass
+            for table in _WEEKLY_TABLES:
+                if not conn.execute("SELECT 1 FROM cache.sqlite_master WHERE type='table' AND name=?",
+                                    (table,)).fetchone():
+                    continue
+                columns = _reference_columns(conn, table)
+                source = {name: select for name, _, select in columns}
+                if "year" not in source or "week" not in source:
+                    continue
+                existing = {r[0] for r in conn.execute("SELECT name FROM pragma_table_info(?, 'main')", (table,))}
+                if not existing:
+                    conn.execute(f"CREATE TABLE main.{_quote(table)} "
+                                 f"({', '.join(f'{_quote(n)} {k}' for n, k, _ in columns)})")
+                for name, kind, _ in columns:
+                    if existing and name not in existing:
+                        conn.execute(f"ALTER TABLE main.{_quote(table)} ADD COLUMN {_quote(name)} {kind}")
+                conn.execute(f"DELETE FROM main.{_quote(table)} WHERE year = ? AND week = ?", (year, week))
+                # filter on the raw columns (in either spelling: scrape caches hold keys
+                # as text or integers) so stats.db's (year, week) index can be used
+                cursor = conn.execute(
+                    f"INSERT INTO main.{_quote(table)} ({', '.join(_quote(n) for n, _, _ in columns)}) "
+                    f"SELECT {', '.join(s for _, _, s in columns)} FROM cache.{_quote(table)} "
+                    f"WHERE year IN (?, ?) AND week IN (?, ?)",
+                    (year, str(year), week, str(week)),
+                )
+                copied[table] = cursor.rowcount
+                _create_indexes(conn, table, sorted(existing | set(source)))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("DETACH DATABASE cache")
+        conn.execute("PRAGMA optimize")
+    finally:
+        conn.close()
+
+    # keep build-all's manifest in step, or the next build-all would redo (or refuse) it.
+    # Only the copied tables are re-digested; the output hash would cost a pass over
+    # the whole season.db, so it is dropped until the next build.
+    manifest = read_manifest(season_path)
+    if manifest is not None and copied:
+        manifest.setdefault("inputs", {}).setdefault("stats_tables", {}).update(
+            _table_digests(stats_path, copied))
+        manifest["output"] = {"bytes": os.path.getsize(season_path)}
+        _write_manifest(season_path, manifest)
+
+    if copied and os.path.isdir(columnar.sidecar_path(season_path)):
+        columnar.refresh(season_path, year, week, tables=list(copied))
+    return copied
+
+
+def get_schema_version(season_path: str) -> int:
+    """The SEASON_SCHEMA_VERSION a season.db was built with (0 = before versioning)."""
+    conn = sqlite3.connect(season_path)
+    try:
+        return conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
         conn.close()
 
-    return season_path
 
+def scrape(year: int, years_back: int = 10, weeks: str = "1:18", offline: bool = False) -> str:
+    """Full network pull into the scrape cache. Delegates to collect_stats.
 
-def scrape(year: int, years_back: int = 10, weeks: str = "1:18") -> str:
-    """Full network pull into the scrape cache. Delegates to collect_stats."""
+    Raw pages are cached on disk (blitz_env.http_cache); ``offline`` rebuilds the
+    scrape cache purely from those cached pages, e.g. after a parser fix.
+    """
     from blitz_env import collect_stats
 
     out = get_stats_cache_path(year)
     os.makedirs(os.path.dirname(out), exist_ok=True)
-    collect_stats.main([
-        "--db", out,
-        "--end-year", str(year),
-        "--years", str(years_back),
-        "--include-weekly",
-        "--include-injuries",
-        "--weeks", weeks,
-    ])
+    previous = os.environ.get("BOTBLITZ_HTTP_OFFLINE")
+    if offline:
+        os.environ["BOTBLITZ_HTTP_OFFLINE"] = "1"
+    try:
+        collect_stats.main([
+            "--db", out,
+            "--end-year", str(year),
+            "--years", str(years_back),
+            "--include-weekly",
+            "--include-injuries",
+            "--weeks", weeks,
+        ])
+    finally:
+        # collect_stats reads the flag deep inside the fetch layer; scope it to this call
+        if previous is None:
+            os.environ.pop("BOTBLITZ_HTTP_OFFLINE", None)
+        else:
+            os.environ["BOTBLITZ_HTTP_OFFLINE"] = previous
     return out
 
 
+def _format_timings(timings: dict) -> str:
+    return ", ".join(f"{name} {timings[name]:.0f} ms" for name in BUILD_PHASES)
+
+
 def main(argv=None) -> int:
     parser = argparse.ArgumentParser(prog="bootstrap_data")
     sub = parser.add_subparsers(dest="command", required=True)
@@ -130,21 +530,67 @@ def main(argv=None) -> int:
     s.add_argument("--year", type=int, required=True)
     s.add_argument("--years", type=int, default=10)
     s.add_argument("--weeks", default="1:18")
+    s.add_argument("--offline", action="store_true",
+                   help="Replay raw pages from the HTTP cache instead of the network")
 
     b = sub.add_parser("build-season",
                        help="Materialize data/game_states/{year}/season.db")
     b.add_argument("--year", type=int, required=True)
     b.add_argument("--stats-path", default=None)
     b.add_argument("--season-path", default=None)
+    b.add_argument("--columnar", action="store_true",
+                   help="Also write the Arrow sidecar (season.arrow/) next to season.db")
+
+    a = sub.add_parser("build-all",
+                       help="Build several seasons in parallel, skipping those whose inputs are unchanged")
+    a.add_argument("--years", type=int, nargs="+", required=True)
+    a.add_argument("--workers", type=int, default=None,
+                   help="Parallel build processes (default: one per season, up to the CPU count)")
+    a.add_argument("--force", action="store_true",
+                   help="Rebuild even when the manifest matches or season.db holds league state")
+
+    r = sub.add_parser("refresh",
+                       help="Copy one week of the weekly tables from stats.db into season.db in place")
+    r.add_argument("--year", type=int, required=True)
+    r.add_argument("--week", type=int, required=True)
+    r.add_argument("--stats-path", default=None)
+    r.add_argument("--season-path", default=None)
+
+    x = sub.add_parser("export-columnar",
+                       help="Write the Arrow sidecar of an existing season.db")
+    x.add_argument("--year", type=int, required=True)
+    x.add_argument("--season-path", default=None)
 
     args = parser.parse_args(argv)
     if args.command == "scrape":
-        path = scrape(args.year, years_back=args.years, weeks=args.weeks)
+        path = scrape(args.year, years_back=args.years, weeks=args.weeks, offline=args.offline)
         print(f"Scraped -> {path}")
     elif args.command == "build-season":
-        path = build_season(args.year, stats_path=args.stats_path,
-                            season_path=args.season_path)
-        print(f"Built season DB -> {path}")
+        path = args.season_path or get_season_db_path(args.year)
+        result = build_if_changed(args.year, stats_path=args.stats_path, season_path=path, force=True)
+        print(f"Built season DB -> {path} ({_format_timings(result['timings_ms'])})")
+        if args.columnar:
+            print(f"Exported columnar sidecar -> {columnar.export(path)}")
+    elif args.command == "build-all":
+        results = build_all(args.years, workers=args.workers, force=args.force)
+        for year, result in results.items():
+            if result["status"] == "built":
+                print(f"{year}: built in {result['elapsed_ms']:.0f} ms ({_format_timings(result['timings_ms'])})")
+            elif result["status"] == "skipped":
+                print(f"{year}: unchanged, skipped")
+            elif result["status"] == "kept":
+                print(f"{year}: inputs changed, kept (holds league state: {', '.join(result['league_state'])})")
+            else:
+                print(f"{year}: FAILED: {result['error']}")
+        if any(r["status"] == "failed" for r in results.values()):
+            return 1
+    elif args.command == "refresh":
+        copied = refresh(args.year, args.week, stats_path=args.stats_path, season_path=args.season_path)
+        rows = ", ".join(f"{table} {n}" for table, n in copied.items()) or "no weekly tables in the scrape cache"
+        print(f"Refreshed {args.year} week {args.week} -> {args.season_path or get_season_db_path(args.year)} ({rows})")
+    elif args.command == "export-columnar":
+        path = args.season_path or get_season_db_path(args.year)
+        print(f"Exported columnar sidecar -> {columnar.export(path)}")
     return 0
 
 
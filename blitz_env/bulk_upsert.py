@@ -0,0 +1,148 @@
+"""Bulk upsert of a scraped DataFrame into a stats.db table.
+
+Shared by the ``collect_weekly_*`` scripts. Rows go through one prepared
+``INSERT ... ON CONFLICT(keys) DO UPDATE`` statement via ``executemany`` inside a
+single transaction::
+
+    from blitz_env.bulk_upsert import upsert_dataframe
+    result = upsert_dataframe("data/stats/2025/stats.db", "weekly_stats", df,
+                              ["year", "week", "fantasypros_id", "position"])
+    print(result.inserted, result.updated)
+
+The table is created on first write, with a unique index on the key columns and
+a ``(year, week)`` index when it has both; columns the frame has but the table
+lacks are added. Reference tables (blitz_env.reference_schema) are conformed to
+their typed schema first, so upserts keep INTEGER keys, the ``season`` column and
+REAL stats. The write runs in WAL mode with relaxed sync, then the DB is switched
+back to its previous journal mode so the file stays self-contained.
+"""
+
+import os
+import sqlite3
+from typing import List, NamedTuple
+
+import pandas as pd
+
+from blitz_env import reference_schema
+from blitz_env.fp_numeric import widen_floats
+
+
+class UpsertResult(NamedTuple):
+    inserted: int
+    updated: int
+
+
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",  # 64 MiB
+)
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _records(df: pd.DataFrame) -> list:
+    # Plain Python scalars (sqlite3 can't bind numpy ints) with NaN -> NULL
+    df = widen_floats(df)
+    return list(df.astype(object).where(df.notna(), None).itertuples(index=False, name=None))
+
+
+def _last_per_key(df: pd.DataFrame, key_columns: List[str]) -> pd.DataFrame:
+    """Drop all but the last row per key, as the upsert would leave them. Rows with a
+    NULL key never conflict in SQLite's unique index, so they are all kept."""
+    keyed = df[key_columns].notna().all(axis=1)
+    return df[~(keyed & df.duplicated(key_columns, keep="last"))]
+
+
+def _ensure_table(conn, table: str, df: pd.DataFrame, key_columns: List[str]):
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+    ).fetchone()
+    typed = table in reference_schema.TABLES
+    if not exists:
+        if typed:
+            conn.execute(reference_schema.create_table_sql(table, df.columns))
+        else:
+            conn.execute(pd.io.sql.get_schema(df, table, con=conn))
+    else:
+        have = {row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")}
+        for col in df.columns:
+            if col not in have:
+                decl = f" {reference_schema.column_type(table, col)}" if typed else ""
+                conn.execute(f"ALTER TABLE {_quote(table)} ADD COLUMN {_quote(col)}{decl}")
+    conn.execute(
+        f"CREATE UNIQUE INDEX IF NOT EXISTS {_quote(f'idx_{table}_unique')} "
+        f"ON {_quote(table)}({', '.join(_quote(k) for k in key_columns)})"
+    )
+    # bootstrap_data.refresh reads one (year, week) of the weekly tables back out
+    columns = {row[1] for row in conn.execute(f"PRAGMA table_info({_quote(table)})")}
+    if {"year", "week"} <= columns:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS {_quote(f'idx_{table}_year_week')} "
+                     f"ON {_quote(table)}(year, week)")
+
+
+def _count_existing(conn, table: str, key_columns: List[str], positions: List[int], rows: list) -> int:
+    """How many of ``rows`` (already one per key) match a row of ``table``: the
+    incoming keys are joined against the unique index, never a scan of the table."""
+    keys = ", ".join(_quote(k) for k in key_columns)
+    conn.execute(f"CREATE TEMP TABLE _upsert_keys ({keys})")
+    try:
+        conn.executemany(f"INSERT INTO _upsert_keys VALUES ({', '.join('?' for _ in key_columns)})",
+                         [tuple(row[i] for i in positions) for row in rows])
+        on = " AND ".join(f"t.{_quote(k)} = k.{_quote(k)}" for k in key_columns)
+        return conn.execute(f"SELECT COUNT(*) FROM temp._upsert_keys k "
+                            f"JOIN main.{_quote(table)} t ON {on}").fetchone()[0]
+    finally:
+        conn.execute("DROP TABLE temp._upsert_keys")
+
+
+def upsert_dataframe(db_path: str, table: str, df: pd.DataFrame, key_columns: List[str]) -> UpsertResult:
+    """Insert ``df`` into ``table``, updating rows whose ``key_columns`` already exist."""
+    if df.empty:
+        return UpsertResult(0, 0)
+    missing = [k for k in key_columns if k not in df.columns]
+    if missing:
+        raise ValueError(f"{table}: key columns {missing} not in frame")
+    if table in reference_schema.TABLES:
+        df = reference_schema.conform(table, df)
+    df = _last_per_key(df, key_columns)
+
+    db_dir = os.path.dirname(os.path.abspath(db_path))
+    os.makedirs(db_dir, exist_ok=True)
+
+    columns = list(df.columns)
+    updates = [c for c in columns if c not in key_columns]
+    on_conflict = (
+        "DO UPDATE SET " + ", ".join(f"{_quote(c)} = excluded.{_quote(c)}" for c in updates)
+        if updates else "DO NOTHING"
+    )
+    sql = (
+        f"INSERT INTO {_quote(table)} ({', '.join(_quote(c) for c in columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)}) "
+        f"ON CONFLICT({', '.join(_quote(k) for k in key_columns)}) {on_conflict}"
+    )
+    rows = _records(df)
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        previous_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.execute("PRAGMA journal_mode=WAL")
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            _ensure_table(conn, table, df, key_columns)
+            existing = _count_existing(conn, table, key_columns, [columns.index(k) for k in key_columns], rows)
+            conn.executemany(sql, rows)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        if previous_mode.lower() != "wal":
+            conn.execute(f"PRAGMA journal_mode={previous_mode}")
+    finally:
+        conn.close()
+
+    return UpsertResult(inserted=len(rows) - existing, updated=existing)
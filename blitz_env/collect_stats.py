@@ -20,6 +20,7 @@ from sqlalchemy import create_engine
 # --- Adjust these imports to your project structure if needed ---
 from blitz_env.projections_db import load_nfl_projections_all_positions
 from blitz_env.stats_db import fp_seasonal_years
+from blitz_env.reference_schema import write_table
 
 
 def ensure_year_column(df: pd.DataFrame, year: int) -> pd.DataFrame:
@@ -90,27 +91,39 @@ def collect_weekly_projections(years: List[int], weeks: List[str]) -> pd.DataFra
     Uses fp_projections for each position, then aligns schemas across positions.
     Fails silently for individual weeks and returns whatever data was successfully collected.
     """
+    from blitz_env.fetch import map_concurrent
     from blitz_env.projections_db import fp_projections
-    
+
+    positions = ("rb", "qb", "wr", "te", "k", "dst")
+
+    def one(job):
+        year, week, pos = job
+        df = fp_projections(page=pos, sport='nfl', year=year, week=week, scoring='PPR')
+        df = ensure_year_column(df, year)
+        df['week'] = week
+        df['position'] = df['position'].str.upper()
+        return df
+
+    # Fetch every (year, week, position) page concurrently over the shared session;
+    # assemble per week in the original order.
+    jobs = [(year, week, pos) for year in years for week in weeks for pos in positions]
+    results = dict(zip(jobs, map_concurrent(one, jobs, return_exceptions=True)))
+
     all_parts: List[pd.DataFrame] = []
-    
+
     for year in years:
         for week in weeks:
             print(f"Collecting weekly projections for year {year}, week {week}...")
-            
+
             try:
                 week_parts: List[pd.DataFrame] = []
-                for pos in ("rb", "qb", "wr", "te", "k", "dst"):
-                    try:
-                        df = fp_projections(page=pos, sport='nfl', year=year, week=week, scoring='PPR')
-                        df = ensure_year_column(df, year)
-                        df['week'] = week
-                        df['position'] = df['position'].str.upper()
-                        week_parts.append(df)
-                    except Exception as e:
-                        print(f"Warning: Failed to get projections for {pos} in year {year}, week {week}: {e}")
+                for pos in positions:
+                    df = results[(year, week, pos)]
+                    if isinstance(df, Exception):
+                        print(f"Warning: Failed to get projections for {pos} in year {year}, week {week}: {df}")
                         continue
-                
+                    week_parts.append(df)
+
                 if week_parts:
                     week_df = union_align(week_parts)
                     week_df.sort_values(by="FPTS", ascending=False, inplace=True)
@@ -118,11 +131,11 @@ def collect_weekly_projections(years: List[int], weeks: List[str]) -> pd.DataFra
                     print(f"Successfully collected projections for year {year}, week {week}")
                 else:
                     print(f"No projections collected for year {year}, week {week}")
-                    
+
             except Exception as e:
                 print(f"Warning: Failed to collect projections for year {year}, week {week}: {e}")
                 continue
-    
+
     return union_align(all_parts) if all_parts else pd.DataFrame()
 
 
@@ -274,18 +287,19 @@ def main(argv=None):
     if args.include_injuries:
         weekly_injuries_df = collect_weekly_injuries(years, weeks)
 
-    # 5) Write tables (replace ensures schema exactly matches the DataFrames)
-    pre_df.to_sql("preseason_projections", con=engine, if_exists="replace", index=False)
-    season_df.to_sql("season_stats", con=engine, if_exists="replace", index=False)
+    # 5) Write tables with the typed reference schema (INTEGER year/season/week,
+    #    REAL stats, TEXT labels; see blitz_env.reference_schema)
+    write_table(pre_df, "preseason_projections", engine)
+    write_table(season_df, "season_stats", engine)
 
     if not weekly_df.empty:
-        weekly_df.to_sql("weekly_projections", con=engine, if_exists="replace", index=False)
+        write_table(weekly_df, "weekly_projections", engine)
 
     if not weekly_stats_df.empty:
-        weekly_stats_df.to_sql("weekly_stats", con=engine, if_exists="replace", index=False)
+        write_table(weekly_stats_df, "weekly_stats", engine)
 
     if not weekly_injuries_df.empty:
-        weekly_injuries_df.to_sql("weekly_injuries", con=engine, if_exists="replace", index=False)
+        write_table(weekly_injuries_df, "weekly_injuries", engine)
 
     print(f"[preseason_projections] rows={len(pre_df)}")
     print(f"[season_stats] rows={len(season_df)}")
@@ -9,11 +9,9 @@ Usage:
 import argparse
 from pathlib import Path
 import pandas as pd
-from sqlalchemy import create_engine, inspect, MetaData, Table, text
-from sqlalchemy.dialects.sqlite import insert
-import os
 
 from blitz_env.download_injuries import NFLInjuryScraper
+from blitz_env.bulk_upsert import upsert_dataframe
 
 
 def get_injuries_for_week(year: int, week: int) -> pd.DataFrame:
@@ -55,40 +53,9 @@ def main():
     if 'week' in df.columns:
         df['week'] = df['week'].str.replace('Week ', '', regex=False).astype(int)
 
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    engine = create_engine(f"sqlite:///{db_path}")
-    table_name = "weekly_injuries"
+    result = upsert_dataframe(str(db_path), "weekly_injuries", df, ["year", "week", "player_name", "position"])
 
-    # Check if table exists
-    insp = inspect(engine)
-    if insp.has_table(table_name):
-        # Table exists → upsert
-        with engine.begin() as conn:
-            conn.execute(text(f"""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_{table_name}_unique
-                ON {table_name}(year, week, player_name, position)
-            """))
-
-        records = df.to_dict(orient="records")
-
-        metadata = MetaData()
-        injuries_table = Table(table_name, metadata, autoload_with=engine)
-        stmt = insert(injuries_table).values(records)
-
-        # Upsert: update if exists, insert if not
-        upsert_stmt = stmt.on_conflict_do_update(
-            index_elements=["year", "week", "player_name", "position"],
-            set_={c.key: c for c in stmt.excluded if c.key not in ["year", "week", "player_name", "position"]}
-        )
-
-        with engine.begin() as conn:
-            conn.execute(upsert_stmt)
-
-    else:
-        # Table does not exist → create it
-        df.to_sql(table_name, con=engine, if_exists="replace", index=False)
-
-    print(f"[weekly_injuries] rows={len(df)}")
+    print(f"[weekly_injuries] rows={len(df)} inserted={result.inserted} updated={result.updated}")
     print("Done.")
 
 
@@ -9,30 +9,32 @@ Usage:
 import argparse
 from pathlib import Path
 import pandas as pd
-from sqlalchemy import create_engine, inspect, MetaData, Table, text
-from sqlalchemy.dialects.sqlite import insert
-import os
 
+from blitz_env.fetch import map_concurrent
 from blitz_env.projections_db import fp_projections
+from blitz_env.bulk_upsert import upsert_dataframe
 
 
 def get_projections_for_week(year: int, week: int) -> pd.DataFrame:
     """Fetch weekly projections for a specific week"""
     week_str = str(week)
 
-    all_positions = []
+    def one(pos):
+        df = fp_projections(page=pos, sport='nfl', year=year, week=week_str, scoring='PPR')
+        if 'year' not in df.columns:
+            df['year'] = year
+        df['week'] = week
+        df['position'] = df['position'].str.upper()
+        return df
 
-    for pos in ("rb", "qb", "wr", "te", "k", "dst"):
-        try:
-            df = fp_projections(page=pos, sport='nfl', year=year, week=week_str, scoring='PPR')
-            if 'year' not in df.columns:
-                df['year'] = year
-            df['week'] = week
-            df['position'] = df['position'].str.upper()
-            all_positions.append(df)
-        except Exception as e:
-            print(f"Warning: Failed to get projections for {pos}: {e}")
+    # The six position pages are fetched concurrently over the shared session
+    positions = ("rb", "qb", "wr", "te", "k", "dst")
+    all_positions = []
+    for pos, df in zip(positions, map_concurrent(one, positions, return_exceptions=True)):
+        if isinstance(df, Exception):
+            print(f"Warning: Failed to get projections for {pos}: {df}")
             continue
+        all_positions.append(df)
 
     if not all_positions:
         return pd.DataFrame()
@@ -66,40 +68,9 @@ def main():
         print("No projection data collected - skipping database update")
         return
 
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    engine = create_engine(f"sqlite:///{db_path}")
-    table_name = "weekly_projections"
-
-    # Check if table exists
-    insp = inspect(engine)
-    if insp.has_table(table_name):
-        # Table exists → upsert
-        with engine.begin() as conn:
-            conn.execute(text(f"""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_{table_name}_unique
-                ON {table_name}(year, week, fantasypros_id, position)
-            """))
-
-        records = df.to_dict(orient="records")
-
-        metadata = MetaData()
-        projections_table = Table(table_name, metadata, autoload_with=engine)
-        stmt = insert(projections_table).values(records)
-
-        # Upsert: update if exists, insert if not
-        upsert_stmt = stmt.on_conflict_do_update(
-            index_elements=["year", "week", "fantasypros_id", "position"],
-            set_={c.key: c for c in stmt.excluded if c.key not in ["year", "week", "fantasypros_id", "position"]}
-        )
-
-        with engine.begin() as conn:
-            conn.execute(upsert_stmt)
-
-    else:
-        # Table does not exist → create it
-        df.to_sql(table_name, con=engine, if_exists="replace", index=False)
+    result = upsert_dataframe(str(db_path), "weekly_projections", df, ["year", "week", "fantasypros_id", "position"])
 
-    print(f"[weekly_projections] rows={len(df)}")
+    print(f"[weekly_projections] rows={len(df)} inserted={result.inserted} updated={result.updated}")
     print("Done.")
 
 
@@ -14,12 +14,10 @@ import argparse
 from pathlib import Path
 from typing import List
 import pandas as pd
-from sqlalchemy import create_engine, inspect, MetaData, Table, text
-from sqlalchemy.dialects.sqlite import insert
-import os
 
 # --- Adjust these imports to your project structure if needed ---
 from blitz_env.download_stats import get_stats_for_week
+from blitz_env.bulk_upsert import upsert_dataframe
 
 def parse_args() -> argparse.Namespace:
     ap = argparse.ArgumentParser(description="Add weekly data to stats.db for year and week")
@@ -39,41 +37,9 @@ def main():
 
     df = get_stats_for_week(year=year, week=week)
 
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)  # create directory if missing
-    engine = create_engine(f"sqlite:///{db_path}")
-    table_name = "weekly_stats"
+    result = upsert_dataframe(str(db_path), "weekly_stats", df, ["year", "week", "fantasypros_id", "position"])
 
-    # Check if table exists
-    insp = inspect(engine)
-    if insp.has_table(table_name):
-        # Table exists → append
-        # df.to_sql(table_name, con=engine, if_exists="append", index=False)
-
-        with engine.begin() as conn:
-            conn.execute(text(f"""
-                CREATE UNIQUE INDEX IF NOT EXISTS idx_{table_name}_unique
-                ON {table_name}(year, week, fantasypros_id, position)
-            """))
-
-        records = df.to_dict(orient="records")
-
-        metadata = MetaData()
-        weekly_table = Table(table_name, metadata, autoload_with=engine)
-        stmt = insert(weekly_table).values(records)
-
-        upsert_stmt = stmt.on_conflict_do_update(
-            index_elements=["year", "week", "fantasypros_id", "position"],
-            set_={c.key: c for c in stmt.excluded if c.key not in ["year", "week", "fantasypros_id", "position"]}
-        )
-
-        with engine.begin() as conn:
-            conn.execute(upsert_stmt)
-
-    else:
-        # Table does not exist → create it
-        df.to_sql(table_name, con=engine, if_exists="replace", index=False)
-
-    print(f"[weekly_stats] rows={len(df)}")
+    print(f"[weekly_stats] rows={len(df)} inserted={result.inserted} updated={result.updated}")
     print("Done.")
 
 
@@ -0,0 +1,246 @@
+"""Columnar (Arrow IPC) sidecar of season.db's reference tables.
+
+Reading a whole reference table through SQLite costs a Python object per cell
+(row decoding, then pandas building object columns). The sidecar stores each
+table as uncompressed Arrow IPC files next to season.db, partitioned
+Hive-style by ``season`` (and ``week`` for weekly tables)::
+
+    data/game_states/2025/season.arrow/
+        _manifest.json
+        season_stats/season=2024.arrow
+        weekly_stats/season=2025/week=3.arrow
+        ...
+
+``open_table`` memory-maps the matching files, so the returned ``pyarrow.Table``
+is zero-copy and only the pages a bot actually touches are read from disk.
+``read_frame`` converts to pandas with INTEGER columns as Int64 (so
+``season``/``week`` match the DatabaseManager accessors)::
+
+    from blitz_env import columnar
+    hist = columnar.read_frame("season_stats")                  # full history
+    wk = columnar.read_frame("weekly_stats", seasons=[2025], weeks=[3])
+
+The sidecar is written by ``bootstrap_data build-season --columnar`` (or
+``bootstrap_data export-columnar``), and re-exported after the reference tables
+change. ``bootstrap_data refresh`` rewrites only the refreshed week's partitions
+(``refresh``). pyarrow is an optional dependency, imported lazily.
+"""
+
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+
+import pandas as pd
+
+from blitz_env.reference_schema import KEY_COLUMNS
+
+TABLES = (
+    "season_stats",
+    "preseason_projections",
+    "weekly_stats",
+    "weekly_projections",
+    "weekly_injuries",
+)
+
+MANIFEST = "_manifest.json"
+_NULL = "null"
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError as e:
+        raise ImportError("The columnar sidecar needs pyarrow (pip install pyarrow)") from e
+    return pa
+
+
+def sidecar_path(season_path: str) -> str:
+    """``.../season.db`` -> ``.../season.arrow``."""
+    return os.path.splitext(season_path)[0] + ".arrow"
+
+
+def _default_path() -> str:
+    from blitz_env.models import DatabaseManager
+    return sidecar_path(DatabaseManager.resolve_url()[len("sqlite:///"):])
+
+
+def _partition_keys(table: str) -> tuple:
+    return ("season", "week") if table.startswith("weekly_") else ("season",)
+
+
+def _arrow_schema(pa, conn, table: str):
+    fields = []
+    for _, name, decl, *_ in conn.execute(f"SELECT * FROM pragma_table_info('{table}')"):
+        decl = (decl or "").upper()
+        if "INT" in decl:
+            kind = pa.int64()
+        elif any(t in decl for t in ("REAL", "FLOA", "DOUB")):
+            kind = pa.float64()
+        else:
+            kind = pa.string()
+        fields.append(pa.field(name, kind))
+    return pa.schema(fields)
+
+
+def _label(value) -> str:
+    return _NULL if pd.isna(value) else str(int(value))
+
+
+def _write_partition(pa, schema, part: pd.DataFrame, path: str):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    batch = pa.Table.from_pandas(part, schema=schema, preserve_index=False)
+    # write-then-rename: a reader that already mapped the old file keeps it
+    with pa.OSFile(path + ".tmp", "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        writer.write_table(batch)
+    os.replace(path + ".tmp", path)
+
+
+def _write_table(pa, conn, table: str, out_dir: str) -> int:
+    schema = _arrow_schema(pa, conn, table)
+    keys = [k for k in _partition_keys(table) if k in schema.names]
+    dtype = {k: "Int64" for k in KEY_COLUMNS if k in schema.names}
+    df = pd.read_sql(f'SELECT * FROM "{table}"', conn, dtype=dtype)
+    if df.empty or not keys:
+        groups = [((), df)]
+    else:
+        groups = df.groupby(keys, dropna=False, sort=True)
+    for values, part in groups:
+        values = values if isinstance(values, tuple) else (values,)
+        labels = [f"{k}={_label(v)}" for k, v in zip(keys, values)]
+        _write_partition(pa, schema, part, os.path.join(out_dir, table, *(labels or ["all"])) + ".arrow")
+    return len(df)
+
+
+def export(season_path: str, out_path: str = None) -> str:
+    """Write the sidecar for ``season_path`` (replacing any previous one); returns its path."""
+    pa = _pyarrow()
+    out_path = out_path or sidecar_path(season_path)
+    parent = os.path.dirname(os.path.abspath(out_path))
+    staging = tempfile.mkdtemp(prefix=".season-arrow-", dir=parent)
+    try:
+        conn = sqlite3.connect(f"file:{os.path.abspath(season_path)}?mode=ro", uri=True)
+        try:
+            present = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+            rows = {t: _write_table(pa, conn, t, staging) for t in TABLES if t in present}
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+        finally:
+            conn.close()
+        _write_manifest(staging, version, rows)
+        if os.path.isdir(out_path):
+            shutil.rmtree(out_path)
+        os.replace(staging, out_path)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return out_path
+
+
+def _write_manifest(out_dir: str, version: int, rows: dict):
+    path = os.path.join(out_dir, MANIFEST)
+    with open(path + ".tmp", "w") as f:
+        json.dump({"schema_version": version, "tables": rows}, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def refresh(season_path: str, season: int, week: int, tables=None, out_path: str = None) -> dict:
+    """Rewrite only the ``season=S/week=W`` partition of each weekly table (after
+    ``bootstrap_data refresh``) and update the manifest. A table whose columns
+    changed is re-exported whole, since every partition must share one schema.
+    Returns ``{table: rows in the partition}``."""
+    pa = _pyarrow()
+    out_path = out_path or sidecar_path(season_path)
+    rows = manifest(out_path)["tables"]
+    tables = [t for t in (tables or TABLES) if t.startswith("weekly_")]
+    written = {}
+    conn = sqlite3.connect(f"file:{os.path.abspath(season_path)}?mode=ro", uri=True)
+    try:
+        present = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        for table in tables:
+            if table not in present:
+                continue
+            schema = _arrow_schema(pa, conn, table)
+            base = os.path.join(out_path, table)
+            existing = _files(out_path, table) if os.path.isdir(base) else []
+            if not existing or not pa.ipc.open_file(pa.memory_map(existing[0], "r")).schema.equals(schema):
+                staging = tempfile.mkdtemp(prefix=".season-arrow-", dir=out_path)
+                try:
+                    rows[table] = _write_table(pa, conn, table, staging)
+                    shutil.rmtree(base, ignore_errors=True)
+                    os.replace(os.path.join(staging, table), base)
+                finally:
+                    shutil.rmtree(staging, ignore_errors=True)
+                written[table] = int(conn.execute(f'SELECT COUNT(*) FROM "{table}" WHERE season = ? AND week = ?',
+                                                  (season, week)).fetchone()[0])
+                continue
+            path = os.path.join(base, f"season={int(season)}", f"week={int(week)}.arrow")
+            before = pa.ipc.open_file(pa.memory_map(path, "r")).read_all().num_rows if os.path.isfile(path) else 0
+            dtype = {k: "Int64" for k in KEY_COLUMNS if k in schema.names}
+            part = pd.read_sql(f'SELECT * FROM "{table}" WHERE season = ? AND week = ?', conn,
+                               params=(season, week), dtype=dtype)
+            if part.empty:
+                if os.path.isfile(path):
+                    os.remove(path)
+            else:
+                _write_partition(pa, schema, part, path)
+            rows[table] = rows.get(table, 0) - before + len(part)
+            written[table] = len(part)
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+    finally:
+        conn.close()
+    _write_manifest(out_path, version, rows)
+    return written
+
+
+def manifest(path: str = None) -> dict:
+    with open(os.path.join(path or _default_path(), MANIFEST)) as f:
+        return json.load(f)
+
+
+def _matches(label: str, wanted) -> bool:
+    if wanted is None:
+        return True
+    value = label.split("=", 1)[1]
+    return value != _NULL and int(value) in wanted
+
+
+def _files(root: str, table: str, seasons=None, weeks=None):
+    base = os.path.join(root, table)
+    if not os.path.isdir(base):
+        raise FileNotFoundError(f"No '{table}' in columnar sidecar {root}")
+    seasons = None if seasons is None else {int(s) for s in seasons}
+    weeks = None if weeks is None else {int(w) for w in weeks}
+    files = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("season=") or _matches(d, seasons))
+        for name in sorted(filenames):
+            if not name.endswith(".arrow"):
+                continue
+            label = name[:-len(".arrow")]
+            if label.startswith("season=") and not _matches(label, seasons):
+                continue
+            if label.startswith("week=") and not _matches(label, weeks):
+                continue
+            files.append(os.path.join(dirpath, name))
+    return files
+
+
+def open_table(table: str, seasons=None, weeks=None, path: str = None):
+    """Memory-mapped ``pyarrow.Table`` of ``table`` (optionally only some seasons/weeks)."""
+    pa = _pyarrow()
+    root = path or _default_path()
+    # The tables' buffers point into the maps, which stay open while referenced
+    parts = [pa.ipc.open_file(pa.memory_map(f, "r")).read_all()
+             for f in _files(root, table, seasons, weeks)]
+    if not parts:
+        schema = pa.ipc.open_file(pa.memory_map(_files(root, table)[0], "r")).schema
+        return schema.empty_table()
+    return parts[0] if len(parts) == 1 else pa.concat_tables(parts)
+
+
+def read_frame(table: str, seasons=None, weeks=None, path: str = None) -> pd.DataFrame:
+    """``open_table`` as a DataFrame; INTEGER columns (``season``, ``week``, ...) are Int64."""
+    pa = _pyarrow()
+    return open_table(table, seasons, weeks, path).to_pandas(types_mapper={pa.int64(): pd.Int64Dtype()}.get)
@@ -1,30 +1,29 @@
-import requests
 from bs4 import BeautifulSoup
 import pandas as pd
 import re
 from datetime import datetime
 
+from blitz_env.fetch import fetch
+from blitz_env.player_ids import get_resolver
+
 class NFLInjuryScraper:
     def __init__(self, year=2025, week=6):
         self.year = year
         self.week = week
         self.base_url = f"https://www.nfl.com/injuries/league/{year}/reg{week}"
-        self.playerids_url = "https://raw.githubusercontent.com/dynastyprocess/data/master/files/db_playerids.csv"
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         }
         self.player_ids_df = None
     
     def load_player_ids(self):
-        """Load player IDs from dynastyprocess"""
-        print("Loading player ID mappings...")
-        self.player_ids_df = pd.read_csv(self.playerids_url)
-        print(f"Loaded {len(self.player_ids_df)} player ID records")
+        """The player ID crosswalk (loaded and indexed once per process; see blitz_env.player_ids)"""
+        self.player_ids_df = get_resolver().table
         return self.player_ids_df
     
     def fetch_page(self):
-        """Fetch the injury report page"""
-        response = requests.get(self.base_url, headers=self.headers)
+        """Fetch the injury report page (through the shared session and raw-response cache)"""
+        response = fetch(self.base_url, headers=self.headers, season=self.year, week=self.week)
         response.raise_for_status()
         return response.text
     
@@ -162,104 +161,25 @@ class NFLInjuryScraper:
         return injury_data
     
     def match_player_ids(self, injury_df):
-        """Match injury data with FantasyPros IDs using name and position only"""
-        if self.player_ids_df is None:
-            self.load_player_ids()
-
-        from rapidfuzz import process, fuzz
-
-        # Normalize names and positions for matching
-        injury_df['name_normalized'] = injury_df['player_name'].str.lower().str.strip()
-        injury_df['position_normalized'] = injury_df['position'].str.upper().str.strip()
-
-        # Prepare player IDs dataset - check which columns are available
-        available_cols = list(self.player_ids_df.columns)
-
-        # Try common column name variations
-        pos_col = None
-        for possible_name in ['pos', 'position', 'Position', 'POS']:
-            if possible_name in available_cols:
-                pos_col = possible_name
-                break
+        """Match injury data with FantasyPros IDs using name and position (team breaks ties)"""
+        resolver = get_resolver()
+        merged = resolver.resolve(injury_df)
+        match = resolver.last_match
+        if match.fuzzy:
+            print(f"Fuzzy matched {match.fuzzy} additional players")
 
-        if pos_col is None:
-            raise ValueError(f"Could not find position column in player IDs data. Available columns: {available_cols}")
-
-        player_ids_subset = self.player_ids_df[['name', pos_col, 'fantasypros_id', 'gsis_id', 'sleeper_id']].copy()
-        player_ids_subset['name_normalized'] = player_ids_subset['name'].str.lower().str.strip()
-        player_ids_subset['position_normalized'] = player_ids_subset[pos_col].str.upper().str.strip()
-        
-        # First pass: exact match on name AND position
-        merged = injury_df.merge(
-            player_ids_subset[['name_normalized', 'position_normalized', 'fantasypros_id', 'gsis_id', 'sleeper_id']],
-            on=['name_normalized', 'position_normalized'],
-            how='left'
-        )
-        
-        # Second pass: fuzzy match for unmatched players using name + position
-        unmatched_mask = merged['fantasypros_id'].isna()
-        unmatched_count = unmatched_mask.sum()
-        
-        if unmatched_count > 0:
-            print(f"\nAttempting fuzzy matching for {unmatched_count} unmatched players...")
-            
-            # Create combined name+position strings for better matching
-            player_ids_subset['name_pos'] = (
-                player_ids_subset['name_normalized'] + ' | ' + 
-                player_ids_subset['position_normalized']
-            )
-            all_player_combos = player_ids_subset['name_pos'].tolist()
-            
-            fuzzy_matched = 0
-            for idx in merged[unmatched_mask].index:
-                player_name = merged.loc[idx, 'name_normalized']
-                player_pos = merged.loc[idx, 'position_normalized']
-                search_string = f"{player_name} | {player_pos}"
-                
-                # Find best match using rapidfuzz
-                match_result = process.extractOne(
-                    search_string,
-                    all_player_combos,
-                    scorer=fuzz.ratio,
-                    score_cutoff=80  # Only accept matches with 80%+ similarity
-                )
-                
-                if match_result:
-                    best_match_combo, score, _ = match_result
-                    
-                    # Get the player IDs for the matched name+position
-                    matched_row = player_ids_subset[
-                        player_ids_subset['name_pos'] == best_match_combo
-                    ].iloc[0]
-                    
-                    # Update the merged dataframe
-                    merged.loc[idx, 'fantasypros_id'] = matched_row['fantasypros_id']
-                    merged.loc[idx, 'gsis_id'] = matched_row['gsis_id']
-                    merged.loc[idx, 'sleeper_id'] = matched_row['sleeper_id']
-                    
-                    fuzzy_matched += 1
-                    matched_name = matched_row['name_normalized']
-                    matched_pos = matched_row['position_normalized']
-                    print(f"  Fuzzy matched: '{player_name} ({player_pos})' -> '{matched_name} ({matched_pos})' (score: {score})")
-            
-            print(f"Fuzzy matched {fuzzy_matched} additional players")
-        
-        # Drop the normalized columns
-        merged = merged.drop(['name_normalized', 'position_normalized'], axis=1)
-        
         # Report matching stats
-        matched_count = merged['fantasypros_id'].notna().sum()
+        matched_count = match.exact + match.fuzzy
         total_count = len(merged)
         print(f"\nFinal Player ID Matching Stats:")
-        print(f"  Matched: {matched_count}/{total_count} ({matched_count/total_count*100:.1f}%)")
-        print(f"  Unmatched: {total_count - matched_count}")
-        
-        if total_count - matched_count > 0:
-            print("\nUnmatched players:")
+        print(f"  Matched: {matched_count}/{total_count} ({matched_count/max(total_count, 1)*100:.1f}%)")
+        print(f"  Unmatched: {match.unmatched}")
+
+        if match.unmatched:
             unmatched = merged[merged['fantasypros_id'].isna()][['player_name', 'position', 'team']].drop_duplicates()
-            for _, row in unmatched.iterrows():
-                print(f"  - {row['player_name']} ({row['position']}, {row['team']})")
-        
+            lines = "  - " + unmatched['player_name'] + " (" + unmatched['position'] + ", " + unmatched['team'] + ")"
+            print("\nUnmatched players:\n" + "\n".join(lines.fillna("  - ?")))
+
         return merged
     
     def scrape(self):
@@ -0,0 +1,125 @@
+"""Shared HTTP layer for the offline scrapers (FantasyPros stats/projections).
+
+Every page request goes through one pooled keep-alive ``requests.Session`` with
+retry/backoff on connection errors, 429 and 5xx. ``map_concurrent`` fans a list of
+page jobs out over a thread pool; however the jobs are nested, at most
+``max_concurrency()`` requests are in flight, so a multi-year scrape is bounded by
+the politeness limit rather than by serial round-trip latency.
+
+Tunables (environment):
+
+* ``BOTBLITZ_FETCH_CONCURRENCY``: concurrent requests (default 4)
+* ``BOTBLITZ_FETCH_RETRIES``: retries per request (default 4)
+* ``BOTBLITZ_FETCH_BACKOFF``: backoff factor in seconds (default 0.5)
+* ``BOTBLITZ_FANTASYPROS_URL``: FantasyPros base URL, e.g. a local stand-in server
+  in tests (default https://www.fantasypros.com)
+
+Fetched pages are kept in the on-disk raw-response cache (blitz_env.http_cache).
+
+``requests`` is imported lazily so ``import blitz_env`` stays lean in the container.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List
+
+from blitz_env import http_cache
+
+DEFAULT_TIMEOUT = 30
+
+_session = None
+_session_lock = threading.Lock()
+_slots = None
+
+
+def max_concurrency() -> int:
+    return max(1, int(os.getenv("BOTBLITZ_FETCH_CONCURRENCY", "4")))
+
+
+def fantasypros_url(path: str) -> str:
+    base = os.getenv("BOTBLITZ_FANTASYPROS_URL", "https://www.fantasypros.com")
+    return f"{base.rstrip('/')}/{path.lstrip('/')}"
+
+
+def get_session():
+    """The process-wide pooled session (created on first use)."""
+    global _session, _slots
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                limit = max_concurrency()
+                retry = Retry(
+                    total=int(os.getenv("BOTBLITZ_FETCH_RETRIES", "4")),
+                    backoff_factor=float(os.getenv("BOTBLITZ_FETCH_BACKOFF", "0.5")),
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET",),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=limit, pool_maxsize=limit, max_retries=retry)
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                _slots = threading.BoundedSemaphore(limit)
+                _session = session
+    return _session
+
+
+def reset_session():
+    """Drop the shared session (e.g. after changing the tunables)."""
+    global _session, _slots
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+        _session, _slots = None, None
+
+
+def fetch(url: str, params=None, headers=None, timeout: float = DEFAULT_TIMEOUT,
+          season=None, week=None, cache: bool = True):
+    """GET ``url`` over the shared session, holding one of the concurrency slots.
+
+    Responses go through the raw-response cache (blitz_env.http_cache): a fresh
+    cached copy is returned without touching the network, and ``season``/``week``
+    (what the page belongs to) decide how long a copy stays fresh.
+    """
+    if cache:
+        cached = http_cache.load(url, params, ttl=http_cache.season_ttl(season, week))
+        if cached is not None:
+            return cached
+    session = get_session()
+    with _slots:
+        response = session.get(url, params=params, headers=headers, timeout=timeout)
+    if cache:
+        http_cache.store(url, params, response)
+    return response
+
+
+def map_concurrent(fn: Callable, items: Iterable, max_workers: int = None,
+                   return_exceptions: bool = False) -> List:
+    """``[fn(item) for item in items]`` over a thread pool, results in input order.
+
+    With ``return_exceptions`` a failing item yields its exception instead of
+    aborting the whole batch.
+    """
+    items = list(items)
+    if not items:
+        return []
+
+    def call(item):
+        try:
+            return fn(item)
+        except Exception as e:
+            if return_exceptions:
+                return e
+            raise
+
+    workers = min(max_workers or max_concurrency(), len(items))
+    if workers == 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(call, items))
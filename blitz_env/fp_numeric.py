@@ -0,0 +1,95 @@
+"""Vectorized numeric coercion for parsed FantasyPros tables.
+
+The parsers produce string cells ("2,005", "99.8%", ""). ``coerce_numeric`` cleans
+every stat cell in one pass over the whole block: it drops thousands separators,
+strips a trailing ``%`` and parses to float. ``ROST`` columns are then scaled from
+percent to a 0-1 fraction. Each column gets a compact dtype fixed by its header
+(``stat_dtype``), never by the values on the page, so the same column has the same
+dtype on every page and week and frames concatenate without upcasting. Counts on
+stats pages (``COUNT_STATS``: attempts, yards, TDs, ...) are nullable ``Int16``;
+everything else is ``float32``. A count column whose page holds a fraction or an
+out-of-range value falls back to float64 for that page, with a warning.
+
+float32 can't hold most decimals exactly (322.3 is 322.29998...), so
+``widen_floats`` converts float32 columns back to float64 through their shortest
+repr before a frame is written to SQLite. That way stored values stay exactly
+what the page showed.
+"""
+
+import numpy as np
+import pandas as pd
+
+FLOAT = "float32"
+COUNT = "Int16"
+
+# Stats-page columns that are whole-number counts, by the last part of the header
+# ("RUSHING_ATT" -> "ATT", "DEF_TD" -> "TD"). Every other stat column, and every
+# projection column (projected counts are fractional), is FLOAT.
+COUNT_STATS = frozenset((
+    "ATT", "CMP", "YDS", "TD", "INT", "REC", "TGT", "LG", "20+", "FL", "G", "SACKS",
+    "SACK", "FR", "FF", "SFTY", "FG", "FGA", "XPT", "XPA",
+    "1-19", "20-29", "30-39", "40-49", "50+",
+))
+
+
+def stat_dtype(column, counts: bool = False) -> str:
+    """Fixed dtype of a stat column: the same for every page, week and season."""
+    if counts and str(column).rsplit("_", 1)[-1] in COUNT_STATS:
+        return COUNT
+    return FLOAT
+
+
+def _as_count(column, values: np.ndarray):
+    missing = np.isnan(values)
+    present = values[~missing]
+    info = np.iinfo(np.int16)
+    if present.size and not (np.array_equal(present, np.round(present))
+                             and info.min <= present.min() and present.max() <= info.max):
+        # one odd page (e.g. a half-point stat correction) must not abort a whole scrape
+        print(f"Warning: stat column {column!r} is typed {COUNT} but the page has non-integer "
+              f"or out-of-range values; keeping it as float64 (see fp_numeric.COUNT_STATS)")
+        return values
+    return pd.arrays.IntegerArray(np.where(missing, 0, values).astype(np.int16), missing)
+
+
+def coerce_numeric(df: pd.DataFrame, exclude, counts: bool = False) -> pd.DataFrame:
+    """Convert every column not in ``exclude`` from page text to its ``stat_dtype``.
+
+    ``counts`` (stats pages) types the whole-number ``COUNT_STATS`` columns as
+    Int16; without it every column is float32.
+    """
+    exclude = set(exclude)
+    positions = [i for i, c in enumerate(df.columns) if c not in exclude]
+    if not positions:
+        return df
+    block = df.iloc[:, positions].to_numpy(dtype=object)
+    cells = pd.Series(block.ravel(order="F"), dtype=object).astype(str)
+    cleaned = cells.str.replace(",", "", regex=False).str.rstrip("%")
+    values = (pd.to_numeric(cleaned, errors="coerce")
+              .to_numpy(dtype=np.float64, na_value=np.nan)
+              .reshape((len(df), len(positions)), order="F"))
+
+    out = df.copy()
+    for j, i in enumerate(positions):
+        name, column = df.columns[i], values[:, j]
+        if "ROST" in str(name).upper():
+            column = column / 100.0
+        if stat_dtype(name, counts) == COUNT:
+            out.isetitem(i, _as_count(name, column))
+        else:
+            out.isetitem(i, column.astype(np.float32))
+    return out
+
+
+def widen_floats(df: pd.DataFrame) -> pd.DataFrame:
+    """float32 columns -> float64 holding the same decimal the page showed."""
+    positions = [i for i, dtype in enumerate(df.dtypes)
+                 if dtype == np.float32 or isinstance(dtype, pd.Float32Dtype)]
+    if not positions:
+        return df
+    out = df.copy()
+    for i in positions:
+        as_f32 = df.iloc[:, i].to_numpy(dtype=np.float32, na_value=np.nan)
+        # numpy formats float32 with its shortest round-tripping repr ("322.3")
+        out.isetitem(i, as_f32.astype(str).astype(np.float64))
+    return out
@@ -0,0 +1,153 @@
+"""Fast lxml reader for the FantasyPros ``#data`` stats/projections table.
+
+The BeautifulSoup parsers in stats_db / projections_db build a Python object per
+tag and walk every ``<td>`` with ``get_text``. These readers parse with libxml2 and
+pull the table straight into per-column lists, one XPath per cell, so the
+DataFrame is built column-wise. The output (column names, values as the same
+strings ``get_text(strip=True)`` yields) matches the BeautifulSoup parsers exactly;
+they remain the fallback when lxml is missing or a page doesn't fit this shape.
+tests/test_fp_table.py checks parity over the saved fixture pages.
+"""
+
+import re
+
+import pandas as pd
+
+_FP_ID = re.compile(r"fp-id-(\d+)")
+_TEXT = ".//text()[not(parent::script) and not(parent::style)]"
+_PLAYER_LINK = "contains(concat(' ', normalize-space(@class), ' '), ' fp-player-link ')"
+
+
+def _text(el) -> str:
+    # Same as BeautifulSoup's get_text(strip=True): strip each text node, no separator
+    return "".join(t.strip() for t in el.xpath(_TEXT))
+
+
+def _data_table(content):
+    import lxml.html
+
+    doc = lxml.html.fromstring(content)
+    tables = doc.xpath("//*[@id='data']")
+    if not tables:
+        raise ValueError("No #data table on page")
+    return tables[0]
+
+
+def _colspan_labels(cells, text=_text):
+    labels = []
+    for cell in cells:
+        labels.extend([text(cell)] * int(cell.get("colspan", 1)))
+    return labels
+
+
+def _player(link):
+    """(fantasypros_id, player_name) from an ``fp-player-link`` element."""
+    m = _FP_ID.search(link.get("class", ""))
+    fp_id = m.group(1) if m else link.get("fp-player-id")
+    return fp_id, link.get("fp-player-name")
+
+
+def _frame(columns, values) -> pd.DataFrame:
+    if len(set(columns)) == len(columns):
+        return pd.DataFrame(dict(zip(columns, values)), columns=columns)
+    # Duplicate header names: build positionally
+    df = pd.DataFrame({i: v for i, v in enumerate(values)})
+    df.columns = columns
+    return df
+
+
+def stats_frame(content, page, params) -> pd.DataFrame:
+    """The raw (string-valued) table of a ``/nfl/stats/{page}.php`` page."""
+    table = _data_table(content)
+
+    def header_text(cell):
+        small = cell.xpath(".//small")
+        return _text(small[0] if small else cell)
+
+    column_names = []
+    thead = table.xpath(".//thead")[0]
+    for row in thead.xpath(".//tr"):
+        row_headers = _colspan_labels(row.xpath(".//*[self::th or self::td]"), header_text)
+        if not column_names:
+            column_names = row_headers
+        else:
+            column_names = [f"{prev}_{curr}" if prev and prev != "MISC" else curr
+                            for prev, curr in zip(column_names, row_headers)]
+    column_names = [name.strip().replace(" ", "_") for name in column_names]
+    stats_columns = column_names[:1] + column_names[2:]
+    columns = ["year", "week", "fantasypros_id", "player_name", "position", "team", "pos_rank"] + stats_columns[1:]
+
+    n_stats = len(columns) - 7
+    fp_ids, names, teams, ranks = [], [], [], []
+    stats = [[] for _ in range(n_stats)]
+    tbody = table.xpath(".//tbody")[0]
+    for row in tbody.xpath(".//tr"):
+        cells = row.xpath(".//td")
+        if len(cells) - 2 != n_stats:
+            raise ValueError("Row width does not match the header")
+        ranks.append(_text(cells[0]))
+        player_cell = cells[1]
+        links = player_cell.xpath(f".//a[{_PLAYER_LINK}]")
+        if links:
+            fp_id, player_name = _player(links[0])
+            team = _text(player_cell).replace(_text(links[0]), "").strip()
+            team = re.sub(r"[\(\)]", "", team)
+        else:
+            fp_id = player_name = team = None
+        fp_ids.append(fp_id)
+        names.append(player_name)
+        teams.append(team)
+        for values, cell in zip(stats, cells[2:]):
+            values.append(_text(cell))
+
+    n = len(ranks)
+    values = [
+        [str(params.get("year", ""))] * n,
+        [str(params.get("week", ""))] * n,
+        fp_ids, names, [page.upper()] * n, teams, ranks,
+    ] + stats
+    return _frame(columns, values)
+
+
+def projections_frame(content, page, params) -> pd.DataFrame:
+    """The raw (string-valued) table of a ``/nfl/projections/{page}.php`` page."""
+    table = _data_table(content)
+
+    header_rows = table.xpath(".//thead/tr")
+    if len(header_rows) == 2:
+        grouping_labels = _colspan_labels(header_rows[0].xpath(".//*[self::th or self::td]"))
+        column_labels = [_text(c) for c in header_rows[1].xpath(".//*[self::th or self::td]")]
+        full_column_names = [f"{group}_{col}" if group and group != "MISC" else col
+                             for group, col in zip(grouping_labels, column_labels)]
+    elif len(header_rows) == 1:
+        full_column_names = [_text(c) for c in header_rows[0].xpath(".//*[self::th or self::td]")]
+    else:
+        raise ValueError("No header rows found in the table.")
+    columns = ["year", "week", "fantasypros_id", "player_name", "position", "team"] + full_column_names[1:]
+
+    n_stats = len(columns) - 6
+    fp_ids, names, teams = [], [], []
+    stats = [[] for _ in range(n_stats)]
+    for row in table.xpath(".//tbody/tr"):
+        cells = row.xpath(".//*[self::th or self::td]")
+        if len(cells) - 1 != n_stats:
+            raise ValueError("Row width does not match the header")
+        links = cells[0].xpath(f".//*[{_PLAYER_LINK}]")
+        if links:
+            fp_id, player_name = _player(links[0])
+            team = _text(cells[0]).replace(player_name or "", "").strip()
+        else:
+            fp_id = player_name = team = None
+        fp_ids.append(fp_id)
+        names.append(player_name)
+        teams.append(team)
+        for values, cell in zip(stats, cells[1:]):
+            values.append(_text(cell))
+
+    n = len(fp_ids)
+    values = [
+        [str(params.get("year", ""))] * n,
+        [str(params.get("week", ""))] * n,
+        fp_ids, names, [page] * n, teams,
+    ] + stats
+    return _frame(columns, values)
@@ -0,0 +1,170 @@
+"""On-disk cache of raw scraper responses, so re-parsing never has to refetch.
+
+Entries are keyed by a hash of the URL and its (sorted) query params. Bodies are
+stored content-addressed (by SHA-256 of the bytes), so identical pages, e.g. the
+same empty table for many future weeks, are stored once::
+
+    data/http_cache/
+      index/ab/ab12....json     # url, params, status, fetched_at, body sha256
+      blobs/9f/9f86....         # raw response bytes
+
+Freshness comes from the season and week a page belongs to (``season_ttl``). Pages
+from past seasons never change, and neither do current-season weeks whose games and
+stat corrections are done (a week after their Monday game), so those are kept
+forever. Everything else from the current season (the week in progress, upcoming
+weeks, season totals) expires after ``BOTBLITZ_HTTP_CACHE_TTL`` seconds (default 6h),
+because those numbers keep moving.
+
+Environment:
+
+* ``BOTBLITZ_HTTP_CACHE``: cache directory (default ``data/http_cache`` in the repo);
+  ``0`` disables caching
+* ``BOTBLITZ_HTTP_OFFLINE=1``: replay from cache only, ignoring TTLs. A miss raises
+  ``CacheMiss`` instead of touching the network.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_CURRENT_TTL = 6 * 60 * 60
+
+
+class CacheMiss(LookupError):
+    """Offline replay asked for a page that was never cached."""
+
+
+class CachedResponse:
+    """The parts of a ``requests.Response`` the scrapers use."""
+
+    def __init__(self, url: str, status_code: int, content: bytes, encoding: str = None,
+                 from_cache: bool = False):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.encoding = encoding or "utf-8"
+        self.from_cache = from_cache
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            import requests
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+def cache_dir():
+    path = os.getenv("BOTBLITZ_HTTP_CACHE", os.path.join(_REPO_ROOT, "data", "http_cache"))
+    return None if path in ("", "0") else path
+
+
+def offline() -> bool:
+    return os.getenv("BOTBLITZ_HTTP_OFFLINE") == "1"
+
+
+def current_season(today: datetime.date = None) -> int:
+    """NFL season in progress (or most recently finished): Jan/Feb belong to last year's."""
+    today = today or datetime.date.today()
+    return today.year if today.month >= 3 else today.year - 1
+
+
+def week_start(season: int, week: int) -> datetime.date:
+    """The Tuesday that opens NFL ``week`` of ``season`` (week 1 kicks off the Thursday
+    after Labor Day, the first Monday of September)."""
+    labor_day = datetime.date(int(season), 9, 1)
+    labor_day += datetime.timedelta(days=(0 - labor_day.weekday()) % 7)
+    return labor_day + datetime.timedelta(days=1 + 7 * (int(week) - 1))
+
+
+def week_complete(season: int, week: int, today: datetime.date = None) -> bool:
+    """Whether ``week``'s games were played and its stat corrections are in: true
+    from the Tuesday a week after its Monday game."""
+    today = today or datetime.date.today()
+    return today >= week_start(season, int(week) + 2)
+
+
+def season_ttl(year=None, week=None, today: datetime.date = None):
+    """Seconds a cached page for (``year``, ``week``) stays fresh; None = forever (a past
+    season, or a completed week of this one)."""
+    try:
+        if year is not None and int(year) < current_season(today):
+            return None
+        if year is not None and week is not None and week_complete(int(year), int(week), today):
+            return None
+    except (TypeError, ValueError):
+        pass
+    return int(os.getenv("BOTBLITZ_HTTP_CACHE_TTL", str(DEFAULT_CURRENT_TTL)))
+
+
+def cache_key(url: str, params=None) -> str:
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items())
+    return hashlib.sha256(json.dumps([url, items]).encode()).hexdigest()
+
+
+def _shard(root: str, kind: str, digest: str) -> str:
+    return os.path.join(root, kind, digest[:2], digest)
+
+
+def _atomic_write(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load(url: str, params=None, ttl=None):
+    """The cached response for (url, params) if present and fresh, else None.
+
+    Offline mode ignores ``ttl`` and raises ``CacheMiss`` on a miss.
+    """
+    root = cache_dir()
+    entry = None
+    if root is not None:
+        try:
+            with open(_shard(root, "index", cache_key(url, params)) + ".json") as f:
+                entry = json.load(f)
+            with open(_shard(root, "blobs", entry["sha256"]), "rb") as f:
+                content = f.read()
+        except (OSError, ValueError, KeyError):
+            entry = None
+    if entry is None:
+        if offline():
+            raise CacheMiss(f"{url} {params or ''} is not in the HTTP cache (offline replay)")
+        return None
+    if not offline() and ttl is not None and time.time() - entry["fetched_at"] > ttl:
+        return None
+    return CachedResponse(entry["url"], entry["status"], content, entry.get("encoding"), from_cache=True)
+
+
+def store(url: str, params, response):
+    """Cache a successful response; anything but a 200 is never cached."""
+    root = cache_dir()
+    if root is None or response.status_code != 200:
+        return
+    content = response.content
+    digest = hashlib.sha256(content).hexdigest()
+    blob = _shard(root, "blobs", digest)
+    if not os.path.exists(blob):
+        _atomic_write(blob, content)
+    entry = {
+        "url": response.url,
+        "request_url": url,
+        "params": {str(k): str(v) for k, v in (params or {}).items()},
+        "status": response.status_code,
+        "encoding": response.encoding,
+        "fetched_at": time.time(),
+        "sha256": digest,
+    }
+    _atomic_write(_shard(root, "index", cache_key(url, params)) + ".json", json.dumps(entry).encode())
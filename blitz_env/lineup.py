@@ -0,0 +1,147 @@
+"""Optimal starting-lineup solver for ``LeagueSettings.player_slots``.
+
+Given each roster's weekly points and ``allowed_positions``, pick the starters that
+maximize the lineup total: every player starts in at most one slot, a slot only
+takes a player whose positions it accepts (``FLEX`` = RB/WR/TE, ``SUPERFLEX`` =
+QB/RB/WR/TE) and ``BENCH`` slots never score. As in the engine's weekly scoring,
+every slot that can be filled is filled, even by a negative score; only a slot
+no remaining player is eligible for stays empty (0 points).
+
+The solve is exact. It is a dynamic program over players whose state is how many
+slots of each kind are already used, so it stays correct when a player is eligible
+at several positions (where a fill-the-narrowest-slot-first greedy can lose points).
+The state space is tiny (the product of ``count + 1`` over slot kinds), which lets a
+whole league x season be solved in one NumPy batch::
+
+    from blitz_env.lineup import solve_lineups
+    result = solve_lineups(points, positions, settings.player_slots)
+    result.scores          # (teams, weeks) best possible lineup totals
+    result.contributions   # (teams, players, weeks) points each player started for
+"""
+
+import json
+from typing import NamedTuple
+
+import numpy as np
+
+from blitz_env.player_utils import parse_positions
+
+FLEX_POSITIONS = ("RB", "WR", "TE")
+SUPERFLEX_POSITIONS = ("QB", "RB", "WR", "TE")
+BENCH = "BENCH"
+
+
+class Lineups(NamedTuple):
+    scores: np.ndarray         # (teams, weeks)
+    contributions: np.ndarray  # (teams, players, weeks); 0 for anyone not started
+    slots: np.ndarray          # (teams, players, weeks); index into slot_names, -1 = not started
+    slot_names: tuple          # the starting slot kinds, in player_slots order
+
+
+def slot_positions(slot: str) -> tuple:
+    """Player positions a slot accepts (``BENCH`` accepts none for scoring)."""
+    if slot == "FLEX":
+        return FLEX_POSITIONS
+    if slot == "SUPERFLEX":
+        return SUPERFLEX_POSITIONS
+    if slot == BENCH:
+        return ()
+    return (slot,)
+
+
+def _parse_slots(player_slots) -> dict:
+    if isinstance(player_slots, str):
+        player_slots = json.loads(player_slots)
+    return {s: int(n) for s, n in player_slots.items() if s != BENCH and int(n) > 0}
+
+
+def solve_lineups(points, positions, player_slots) -> Lineups:
+    """Best possible lineup for every team and week in one batch.
+
+    ``points`` is ``(teams, players, weeks)`` (or ``(teams, players)`` for a single
+    week); pad short rosters with anything. ``positions[t][p]`` is team ``t``'s
+    player ``p``'s ``allowed_positions`` (a list or the raw JSON string); player
+    columns beyond ``len(positions[t])`` are treated as empty roster spots. NaN
+    points count as 0.
+    """
+    pts = np.asarray(points, dtype=np.float64)
+    single_week = pts.ndim == 2
+    if single_week:
+        pts = pts[:, :, None]
+    n_teams, n_players, n_weeks = pts.shape
+    pts = np.nan_to_num(pts)
+
+    counts = _parse_slots(player_slots)
+    slot_names = tuple(counts)
+    n_kinds = len(slot_names)
+
+    # eligible[t, p, k]: team t's player p may start in slot kind k
+    eligible = np.zeros((n_teams, n_players, n_kinds), dtype=bool)
+    accepts = [set(slot_positions(s)) for s in slot_names]
+    for t, roster in enumerate(positions):
+        for p, allowed in enumerate(roster):
+            allowed = set(parse_positions(allowed))
+            for k in range(n_kinds):
+                eligible[t, p, k] = bool(allowed & accepts[k])
+
+    # Mixed-radix encoding of "slots used so far" per kind; up[k][s] is the state
+    # with one fewer kind-k slot used than s (-1 if s has none of kind k used).
+    radix = np.array([counts[s] + 1 for s in slot_names], dtype=np.int64)
+    stride = np.concatenate(([1], np.cumprod(radix)[:-1])).astype(np.int64)
+    n_states = int(np.prod(radix)) if n_kinds else 1
+    states = np.arange(n_states)
+    used = (states[:, None] // stride[None, :]) % radix[None, :] if n_kinds else np.zeros((1, 0), dtype=np.int64)
+    up = [np.where(used[:, k] > 0, states - stride[k], -1) for k in range(n_kinds)]
+
+    # Batch = (team, week) pairs; dp[b, s] = best total with slot usage s. Every
+    # start also earns `fill`, more than any lineup's point spread, so the best state
+    # fills as many slots as possible first and maximizes points second.
+    batch = n_teams * n_weeks
+    flat_pts = pts.transpose(0, 2, 1).reshape(batch, n_players)
+    flat_elig = np.repeat(eligible, n_weeks, axis=0)
+    fill = 1.0 + 2.0 * np.abs(flat_pts).sum(axis=1)
+    dp = np.full((batch, n_states), -np.inf)
+    dp[:, 0] = 0.0
+    choice = np.full((n_players, batch, n_states), -1, dtype=np.int8)
+    for p in range(n_players):
+        best = dp.copy()
+        for k in range(n_kinds):
+            valid = up[k] >= 0
+            cand = np.full_like(dp, -np.inf)
+            cand[:, valid] = dp[:, up[k][valid]] + (flat_pts[:, p] + fill)[:, None]
+            cand[~flat_elig[:, p, k]] = -np.inf
+            better = cand > best
+            best = np.where(better, cand, best)
+            choice[p][better] = k
+        dp = best
+
+    # Walk the choices back from each batch's best final state.
+    state = dp.argmax(axis=1)
+    scores = dp[np.arange(batch), state] - fill * used[state].sum(axis=1)
+    slots = np.full((batch, n_players), -1, dtype=np.int64)
+    rows = np.arange(batch)
+    for p in range(n_players - 1, -1, -1):
+        k = choice[p][rows, state].astype(np.int64)
+        started = k >= 0
+        slots[started, p] = k[started]
+        state = np.where(started, state - stride[np.maximum(k, 0)], state)
+    contributions = np.where(slots >= 0, flat_pts, 0.0)
+
+    scores = scores.reshape(n_teams, n_weeks)
+    contributions = contributions.reshape(n_teams, n_weeks, n_players).transpose(0, 2, 1)
+    slots = slots.reshape(n_teams, n_weeks, n_players).transpose(0, 2, 1)
+    if single_week:
+        scores, contributions, slots = scores[:, 0], contributions[:, :, 0], slots[:, :, 0]
+    return Lineups(scores, contributions, slots, slot_names)
+
+
+def best_lineup(points, positions, player_slots):
+    """Best possible lineup for one roster and one week.
+
+    ``points`` and ``positions`` are per-player sequences in the same order. Returns
+    ``(total, starters)`` where ``starters`` maps each started player's index to the
+    slot kind they fill.
+    """
+    result = solve_lineups([list(points)], [list(positions)], player_slots)
+    starters = {p: result.slot_names[k] for p, k in enumerate(result.slots[0]) if k >= 0}
+    return float(result.scores[0]), starters
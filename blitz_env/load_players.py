@@ -1,8 +1,34 @@
+"""The draftable player pool from ``player_ranks_{year}.csv``.
+
+The CSV is parsed column-wise once per (file, mtime) and cached. Its columns are
+normalized to the ``players`` table shape (``id``, ``full_name``, ``rank``, ...), so:
+
+* ``load_players(year)`` returns a ``PlayerList`` that only builds the
+  ``agent_pb2.Player`` messages the first time it is indexed or iterated.
+  ``.frame`` is the column-oriented view.
+* ``insert_players(conn, year)`` bulk-inserts the pool into a ``players`` table
+  with one ``executemany`` (what build_season uses).
+"""
+
+import json
 import os
+import threading
+from typing import Sequence
+
 import pandas as pd
 from blitz_env.agent_pb2 import Player
 
-def load_players(year: int):
+# players table columns, in the order ``players_frame`` produces them
+COLUMNS = (
+    "id", "full_name", "professional_team", "player_bye_week", "rank", "tier",
+    "position_rank", "position_tier", "gsis_id", "allowed_positions",
+)
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def ranks_path(year: int) -> str:
     current_dir = os.path.dirname(__file__)
     file_path = os.path.join(current_dir, f'player_ranks_{str(year)}.csv')
     if not os.path.isfile(file_path):
@@ -11,32 +37,85 @@ def load_players(year: int):
             f"Generate it with `Rscript fetch_ranks.R {year}` (see docs/bootstrap-2026.md), "
             f"then `make build-py-module` to copy it into blitz_env/."
         )
-    players = load_all_players(file_path)
-    return players
+    return file_path
 
-def load_all_players(csv_path):
-    # Load the CSV file
+
+def _whole(column: pd.Series) -> pd.Series:
+    return column.fillna(0).astype("int64")
+
+
+def _parse(csv_path: str) -> pd.DataFrame:
     df = pd.read_csv(csv_path)
+    return pd.DataFrame({
+        "id": [str(v) for v in df["fantasypros_id"].tolist()],
+        "full_name": df["player_name"].tolist(),
+        "professional_team": df["team"].tolist(),
+        "player_bye_week": _whole(df["player_bye_week"]),
+        "rank": df["rank"].astype("int64"),
+        "tier": df["tier"].astype("int64"),
+        "position_rank": _whole(df["position_rank"]),
+        "position_tier": _whole(df["position_tier"]),
+        "gsis_id": [str(v) for v in df["gsis_id"].tolist()],
+        "allowed_positions": [[pos] for pos in df["pos"]],
+    })
 
-    # Initialize an empty list to store Player objects
-    players = []
-
-    # Iterate through each row in the DataFrame
-    for index, row in df.iterrows():
-        # Create a new Player object and assign data from the row
-        player = Player(
-            id=str(row['fantasypros_id']),
-            gsis_id=str(row['gsis_id']),
-            full_name=row['player_name'],
-            allowed_positions=[row['pos']],  # assuming 'pos' is a string; adjust if it's actually a list
-            professional_team=row['team'],
-            player_bye_week=int(row['player_bye_week']) if pd.notna(row['player_bye_week']) else 0,
-            rank=int(row['rank']),
-            tier=int(row['tier']),
-            position_rank=int(row['position_rank']) if pd.notna(row['position_rank']) else 0,
-            position_tier=int(row['position_tier']) if pd.notna(row['position_tier']) else 0
-        )
-        
-        # Add the Player object to the list
-        players.append(player)
-    return players
\ No newline at end of file
+
+def players_frame(csv_path: str) -> pd.DataFrame:
+    """The rank CSV in ``players`` table shape (cached; treat as read-only)."""
+    key = (os.path.abspath(csv_path), os.stat(csv_path).st_mtime_ns)
+    frame = _cache.get(key)
+    if frame is None:
+        with _cache_lock:
+            frame = _cache.get(key)
+            if frame is None:
+                frame = _parse(csv_path)
+                _cache[key] = frame
+    return frame
+
+
+class PlayerList(Sequence):
+    """``agent_pb2.Player`` messages for a players frame, built on first use."""
+
+    def __init__(self, frame: pd.DataFrame):
+        self.frame = frame
+        self._players = None
+
+    def _build(self) -> list:
+        if self._players is None:
+            columns = [self.frame[c].tolist() for c in COLUMNS]
+            self._players = [
+                Player(id=pid, full_name=name, professional_team=team, player_bye_week=bye,
+                       rank=rank, tier=tier, position_rank=pos_rank, position_tier=pos_tier,
+                       gsis_id=gsis, allowed_positions=positions)
+                for pid, name, team, bye, rank, tier, pos_rank, pos_tier, gsis, positions in zip(*columns)
+            ]
+        return self._players
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def __getitem__(self, index):
+        return self._build()[index]
+
+    def __iter__(self):
+        return iter(self._build())
+
+
+def load_players(year: int) -> PlayerList:
+    return load_all_players(ranks_path(year))
+
+
+def load_all_players(csv_path) -> PlayerList:
+    return PlayerList(players_frame(csv_path))
+
+
+def insert_players(conn, year: int, availability: str = "AVAILABLE") -> int:
+    """Insert ``year``'s pool into an existing ``players`` table (sqlite3 connection)."""
+    frame = players_frame(ranks_path(year))
+    columns = list(COLUMNS) + ["availability"]
+    rows = zip(*(frame[c].tolist() for c in COLUMNS[:-1]),
+               (json.dumps(p) for p in frame["allowed_positions"]),
+               [availability] * len(frame))
+    conn.executemany(
+        f"INSERT INTO players ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})", rows)
+    return len(frame)
@@ -1,11 +1,16 @@
 from sqlalchemy import create_engine, Column, Integer, String, Float, Boolean, ForeignKey, Table, JSON
-from sqlalchemy import text
+from sqlalchemy import event, text
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from typing import List
+import os
+import threading
 import pandas as pd
 
+from blitz_env import snapshot
+from blitz_env.reference_schema import SEASON_SCHEMA_VERSION
+
 Base = declarative_base()
 
 class Player(Base):
@@ -61,15 +66,195 @@ class GameStatus(Base):
     current_fantasy_week = Column(Integer)
 
 
+# One engine (with its connection pool) and sessionmaker per (process, DB URL). Engines
+# are never shared across a fork, and the schema check runs once per registry entry
+# instead of on every DatabaseManager().
+_engines = {}
+_engines_lock = threading.Lock()
+
+# Read-only reference data (season.db as bots see it). `immutable=1` tells SQLite the
+# file cannot change while open, so it takes no locks and keeps no change counter: any
+# number of bot processes share the OS page cache of one file without contention. Only
+# use it on a file nothing writes during the run.
+_RO_QUERY = "mode=ro&immutable=1"
+
+
+def _mib(var: str, default: int) -> int:
+    return int(os.getenv(var, str(default))) * 1024 * 1024
+
+
+def _read_only_uri(path: str) -> str:
+    return f"file:{os.path.abspath(path)}?{_RO_QUERY}"
+
+
+def _tune_reference(cursor, schema: str = "main"):
+    cursor.execute(f"PRAGMA {schema}.mmap_size = {_mib('BOTBLITZ_DB_MMAP_MB', 256)}")
+    cursor.execute(f"PRAGMA {schema}.cache_size = -{_mib('BOTBLITZ_DB_CACHE_MB', 64) // 1024}")
+
+
+# Reference tables that also carry league state the draft writes (availability,
+# current_bot_id, pick_chosen). In reference mode they are copied into the writable
+# league DB once; unqualified names resolve to main before the attached schema.
+_LEAGUE_COPIED_TABLES = ("players",)
+
+
+def _copy_league_tables(conn, provided):
+    existing = {row[0] for row in conn.exec_driver_sql(
+        "SELECT name FROM main.sqlite_master WHERE type = 'table'")}
+    for table in _LEAGUE_COPIED_TABLES:
+        if table not in provided or table in existing:
+            continue
+        ddl = [row[0] for row in conn.exec_driver_sql(
+            "SELECT sql FROM reference.sqlite_master WHERE tbl_name = ? AND sql IS NOT NULL "
+            "ORDER BY type = 'index'", (table,))]
+        for statement in ddl:  # the table first, then its indexes (created in main)
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql(f"INSERT INTO main.{table} SELECT * FROM reference.{table}")
+
+
+def _create_engine(url: str, reference: str = None):
+    engine = create_engine(url)
+    read_only = _RO_QUERY in url
+
+    if read_only or reference:
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_conn, _record):
+            cursor = dbapi_conn.cursor()
+            try:
+                if read_only:
+                    _tune_reference(cursor)
+                    cursor.execute("PRAGMA query_only = ON")
+                if reference:
+                    cursor.execute("ATTACH DATABASE ? AS reference", (_read_only_uri(reference),))
+                    _tune_reference(cursor, "reference")
+            finally:
+                cursor.close()
+
+    if not read_only:
+        tables = Base.metadata.sorted_tables
+        if reference:
+            with engine.begin() as conn:
+                provided = {row[0] for row in conn.exec_driver_sql(
+                    "SELECT name FROM reference.sqlite_master WHERE type = 'table'")}
+                _copy_league_tables(conn, provided)
+            # the other tables the reference DB provides (stats, projections) are read from it
+            tables = [t for t in tables if t.name not in provided or t.name in _LEAGUE_COPIED_TABLES]
+        Base.metadata.create_all(engine, tables=tables)
+    return engine
+
+
+def _registry_entry(url: str, reference: str = None):
+    key = (os.getpid(), url, reference)
+    entry = _engines.get(key)
+    if entry is None:
+        with _engines_lock:
+            entry = _engines.get(key)
+            if entry is None:
+                engine = _create_engine(url, reference)
+                entry = (engine, sessionmaker(bind=engine))
+                _engines[key] = entry
+    return entry
+
+
+def get_engine(url: str, reference: str = None):
+    """The pooled engine for ``url`` in this process (created and schema-checked once)."""
+    return _registry_entry(url, reference)[0]
+
+
+def dispose_engine(url: str = None):
+    """Close pooled connections for ``url`` (or every URL) in this process.
+
+    Call before replacing a DB file on disk (e.g. copying a fresh season.db over a
+    scratch DB) so the next DatabaseManager reconnects and re-checks the schema.
+    Reference snapshots of the disposed DBs are dropped too.
+    """
+    with _engines_lock:
+        for key in list(_engines):
+            if key[0] == os.getpid() and (url is None or key[1] == url):
+                engine = _engines.pop(key)[0]
+                engine.dispose()
+                if url is not None:
+                    database = engine.url.database
+                    if database.startswith("file:"):
+                        database = database[len("file:"):]
+                    snapshot.clear(key[2] or database)
+    if url is None:
+        snapshot.clear()
+
+
 class DatabaseManager:
-    # TODO: this should live elsewhere, since it's not a constant
+    """Bots' handle on the season DB.
+
+    Modes (arguments, or the environment variables in parentheses):
+
+    * default: ``path`` ($BOTBLITZ_DB_PATH) opened read-write, league tables created
+      if missing.
+    * ``read_only=True`` ($BOTBLITZ_DB_READONLY=1): ``path`` opened ``mode=ro&immutable=1``
+      with ``query_only``, a memory map ($BOTBLITZ_DB_MMAP_MB, default 256) and a
+      large page cache ($BOTBLITZ_DB_CACHE_MB, default 64). No schema check, no
+      locks; for workers that only read a season.db nobody is writing. The league
+      DB (``gamestate.db``, the engine's live file) is refused.
+    * ``reference=`` ($BOTBLITZ_REFERENCE_DB_PATH): ``path`` is a small writable
+      league-state DB and the reference season.db is ATTACHed read-only (immutable,
+      mmap'd) as schema ``reference``. Unqualified table names fall through to it,
+      so ``SELECT * FROM weekly_stats`` and the accessors work unchanged. ``players``
+      is the exception: it carries draft state, so it is copied into the league DB
+      on first open and written there.
+    """
+
+    # Fallback when neither an explicit path/url nor $BOTBLITZ_DB_PATH is given.
+    # Prefer passing `path=` (or setting the env var per process) over mutating this.
     DB_URL = "sqlite:///gamestate.db"
-    
-    def __init__(self):
-        self.engine = create_engine(self.DB_URL)
-        Base.metadata.create_all(self.engine)
-        Session = sessionmaker(bind=self.engine)
+    # File name of the engine's live league DB, which is never opened immutable
+    LEAGUE_DB_NAME = "gamestate.db"
+    ENV_VAR = "BOTBLITZ_DB_PATH"
+    READONLY_ENV_VAR = "BOTBLITZ_DB_READONLY"
+    REFERENCE_ENV_VAR = "BOTBLITZ_REFERENCE_DB_PATH"
+
+    def __init__(self, path: str = None, url: str = None, read_only: bool = None,
+                 reference: str = None):
+        if read_only is None:
+            read_only = os.environ.get(self.READONLY_ENV_VAR, "") not in ("", "0")
+        reference = reference or os.environ.get(self.REFERENCE_ENV_VAR) or None
+        self.url = self.resolve_url(path, url, read_only=read_only, uri=bool(reference))
+        self.read_only = read_only
+        self.reference = reference
+        self.engine, Session = _registry_entry(self.url, reference)
         self.session = Session()
+        self._typed_reference = None
+        self._key_dtypes = {}
+
+    @classmethod
+    def resolve_url(cls, path: str = None, url: str = None, read_only: bool = False,
+                    uri: bool = False) -> str:
+        if url:
+            return url
+        path = path or os.environ.get(cls.ENV_VAR)
+        if read_only or uri:
+            # URI filenames (needed for mode=ro, and for ATTACHing with one)
+            path = path or cls.DB_URL[len("sqlite:///"):]
+            if read_only:
+                if os.path.basename(path) == cls.LEAGUE_DB_NAME:
+                    # the engine's live league DB: immutable=1 would serve stale or torn
+                    # pages while draft writes land in it
+                    raise ValueError(
+                        f"refusing to open the league DB '{path}' read-only (immutable); "
+                        f"point {cls.ENV_VAR} at a season.db nothing writes, or use "
+                        f"{cls.REFERENCE_ENV_VAR} for reference data next to a writable league DB"
+                    )
+                return f"sqlite:///{_read_only_uri(path)}&uri=true"
+            return f"sqlite:///file:{os.path.abspath(path)}?uri=true"
+        if path:
+            return f"sqlite:///{path}"
+        return cls.DB_URL
+
+    @property
+    def path(self) -> str:
+        """Filesystem path of the SQLite DB this manager is bound to."""
+        database = self.engine.url.database
+        if database.startswith("file:"):
+            return database[len("file:"):]
+        return database
 
     def close(self):
         self.session.close()
@@ -124,46 +309,124 @@ class DatabaseManager:
 
     # --- Stats/projections accessors (absorbed from the former StatsDB/ProjectionsDB) ---
     # All return the single FantasyPros schema (FPTS, RUSHING_YDS, ...) keyed by
-    # fantasypros_id (== Player.id), normalized so `season`/`week` are numeric (Int64).
+    # fantasypros_id (== Player.id), with `season`/`week` as nullable Int64. A season.db
+    # built by the current build_season (PRAGMA user_version >= SEASON_SCHEMA_VERSION)
+    # already stores them as INTEGER, so rows are read as-is; older DBs are normalized
+    # on read.
+    # The `*_many` variants take a list of players (or ids; None = every row) and answer
+    # a whole roster/league in one query, indexed by (fantasypros_id, season[, week]).
+    # The per-player accessors are thin views over the same batched read. Once a
+    # blitz_env.snapshot is loaded for this DB they are served from it instead.
 
-    def _read_for_player(self, table: str, player) -> "pd.DataFrame":
+    # Keep each IN (...) list well under SQLite's bound-parameter limit.
+    _IN_CHUNK = 500
+
+    def _is_typed_reference(self) -> bool:
+        if self._typed_reference is None:
+            with self.engine.connect() as conn:
+                schema = "reference" if self.reference else "main"
+                version = conn.exec_driver_sql(f"PRAGMA {schema}.user_version").scalar() or 0
+            self._typed_reference = version >= SEASON_SCHEMA_VERSION
+        return self._typed_reference
+
+    def _key_dtypes_for(self, table: str) -> dict:
+        # INTEGER key columns come back as nullable Int64 straight from read_sql
+        if table not in self._key_dtypes:
+            with self.engine.connect() as conn:
+                columns = {row[1] for row in conn.exec_driver_sql(f"PRAGMA table_info({table})")}
+            self._key_dtypes[table] = {c: "Int64" for c in ("season", "week") if c in columns}
+        return self._key_dtypes[table]
+
+    def _read_for_players(self, table: str, players=None, seasons=None, week=None) -> "pd.DataFrame":
+        if players is None:
+            chunks = [None]
+        else:
+            ids = list(dict.fromkeys(str(getattr(p, "id", p)) for p in players))
+            if not ids:
+                return pd.DataFrame()
+            chunks = [ids[i:i + self._IN_CHUNK] for i in range(0, len(ids), self._IN_CHUNK)]
+        snap = snapshot.get(self)
+        if snap is not None and table in snap:
+            return self._filter(snap.rows(table, None if players is None else ids), seasons, week)
+        frames = []
         try:
-            df = pd.read_sql(
-                text(f"SELECT * FROM {table} WHERE fantasypros_id = :pid"),
-                self.engine,
-                params={"pid": str(player.id)},
-            )
+            typed = self._is_typed_reference()
+            dtype = self._key_dtypes_for(table) if typed else None
+            # typed DBs store season/week as INTEGER, so they filter in SQL next to the
+            # IN list; legacy DBs (text keys, maybe no season column) filter after the read
+            where, where_params = [], {}
+            if typed and seasons is not None and "season" in dtype:
+                names = [f"s{i}" for i in range(len(seasons))]
+                where.append(f"season IN ({', '.join(':' + n for n in names)})" if names else "0")
+                where_params.update(zip(names, (int(s) for s in seasons)))
+            if typed and week is not None and "week" in dtype:
+                where.append("week = :week")
+                where_params["week"] = int(week)
+            for chunk in chunks:
+                clauses, params = list(where), dict(where_params)
+                if chunk is not None:
+                    names = [f"p{i}" for i in range(len(chunk))]
+                    clauses.insert(0, f"fantasypros_id IN ({', '.join(':' + n for n in names)})")
+                    params.update(zip(names, chunk))
+                sql = f"SELECT * FROM {table}" + (f" WHERE {' AND '.join(clauses)}" if clauses else "")
+                frames.append(pd.read_sql(text(sql), self.engine, params=params, dtype=dtype))
         except Exception:
             return pd.DataFrame()
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        if typed:
+            return df
         if "season" not in df.columns and "year" in df.columns:
             df["season"] = df["year"]
         for col in ("season", "week"):
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-        return df.reset_index(drop=True)
+        return self._filter(df, seasons, week).reset_index(drop=True)
 
-    def get_seasonal_data(self, player, seasons=None) -> "pd.DataFrame":
-        df = self._read_for_player("season_stats", player)
+    def _read_for_player(self, table: str, player, seasons=None, week=None) -> "pd.DataFrame":
+        return self._read_for_players(table, [player], seasons, week)
+
+    @staticmethod
+    def _filter(df, seasons=None, week=None) -> "pd.DataFrame":
         if seasons is not None and "season" in df.columns:
             df = df[df["season"].isin([int(s) for s in seasons])]
-        return df.reset_index(drop=True)
+        if week is not None and "week" in df.columns:
+            df = df[df["week"] == int(week)]
+        return df
+
+    @staticmethod
+    def _indexed(df, keys) -> "pd.DataFrame":
+        if df.empty and not all(k in df.columns for k in keys):
+            return df
+        return df.set_index(list(keys)).sort_index()
+
+    def get_seasonal_data_many(self, players=None, seasons=None) -> "pd.DataFrame":
+        df = self._read_for_players("season_stats", players, seasons)
+        return self._indexed(df, ("fantasypros_id", "season"))
+
+    def get_weekly_data_many(self, players=None, seasons=None) -> "pd.DataFrame":
+        df = self._read_for_players("weekly_stats", players, seasons)
+        return self._indexed(df, ("fantasypros_id", "season", "week"))
+
+    def get_preseason_projections_many(self, players=None, season=None) -> "pd.DataFrame":
+        seasons = None if season is None else [season]
+        df = self._read_for_players("preseason_projections", players, seasons)
+        return self._indexed(df, ("fantasypros_id", "season"))
+
+    def get_weekly_projections_many(self, players=None, season=None, week=None) -> "pd.DataFrame":
+        seasons = None if season is None else [season]
+        df = self._read_for_players("weekly_projections", players, seasons, week)
+        return self._indexed(df, ("fantasypros_id", "season", "week"))
+
+    def get_seasonal_data(self, player, seasons=None) -> "pd.DataFrame":
+        return self._read_for_player("season_stats", player, seasons).reset_index(drop=True)
 
     def get_weekly_data(self, player, seasons=None) -> "pd.DataFrame":
-        df = self._read_for_player("weekly_stats", player)
-        if seasons is not None and "season" in df.columns:
-            df = df[df["season"].isin([int(s) for s in seasons])]
-        return df.reset_index(drop=True)
+        return self._read_for_player("weekly_stats", player, seasons).reset_index(drop=True)
 
     def get_preseason_projections(self, player, season) -> "pd.DataFrame":
-        df = self._read_for_player("preseason_projections", player)
-        if season is not None and "season" in df.columns:
-            df = df[df["season"] == int(season)]
-        return df.reset_index(drop=True)
+        seasons = None if season is None else [season]
+        return self._read_for_player("preseason_projections", player, seasons).reset_index(drop=True)
 
     def get_weekly_projections(self, player, season, week) -> "pd.DataFrame":
-        df = self._read_for_player("weekly_projections", player)
-        if season is not None and "season" in df.columns:
-            df = df[df["season"] == int(season)]
-        if week is not None and "week" in df.columns:
-            df = df[df["week"] == int(week)]
-        return df.reset_index(drop=True)
\ No newline at end of file
+        seasons = None if season is None else [season]
+        return self._read_for_player("weekly_projections", player, seasons, week).reset_index(drop=True)
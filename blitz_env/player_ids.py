@@ -0,0 +1,183 @@
+"""Resolve scraped player rows to FantasyPros / GSIS / Sleeper IDs in bulk.
+
+The ID crosswalk is dynastyprocess' ``db_playerids.csv``. It is fetched through
+the shared HTTP layer, so it lands in the raw-response cache (blitz_env.http_cache)
+and refreshes on the current-season TTL. It is parsed once per process, with its
+match keys precomputed. ``resolve`` then matches a whole frame in two stages:
+
+1. exact: a hashed join on (normalized name, position). When the crosswalk has
+   several rows for a key, the one on the same team wins.
+2. fuzzy: the rows still unmatched are scored against every crosswalk
+   "name | POS" string in one ``rapidfuzz.process.cdist`` call. The best match at
+   or above ``score_cutoff`` (``fuzz.ratio``) is taken.
+
+::
+
+    from blitz_env.player_ids import get_resolver
+    ids = get_resolver().resolve(injury_df)               # + fantasypros_id, gsis_id, sleeper_id
+    stats = get_resolver().attach(stats_df)               # rows already keyed by fantasypros_id
+
+The injury scrapers (``NFLInjuryScraper.match_player_ids``, used by collect_stats
+and collect_weekly_injuries) are the only callers. The stats and projections
+collectors already key their rows by ``fantasypros_id`` and store no other IDs,
+so they do not call ``attach``. It is there for code that needs the GSIS or
+Sleeper ID of such rows.
+
+Set ``BOTBLITZ_PLAYER_IDS_URL`` to point at another copy of the CSV (e.g. a local
+stand-in in tests).
+"""
+
+import io
+import os
+import threading
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from blitz_env import http_cache
+from blitz_env.fetch import fetch
+
+CROSSWALK_URL = "https://raw.githubusercontent.com/dynastyprocess/data/master/files/db_playerids.csv"
+ID_COLUMNS = ("fantasypros_id", "gsis_id", "sleeper_id")
+DEFAULT_SCORE_CUTOFF = 80
+
+_SUFFIXES = r"\b(?:jr|sr|ii|iii|iv|v)\b"
+
+_resolver = None
+_resolver_lock = threading.Lock()
+
+
+def crosswalk_url() -> str:
+    return os.getenv("BOTBLITZ_PLAYER_IDS_URL", CROSSWALK_URL)
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """Lowercase; drop punctuation and generational suffixes; collapse whitespace."""
+    return (names.astype("string").str.lower()
+            .str.replace(r"[.'’,]", "", regex=True)
+            .str.replace(_SUFFIXES, "", regex=True)
+            .str.replace(r"[^a-z0-9]+", " ", regex=True)
+            .str.strip())
+
+
+def normalize_codes(values: pd.Series) -> pd.Series:
+    return values.astype("string").str.upper().str.strip()
+
+
+def _id_text(values: pd.Series) -> pd.Series:
+    """IDs as strings: the CSV parses numeric IDs as float (17298.0)."""
+    numeric = pd.to_numeric(values, errors="coerce")
+    whole = numeric.notna() & (numeric == np.round(numeric))
+    out = values.astype("string").str.strip()
+    out[whole] = numeric[whole].astype("Int64").astype("string")
+    return out.replace("", pd.NA)
+
+
+class Match(NamedTuple):
+    exact: int
+    fuzzy: int
+    unmatched: int
+
+
+class PlayerResolver:
+    """Precomputed crosswalk keys plus the batch matcher."""
+
+    def __init__(self, crosswalk: pd.DataFrame):
+        pos_col = next((c for c in ("pos", "position", "Position", "POS") if c in crosswalk.columns), None)
+        if pos_col is None:
+            raise ValueError(f"Could not find position column in player IDs data. "
+                             f"Available columns: {list(crosswalk.columns)}")
+        table = pd.DataFrame({
+            "name_key": normalize_names(crosswalk["name"]),
+            "position_key": normalize_codes(crosswalk[pos_col]),
+            "team_key": normalize_codes(crosswalk["team"]) if "team" in crosswalk.columns else pd.NA,
+        })
+        for col in ID_COLUMNS:
+            table[col] = _id_text(crosswalk[col]) if col in crosswalk.columns else pd.NA
+        table = table.dropna(subset=["name_key", "position_key"]).reset_index(drop=True)
+        self.table = table
+        self.choices = (table["name_key"] + " | " + table["position_key"]).tolist()
+        self.last_match = None
+        self._by_fantasypros = None
+
+    @classmethod
+    def load(cls) -> "PlayerResolver":
+        """Fetch (or replay from the HTTP cache) and index the crosswalk."""
+        response = fetch(crosswalk_url(), season=http_cache.current_season())
+        response.raise_for_status()
+        return cls(pd.read_csv(io.BytesIO(response.content), low_memory=False))
+
+    def _exact(self, keys: pd.DataFrame) -> pd.DataFrame:
+        """Index of the chosen crosswalk row per (name, position[, team]) key."""
+        candidates = keys.drop_duplicates().merge(
+            self.table.reset_index().rename(columns={"index": "row", "team_key": "cw_team"}),
+            on=["name_key", "position_key"], how="inner")
+        candidates["same_team"] = (candidates["team_key"] == candidates["cw_team"]).fillna(False)
+        best = (candidates.sort_values(["same_team", "row"], ascending=[False, True])
+                .drop_duplicates(["name_key", "position_key", "team_key"]))
+        return keys.merge(best[["name_key", "position_key", "team_key", "row"]],
+                          on=["name_key", "position_key", "team_key"], how="left")["row"]
+
+    def _fuzzy(self, queries: pd.Series, score_cutoff: int) -> pd.Series:
+        """Best crosswalk row per query string (NaN below ``score_cutoff``)."""
+        from rapidfuzz import fuzz, process
+
+        unique = pd.unique(queries.to_numpy(dtype=object))
+        scores = process.cdist(list(unique), self.choices, scorer=fuzz.ratio,
+                               score_cutoff=score_cutoff, dtype=np.uint8, workers=-1)
+        best = scores.argmax(axis=1).astype("float64")
+        best[scores.max(axis=1) == 0] = np.nan
+        return queries.map(dict(zip(unique, best)))
+
+    def resolve(self, df: pd.DataFrame, name_col: str = "player_name", position_col: str = "position",
+                team_col: str = "team", score_cutoff: int = DEFAULT_SCORE_CUTOFF) -> pd.DataFrame:
+        """``df`` with ``ID_COLUMNS`` filled from the crosswalk (NA where nothing matched)."""
+        keys = pd.DataFrame({
+            "name_key": normalize_names(df[name_col]).to_numpy(),
+            "position_key": normalize_codes(df[position_col]).to_numpy(),
+            "team_key": (normalize_codes(df[team_col]).to_numpy() if team_col in df.columns
+                         else pd.array([pd.NA] * len(df), dtype="string")),
+        })
+        rows = self._exact(keys)
+        exact = int(rows.notna().sum())
+        missing = rows.isna() & keys["name_key"].notna() & keys["position_key"].notna()
+        if missing.any():
+            queries = keys.loc[missing, "name_key"] + " | " + keys.loc[missing, "position_key"]
+            rows[missing] = self._fuzzy(queries, score_cutoff)
+        self.last_match = Match(exact=exact, fuzzy=int(rows.notna().sum()) - exact,
+                                unmatched=int(rows.isna().sum()))
+
+        out = df.drop(columns=[c for c in ID_COLUMNS if c in df.columns]).reset_index(drop=True)
+        picked = self.table.reindex(rows.to_numpy())
+        for col in ID_COLUMNS:
+            out[col] = picked[col].to_numpy()
+        return out
+
+    def attach(self, df: pd.DataFrame, on: str = "fantasypros_id") -> pd.DataFrame:
+        """Add the other ID columns to rows already keyed by ``fantasypros_id``."""
+        if self._by_fantasypros is None:
+            self._by_fantasypros = (self.table.dropna(subset=["fantasypros_id"])
+                                    .drop_duplicates("fantasypros_id")
+                                    .set_index("fantasypros_id")[[c for c in ID_COLUMNS if c != "fantasypros_id"]])
+        keys = df[on].astype("string")
+        out = df.copy()
+        for col in self._by_fantasypros.columns:
+            out[col] = keys.map(self._by_fantasypros[col]).to_numpy()
+        return out
+
+
+def get_resolver() -> PlayerResolver:
+    """The process-wide resolver (crosswalk loaded on first use)."""
+    global _resolver
+    if _resolver is None:
+        with _resolver_lock:
+            if _resolver is None:
+                _resolver = PlayerResolver.load()
+    return _resolver
+
+
+def reset_resolver():
+    global _resolver
+    with _resolver_lock:
+        _resolver = None
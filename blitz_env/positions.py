@@ -0,0 +1,66 @@
+"""Position bitmasks for vectorized roster-slot eligibility.
+
+``players.allowed_positions`` is a JSON list, so filtering a DataFrame of players
+by position meant ``json.loads`` plus a set intersection per row on every pick.
+build_season stores two derived forms of the column:
+
+* ``players.position_mask``: one bit per position (``POSITION_BITS``)
+* ``player_positions(player_id, position)``: one row per eligible position,
+  for SQL joins such as ``WHERE position = 'RB'``
+
+``eligible_for`` turns slot names into a mask and filters with a single bitwise
+AND over the whole column::
+
+    from blitz_env.positions import eligible_for
+    players = pd.read_sql("SELECT * FROM players WHERE availability = 'AVAILABLE'", db.engine)
+    flex = players[eligible_for(players, "FLEX")]
+    skill = players[eligible_for(players, ["RB", "WR"])]
+
+Frames without ``position_mask`` (a season.db built before it existed) fall back
+to parsing ``allowed_positions``, once per distinct value rather than per row.
+"""
+
+from typing import Iterable, Union
+
+import numpy as np
+import pandas as pd
+
+from blitz_env.lineup import slot_positions
+from blitz_env.player_utils import parse_positions
+
+POSITION_BITS = {"QB": 1, "RB": 2, "WR": 4, "TE": 8, "K": 16, "DST": 32}
+
+
+def position_mask(positions) -> int:
+    """Bitmask of a player's ``allowed_positions`` (list or JSON string); unknown positions add no bit."""
+    mask = 0
+    for position in parse_positions(positions):
+        mask |= POSITION_BITS.get(position, 0)
+    return mask
+
+
+def slot_mask(slots: Union[str, Iterable[str]]) -> int:
+    """Bitmask of every position that can fill any of ``slots`` (``FLEX``, ``RB``, ...)."""
+    if isinstance(slots, str):
+        slots = [slots]
+    mask = 0
+    for slot in slots:
+        for position in slot_positions(slot):
+            mask |= POSITION_BITS.get(position, 0)
+    return mask
+
+
+def position_masks(players: pd.DataFrame) -> np.ndarray:
+    """``position_mask`` for every row of ``players``."""
+    if "position_mask" in players.columns:
+        return players["position_mask"].fillna(0).to_numpy(dtype=np.int64)
+    values = players["allowed_positions"].astype(object)
+    codes, uniques = pd.factorize(values.map(lambda v: tuple(v) if isinstance(v, list) else v))
+    lookup = np.array([position_mask(u) if isinstance(u, (str, tuple)) else 0 for u in uniques] + [0],
+                      dtype=np.int64)
+    return lookup[codes]  # code -1 (missing) picks the trailing 0
+
+
+def eligible_for(players: pd.DataFrame, slots: Union[str, Iterable[str]]) -> np.ndarray:
+    """Boolean row mask: which ``players`` can fill at least one of ``slots``."""
+    return (position_masks(players) & slot_mask(slots)) != 0
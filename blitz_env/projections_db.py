@@ -2,21 +2,23 @@ import pandas as pd
 import re
 from typing import Union
 
+from blitz_env.fetch import fantasypros_url, fetch
+from blitz_env.fp_numeric import coerce_numeric
+
 # `requests`/`bs4` are only needed for the live FantasyPros fetch in fp_projections;
-# import them lazily there so `import blitz_env` stays lean inside the container.
+# they are imported lazily (requests inside blitz_env.fetch) so `import blitz_env`
+# stays lean inside the container.
 
 def fp_projections(page, sport=None, include_metadata=False, **kwargs):
-    import requests
-
     if sport is None:
         sport = 'nfl'  # Default sport
 
     if sport not in ['nfl', 'mlb', 'nba', 'nhl']:
         raise ValueError("Sport must be one of 'nfl', 'mlb', 'nba', 'nhl'")
 
-    url_query = f"https://www.fantasypros.com/{sport}/projections/{page}.php"
+    url_query = fantasypros_url(f"{sport}/projections/{page}.php")
     params = kwargs
-    response = requests.get(url_query, params=params)
+    response = fetch(url_query, params=params, season=params.get('year'), week=params.get('week'))
 
     response_obj = {
         'content': response.content,
@@ -47,10 +49,19 @@ def fp_projections_parse(response_obj, page):
         raise ValueError("Invalid sport")
 
 def fp_projections_parse_nfl(response, page):
+    """Parse an NFL projections page: the lxml reader (blitz_env.fp_table) when it
+    can, the BeautifulSoup parser otherwise."""
+    try:
+        from blitz_env.fp_table import projections_frame
+        projections_df = projections_frame(response['content'], page, response['params'])
+    except (ImportError, ValueError) as e:  # lxml missing, or a page of another shape
+        print(f"Warning: lxml reader failed on projections page {page!r} ({e}); using BeautifulSoup")
+        projections_df = fp_projections_parse_nfl_bs4(response['content'], page, response['params'])
+    return {'projections': _coerce_projections(projections_df), 'response': response['response']}
+
+def fp_projections_parse_nfl_bs4(content, page, params):
     from bs4 import BeautifulSoup
-    content = response['content']
     soup = BeautifulSoup(content, 'html.parser')
-    params = response['params']
 
     # Find the table with id 'data'
     table_html = soup.find(id='data')
@@ -132,15 +143,11 @@ def fp_projections_parse_nfl(response, page):
     # Create column names including player info
     columns = ['year', 'week', 'fantasypros_id', 'player_name', 'position', 'team'] + full_column_names[1:]
 
-    projections_df = pd.DataFrame(data, columns=columns)
-
-    # Convert numeric columns
-    numeric_cols = projections_df.columns.drop(['year', 'week', 'fantasypros_id', 'player_name', 'position', 'team'])
-    for col in numeric_cols:
-        projections_df[col] = projections_df[col].replace(',', '', regex=True)
-        projections_df[col] = pd.to_numeric(projections_df[col], errors='coerce')
+    return pd.DataFrame(data, columns=columns)
 
-    return {'projections': projections_df, 'response': response['response']}
+def _coerce_projections(projections_df):
+    # Every stat column in one vectorized pass (commas, %, ROST -> fraction, compact dtypes)
+    return coerce_numeric(projections_df, ['year', 'week', 'fantasypros_id', 'player_name', 'position', 'team'])
 
 def fp_projections_parse_mlb(response):
     # Similar logic for MLB projections parsing
@@ -0,0 +1,125 @@
+"""Typed schema for the scraped reference tables.
+
+The scrapers produce frames whose column types depend on the page and the
+season. Some examples: ``year`` as text in one table and an int in another,
+``week`` as "" or "draft" for season-level rows, and a stat column that is all-NULL
+for one position. Written with plain ``to_sql`` those become TEXT in one
+table and INTEGER in the next, so every read had to re-normalize them.
+
+Every reference table is written through this module instead
+(collect_stats, the ``collect_weekly_*`` upserts, build_season):
+
+* ``year`` / ``season`` / ``week`` are INTEGER. ``season`` is always present
+  (= ``year``), and anything that is not a week number (e.g. "draft") is NULL.
+* identity/label columns (``fantasypros_id``, ``player_name``, ``position``,
+  ``team``) are TEXT.
+* stat columns are REAL, except in ``weekly_injuries``, where every non-key
+  column is TEXT.
+
+``write_table`` creates the table with those declared types and stores values
+that already have them, so readers get INTEGER/REAL/TEXT straight out of SQLite.
+"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from blitz_env.fp_numeric import widen_floats
+
+INTEGER, REAL, TEXT = "INTEGER", "REAL", "TEXT"
+
+KEY_COLUMNS = ("year", "season", "week")
+
+# The season.db shape (PRAGMA user_version), written by bootstrap_data.build_season and
+# checked by DatabaseManager; bumped whenever build_season changes that shape.
+# 1: typed year/season/week, canonical `season` column, lookup indexes, ANALYZE stats.
+# 2: every reference column declared per this module (REAL stats, TEXT labels).
+# 3: players.position_mask + player_positions (blitz_env.positions).
+SEASON_SCHEMA_VERSION = 3
+
+_LABELS = ("fantasypros_id", "player_name", "position", "team")
+
+TABLES = {
+    "preseason_projections": {TEXT: _LABELS, INTEGER: (), "default": REAL},
+    "weekly_projections": {TEXT: _LABELS, INTEGER: (), "default": REAL},
+    "season_stats": {TEXT: _LABELS, INTEGER: ("pos_rank", "index"), "default": REAL},
+    "weekly_stats": {TEXT: _LABELS, INTEGER: ("pos_rank", "index"), "default": REAL},
+    "weekly_injuries": {TEXT: (), INTEGER: (), "default": TEXT},
+}
+
+
+def column_type(table: str, column: str) -> str:
+    """Declared SQLite type of ``column`` in reference table ``table``."""
+    if column in KEY_COLUMNS:
+        return INTEGER
+    spec = TABLES[table]
+    if column in spec[TEXT]:
+        return TEXT
+    if column in spec[INTEGER]:
+        return INTEGER
+    return spec["default"]
+
+
+def column_types(table: str, columns) -> dict:
+    return {c: column_type(table, c) for c in columns}
+
+
+def _integers(s: pd.Series) -> pd.Series:
+    values = pd.to_numeric(s, errors="coerce").astype("float64")
+    values = values.where(np.isfinite(values) & (values == np.round(values)))
+    return values.astype("Int64")
+
+
+def _reals(s: pd.Series) -> pd.Series:
+    return pd.to_numeric(s, errors="coerce").astype("float64")
+
+
+def _texts(s: pd.Series) -> pd.Series:
+    if pd.api.types.is_numeric_dtype(s) and not pd.api.types.is_bool_dtype(s):
+        # numeric ids (sleeper_id 1234.0) keep their integer spelling
+        whole = s.dropna()
+        if (whole == np.round(whole)).all():
+            s = s.astype("Int64")
+    return s.astype(object).where(s.notna(), None).map(lambda v: v if v is None else str(v))
+
+
+_CONVERT = {INTEGER: _integers, REAL: _reals, TEXT: _texts}
+
+
+def conform(table: str, df: pd.DataFrame) -> pd.DataFrame:
+    """``df`` with the canonical ``season`` column and every column in its declared type."""
+    if table not in TABLES:
+        raise ValueError(f"{table!r} is not a reference table")
+    df = widen_floats(df)
+    out = df.copy()
+    if "season" not in out.columns and "year" in out.columns:
+        out["season"] = out["year"]
+    for i, column in enumerate(out.columns):
+        out.isetitem(i, _CONVERT[column_type(table, column)](out.iloc[:, i]))
+    return out
+
+
+def create_table_sql(table: str, columns) -> str:
+    defs = ", ".join(f"{_quote(c)} {t}" for c, t in column_types(table, columns).items())
+    return f"CREATE TABLE {_quote(table)} ({defs})"
+
+
+def write_table(df: pd.DataFrame, table: str, con, if_exists: str = "replace"):
+    """Write ``df`` as reference table ``table`` with the typed schema.
+
+    ``con`` is a SQLAlchemy engine/connection or a ``sqlite3`` connection.
+    """
+    df = conform(table, df)
+    if isinstance(con, sqlite3.Connection):
+        dtype = column_types(table, df.columns)
+    else:
+        from sqlalchemy import Float, Integer, Text
+        types = {INTEGER: Integer, REAL: Float, TEXT: Text}
+        dtype = {c: types[t] for c, t in column_types(table, df.columns).items()}
+    df.to_sql(table, con=con, if_exists=if_exists, index=False, dtype=dtype)
+    return df
+
+
+def _quote(name: str) -> str:
+    return '"' + str(name).replace('"', '""') + '"'
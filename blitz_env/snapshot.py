@@ -0,0 +1,153 @@
+"""Process-wide, preloaded copy of the reference tables for in-process evaluation.
+
+Under BOTBLITZ_EVAL_INLINE=1 the gRPC server imports the bot once and calls it on
+every pick. The stats and projections tables never change during a draft, yet each
+call re-read them through ``pd.read_sql``. A snapshot reads each reference table
+once per process into a NumPy-backed DataFrame (with the same typed columns the
+DatabaseManager accessors return) and keeps a ``fantasypros_id -> rows`` index, so
+per-pick lookups are array takes instead of SQL queries::
+
+    from blitz_env import snapshot
+    snap = snapshot.load()                   # once; binds like DatabaseManager()
+    snap.table("weekly_stats")               # whole table
+    snap.rows("weekly_stats", ["19788"])     # one roster's rows
+    snap.players(db)                         # static player columns + live draft state
+
+Once a snapshot is loaded for a DB, the ``DatabaseManager.get_*`` accessors for that
+DB are answered from it. Only the small mutable league state (``players``
+availability/owner, bots, settings, game status) is still queried per call.
+
+Frames are shared: treat them as read-only. Accessors hand out shallow copies, so
+adding or replacing columns never touches the snapshot. Once the DB file is replaced
+(or a reference DB rewritten, e.g. by a weekly refresh) the accessors go back to SQL
+until ``load()`` is called again. ``clear()`` drops snapshots outright;
+``dispose_engine`` calls it for the URLs it disposes. A plain season.db refreshed
+in place by another process is not detected: restart the process (see
+docs/bot-data-schema.md).
+"""
+
+import os
+import threading
+from typing import Dict, Iterable
+
+import numpy as np
+import pandas as pd
+
+REFERENCE_TABLES = (
+    "season_stats",
+    "preseason_projections",
+    "weekly_stats",
+    "weekly_projections",
+    "weekly_injuries",
+)
+
+# players columns that change during a draft/season; everything else is static.
+LIVE_PLAYER_COLUMNS = ("availability", "pick_chosen", "current_bot_id")
+
+_snapshots: Dict[tuple, "ReferenceSnapshot"] = {}
+_lock = threading.Lock()
+
+
+class ReferenceSnapshot:
+    """Immutable, column-oriented frames of one DB's reference tables."""
+
+    def __init__(self, tables: Dict[str, pd.DataFrame], players: pd.DataFrame):
+        self._tables = tables
+        self._players = players
+        self._row_index = {}
+
+    @classmethod
+    def read(cls, db) -> "ReferenceSnapshot":
+        tables = {}
+        for table in REFERENCE_TABLES:
+            df = db._read_for_players(table)
+            if not df.empty:
+                tables[table] = df
+        players = pd.read_sql("SELECT * FROM players", db.engine)
+        static = [c for c in players.columns if c not in LIVE_PLAYER_COLUMNS]
+        return cls(tables, players[static])
+
+    @property
+    def table_names(self):
+        return tuple(self._tables)
+
+    def __contains__(self, table: str) -> bool:
+        return table in self._tables
+
+    def table(self, table: str) -> pd.DataFrame:
+        """The whole reference table (empty frame if the DB doesn't have it)."""
+        df = self._tables.get(table)
+        return pd.DataFrame() if df is None else df.copy(deep=False)
+
+    def _positions(self, table: str) -> dict:
+        index = self._row_index.get(table)
+        if index is None:
+            df = self._tables[table]
+            index = df.groupby("fantasypros_id", sort=False).indices if "fantasypros_id" in df else {}
+            self._row_index[table] = index
+        return index
+
+    def rows(self, table: str, ids: Iterable[str] = None) -> pd.DataFrame:
+        """Rows of ``table`` for the given fantasypros ids (all rows for None), in id order."""
+        df = self._tables.get(table)
+        if df is None:
+            return pd.DataFrame()
+        if ids is None:
+            return df.copy(deep=False)
+        index = self._positions(table)
+        hits = [index[i] for i in dict.fromkeys(str(i) for i in ids) if i in index]
+        if not hits:
+            return df.iloc[:0].copy(deep=False)
+        return df.take(np.concatenate(hits)).reset_index(drop=True)
+
+    def players(self, db) -> pd.DataFrame:
+        """The ``players`` table: static columns from the snapshot, draft state read now."""
+        live = pd.read_sql(f"SELECT id, {', '.join(LIVE_PLAYER_COLUMNS)} FROM players", db.engine)
+        return self._players.merge(live, on="id", how="left")
+
+
+def _key(db) -> tuple:
+    # The file's identity is part of the key, so a season.db swapped in with
+    # os.replace is never served from the old snapshot. A separate reference file is
+    # only ever rewritten by a refresh, so its mtime counts too; a plain season.db
+    # also takes every draft write, so there only the inode does (dispose_engine
+    # clears snapshots for files overwritten in place).
+    path = os.path.abspath(db.reference or db.path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return os.getpid(), path, None
+    return os.getpid(), path, (st.st_ino, st.st_mtime_ns if db.reference else None)
+
+
+def load(db=None) -> ReferenceSnapshot:
+    """The snapshot for ``db`` (a DatabaseManager; default ``DatabaseManager()``), read once per process."""
+    if db is None:
+        from blitz_env.models import DatabaseManager
+        db = DatabaseManager()
+    key = _key(db)
+    snap = _snapshots.get(key)
+    if snap is None:
+        with _lock:
+            snap = _snapshots.get(key)
+            if snap is None:
+                snap = ReferenceSnapshot.read(db)
+                for stale in [k for k in _snapshots if k[:2] == key[:2]]:
+                    del _snapshots[stale]
+                _snapshots[key] = snap
+    return snap
+
+
+def get(db) -> ReferenceSnapshot:
+    """The already-loaded snapshot for ``db``'s reference data, or None."""
+    if not _snapshots:
+        return None
+    return _snapshots.get(_key(db))
+
+
+def clear(path: str = None):
+    """Drop the snapshot for ``path`` (or every snapshot) in this process."""
+    with _lock:
+        for key in list(_snapshots):
+            if key[0] == os.getpid() and (path is None or key[1] == os.path.abspath(path)):
+                del _snapshots[key]
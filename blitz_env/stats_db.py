@@ -1,45 +1,59 @@
 import pandas as pd
 import re
 
+from blitz_env.fetch import fantasypros_url, fetch, map_concurrent
+from blitz_env.fp_numeric import coerce_numeric
+
 # NOTE: `requests`/`bs4`/`nfl_data_py` are intentionally NOT imported at module load.
 # They are only needed by the FantasyPros scrapers below (used by the offline data
-# collectors, not at bot runtime), so they're imported lazily inside fp_stats_dynamic.
+# collectors, not at bot runtime), so they're imported lazily (bs4 in fp_stats_dynamic,
+# requests inside blitz_env.fetch).
 # This keeps `import blitz_env` lean inside the container.
 
 def fp_seasonal_years(page, years):
-    dfs = []
-    for year in years:
+    def one(year):
         df = fp_stats_dynamic(page, year=year)
         df["season"] = year
-        dfs.append(df)
-    return pd.concat(dfs).reset_index()
+        return df
+    return pd.concat(map_concurrent(one, years)).reset_index()
 
 def fp_weekly_years(page, years):
-    dfs = []
-    for year in years:
-        # Note this may fail for historical data
-        for week in range(1, 19):
-            # try:
-                df = fp_stats_dynamic(page, year=year, range="week", week=week)
-                df["week"] = week
-                df["season"] = year
-                dfs.append(df)
-            # except:
-            #     print(f"Failed to get week {week}")
-    return pd.concat(dfs).reset_index()
+    # Every (year, week) page is independent; fetch them concurrently (bounded by
+    # blitz_env.fetch's politeness limit) and keep the serial order in the result.
+    # Note this may fail for historical data
+    def one(job):
+        year, week = job
+        df = fp_stats_dynamic(page, year=year, range="week", week=week)
+        df["week"] = week
+        df["season"] = year
+        return df
+    jobs = [(year, week) for year in years for week in range(1, 19)]
+    return pd.concat(map_concurrent(one, jobs)).reset_index()
 
 def fp_stats_dynamic(page, **kwargs):
-    import requests
-    from bs4 import BeautifulSoup
-
-    url_query = f"https://www.fantasypros.com/nfl/stats/{page}.php"
+    url_query = fantasypros_url(f"nfl/stats/{page}.php")
     params = kwargs
-    response = requests.get(url_query, params=params)
+    response = fetch(url_query, params=params, season=params.get('year'), week=params.get('week'))
 
     if response.status_code != 200:
         raise Exception(f"Failed to retrieve data: Status code {response.status_code}")
 
-    content = response.content
+    return fp_stats_parse(response.content, page, params)
+
+def fp_stats_parse(content, page, params):
+    """Parse a FantasyPros stats page: the lxml reader (blitz_env.fp_table) when it
+    can, the BeautifulSoup parser otherwise."""
+    try:
+        from blitz_env.fp_table import stats_frame
+        stats_df = stats_frame(content, page, params)
+    except (ImportError, ValueError) as e:  # lxml missing, or a page of another shape
+        print(f"Warning: lxml reader failed on stats page {page!r} ({e}); using BeautifulSoup")
+        stats_df = fp_stats_parse_bs4(content, page, params)
+    return _coerce_stats(stats_df)
+
+def fp_stats_parse_bs4(content, page, params):
+    from bs4 import BeautifulSoup
+
     soup = BeautifulSoup(content, 'html.parser')
 
     # Find the table with id 'data'
@@ -134,22 +148,10 @@ def fp_stats_dynamic(page, **kwargs):
     columns = ['year', 'week', 'fantasypros_id', 'player_name', 'position', 'team', 'pos_rank'] + stats_columns[1:]
 
     # Create DataFrame
-    stats_df = pd.DataFrame(data, columns=columns)
+    return pd.DataFrame(data, columns=columns)
 
-    # Identify numeric columns dynamically
+def _coerce_stats(stats_df):
+    # Every stat column in one vectorized pass (commas, %, ROST -> fraction, compact dtypes)
     non_numeric_cols = ['year', 'week', 'fantasypros_id', 'player_name', 'position', 'team', 'pos_rank']
-    for col in stats_df.columns:
-        if col not in non_numeric_cols:
-            # Clean and convert to numeric
-            stats_df[col] = stats_df[col].str.replace(',', '').str.rstrip('%')
-            stats_df[col] = pd.to_numeric(stats_df[col], errors='coerce')
-
-    # Convert 'ROST' column to float percentage if it exists
-    rost_col = [col for col in stats_df.columns if 'ROST' in col.upper()]
-    if rost_col:
-        col = rost_col[0]
-        stats_df[col] = stats_df[col] / 100.0
-
-    # Return stats DataFrame
-    return stats_df
+    return coerce_numeric(stats_df, non_numeric_cols, counts=True)
 
@@ -1,5 +1,6 @@
 from blitz_env import WaiverClaim, AttemptedFantasyActions
 from blitz_env.models import DatabaseManager
+from blitz_env.positions import eligible_for
 import pandas as pd
 import json
 
@@ -108,13 +109,8 @@ def draft_player() -> str:
         # load all of the available players into a pandas dataframe
         df = pd.read_sql("SELECT * FROM players where availability = 'AVAILABLE'", db.engine)
 
-        # expand the allowed_position json strings into a set
-        df["allowed_positions_set"] = df["allowed_positions"].apply(
-            lambda x: set(json.loads(x)) if x else set()
-        )
-
-        # apply the filtered posiions
-        filtered_df = df[df["allowed_positions_set"].apply(lambda s: bool(s & position_filter))]
+        # apply the filtered positions (one bitwise AND over players.position_mask)
+        filtered_df = df[eligible_for(df, position_filter)]
         filtered_df_sorted = filtered_df.sort_values(by="rank", ascending=True)
 
         if not filtered_df_sorted.empty:
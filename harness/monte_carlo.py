@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Monte Carlo draft evaluation: run many drafts in parallel and score them.
+
+Each draft seats every strategy under test at a random draft slot, fills the other
+seats with opponent strategies, runs the draft and scores each team's best possible
+season (harness.score_game). Drafts run in a process pool; every worker owns a
+private scratch copy of season.db, so no two drafts share a SQLite file.
+
+A strategy is either a callable (a bot's zero-argument ``draft_player`` or an
+``in_memory_strategy``) or the path to a bot file defining ``draft_player``::
+
+    python -m harness.monte_carlo --year 2025 --drafts 500 \\
+        --bot bots/nfl2025/standard-bot.py --bot bots/nfl2025/mitch_bot.py \\
+        --opponents best_available bots/nfl2025/ryan_bot.py
+
+``--opponents`` (default ``best_available``, the built-in best-ranked pick) takes
+bot files or built-in names; each opponent seat draws one at random.
+"""
+
+import argparse
+import importlib.util
+import os
+import random
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Union
+
+import numpy as np
+import pandas as pd
+
+from blitz_env.bootstrap_data import get_season_db_path
+from blitz_env.models import DatabaseManager
+from harness import simulate_draft as sd
+
+Strategy = Union[Callable, str]
+
+# Opponent strategies selectable by name from the command line
+BUILTIN_OPPONENTS = {"best_available": sd.best_available_strategy}
+
+# Per-worker state, set up once by _init_worker.
+_worker = {}
+
+
+def load_bot_strategy(path: str) -> Callable[[], str]:
+    """Import a bot file and return its ``draft_player``."""
+    name = os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.draft_player
+
+
+def _resolve(strategies: Dict[str, Strategy]) -> Dict[str, Callable]:
+    return {name: load_bot_strategy(s) if isinstance(s, str) else s for name, s in strategies.items()}
+
+
+def _init_worker(scratch_root, year, season_path, strategies, opponents):
+    scratch = tempfile.mkdtemp(dir=scratch_root)
+    # Bots construct DatabaseManager() with no arguments, so bind this worker's
+    # scratch DB through the per-process env var.
+    os.environ[DatabaseManager.ENV_VAR] = os.path.join(scratch, "gamestate.db")
+    sd.init_database(year, season_path=season_path)
+    _worker.update(
+        year=year,
+        strategies=_resolve(strategies),
+        opponents=_resolve(opponents),
+        fresh=True,
+    )
+
+
+def _run_one(draft: int, seed: int):
+    from harness.score_game import get_season_scores
+
+    year = _worker["year"]
+    if not _worker.pop("fresh", False):
+        sd.reset_league(year)
+    rng = random.Random(seed)
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+
+    db = DatabaseManager()
+    try:
+        bots = sorted(db.get_all_bots(), key=lambda b: b.draft_order)
+    finally:
+        db.close()
+
+    # Strategies under test take random seats; opponents fill the rest.
+    seats = rng.sample(range(len(bots)), len(bots))
+    names = list(_worker["strategies"])
+    opponent_names = list(_worker["opponents"])
+    assignment = {}
+    for i, seat in enumerate(seats):
+        if i < len(names):
+            assignment[bots[seat].id] = (names[i], _worker["strategies"][names[i]])
+        else:
+            name = rng.choice(opponent_names)
+            assignment[bots[seat].id] = (name, _worker["opponents"][name])
+
+    sd.run_draft({bot_id: strategy for bot_id, (_, strategy) in assignment.items()})
+
+    db = DatabaseManager()
+    try:
+        scores = get_season_scores(db, year)
+    finally:
+        db.close()
+    ranked = sorted(scores, key=scores.get, reverse=True)
+    return [
+        {
+            "draft": draft,
+            "bot_id": bot.id,
+            "draft_order": bot.draft_order,
+            "strategy": assignment[bot.id][0],
+            "is_candidate": assignment[bot.id][0] in names,
+            "score": float(scores[bot.id]),
+            "rank": ranked.index(bot.id) + 1,
+        }
+        for bot in bots
+    ]
+
+
+def run_monte_carlo(strategies: Dict[str, Strategy], year: int, n_drafts: int,
+                    opponents: Dict[str, Strategy] = None, workers: int = None,
+                    seed: int = None, season_path: str = None) -> pd.DataFrame:
+    """Run ``n_drafts`` scored drafts across a process pool.
+
+    Returns one row per team per draft: draft, bot_id, draft_order, strategy,
+    is_candidate, score and rank (1 = best season score in that draft).
+    """
+    if opponents is None:
+        opponents = dict(BUILTIN_OPPONENTS)
+    season_path = season_path or get_season_db_path(year)
+    if not os.path.isfile(season_path):
+        raise FileNotFoundError(
+            f"season.db not found at '{season_path}'. Run "
+            f"`make bootstrap-data-build-season YEAR={year}` first."
+        )
+    seeds = np.random.SeedSequence(seed).generate_state(n_drafts)
+    workers = workers or os.cpu_count() or 1
+
+    scratch_root = tempfile.mkdtemp(prefix="botblitz-mc-")
+    try:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(scratch_root, year, season_path, strategies, opponents),
+        ) as pool:
+            rows = [row for draft in pool.map(_run_one, range(n_drafts), [int(s) for s in seeds])
+                    for row in draft]
+    finally:
+        shutil.rmtree(scratch_root, ignore_errors=True)
+    return pd.DataFrame(rows)
+
+
+def summarize(results: pd.DataFrame) -> pd.DataFrame:
+    """Season-score distribution per strategy."""
+    grouped = results.groupby("strategy")
+    summary = grouped["score"].describe(percentiles=[0.1, 0.5, 0.9])
+    summary["mean_rank"] = grouped["rank"].mean()
+    summary["win_rate"] = grouped["rank"].apply(lambda r: (r == 1).mean())
+    return summary.sort_values("mean", ascending=False)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Run many simulated drafts in parallel and compare strategies.")
+    parser.add_argument("--year", type=int, required=True)
+    parser.add_argument("--drafts", type=int, default=100)
+    parser.add_argument("--bot", action="append", default=[], help="Bot file to evaluate (repeatable).")
+    parser.add_argument("--opponents", nargs="+", default=["best_available"],
+                        help="Opponent strategies: bot files or built-ins "
+                             f"({', '.join(BUILTIN_OPPONENTS)}). Each opponent seat draws one at random.")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--season-path", default=None)
+    parser.add_argument("--out", default=None, help="Optional CSV path for the per-team results.")
+    args = parser.parse_args(argv)
+
+    strategies = {os.path.basename(path): path for path in args.bot}
+    opponents = {}
+    for name in args.opponents:
+        if name in BUILTIN_OPPONENTS:
+            opponents[name] = BUILTIN_OPPONENTS[name]
+        elif os.path.isfile(name):
+            opponents[os.path.basename(name)] = name
+        else:
+            parser.error(f"--opponents: {name!r} is neither a bot file nor one of {sorted(BUILTIN_OPPONENTS)}")
+    results = run_monte_carlo(strategies, args.year, args.drafts, opponents=opponents,
+                              workers=args.workers, seed=args.seed, season_path=args.season_path)
+    if args.out:
+        results.to_csv(args.out, index=False)
+    print(summarize(results).to_string())
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
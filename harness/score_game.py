@@ -4,120 +4,116 @@ import argparse
 import sys
 import os
 from blitz_env.models import DatabaseManager, Player, Bot, LeagueSettings
+from blitz_env.lineup import solve_lineups
 from rich.console import Console
 from rich.table import Table
 from rich import box
 import numpy as np
 import matplotlib.pyplot as plt
 
-def get_points(db, player, year, week):
-    df = db.get_weekly_data(player)
-    try:
-        data_row = df[(df["season"] == year) & (df["week"] == week)]
-        if "fantasy_points_ppr" in data_row.columns:
-            return data_row["fantasy_points_ppr"].iloc[0]
-        else:
-            return data_row["FPTS"].iloc[0]
-    except IndexError:
-        return 0  # Player did not play that week
-
-def create_slot_objects(player_slots_dict):
-    """Convert player_slots dict to slot objects with allowed_player_positions."""
-    class Slot:
-        def __init__(self, allowed_positions):
-            self.allowed_player_positions = allowed_positions
-            self.assigned_player_id = None
-    
-    slots = []
-    for position, count in player_slots_dict.items():
-        if position == "FLEX":
-            allowed_positions = ["RB", "WR", "TE"]
-        elif position == "SUPERFLEX":
-            allowed_positions = ["QB", "RB", "WR", "TE"]
-        else:
-            # Regular positions
-            allowed_positions = [position]
-        
-        for _ in range(count):
-            slots.append(Slot(allowed_positions))
-    
-    return slots
-
-def get_best_possible_score(db, players, player_slots_dict, year, week):
-    player_slots = create_slot_objects(player_slots_dict)
-
-    total_score = 0
-    used_player_ids = set()
-    player_contributions = {}  # New dictionary to track player contributions for the week
-    player_points = {}
-    for player in players:
-        player_points[player.id] = get_points(db, player, year, week)
-
-    # Sort slots by the size of allowed positions (ascending)
-    sorted_slots = sorted(player_slots, key=lambda slot: len(slot.allowed_player_positions))
-
-    # Helper function to find the best player for a given slot
-    def find_best_player_for_slot(slot):
-        best_player = None
-        best_points = -float('inf')
-
-        for player in players:
-            if player.id not in used_player_ids and any(pos in slot.allowed_player_positions for pos in player.allowed_positions):
-                points = player_points[player.id]
-                if points > best_points:
-                    best_points = points
-                    best_player = player
-
-        return best_player, best_points
-
-    # Assign players to slots
-    for slot in sorted_slots:
-        best_player, best_points = find_best_player_for_slot(slot)
-        if best_player:
-            total_score += best_points
-            used_player_ids.add(best_player.id)
-            slot.assigned_player_id = best_player.id  # Assign the player to the slot
-            # Track the player's contribution
-            player_contributions[best_player.id] = player_contributions.get(best_player.id, 0) + best_points
-    
-    return total_score, player_contributions, player_points
-
 total_weeks = 17
-def get_best_possible_score_season(db, players, player_slots_dict, year):
-    total_score = 0.0
-    season_contributions = {}  # Dictionary to accumulate player contributions over the season
-    season_player_points = {}
 
-    for week in range(1, total_weeks + 1):
-        weekly_score, weekly_contributions, weekly_player_points = get_best_possible_score(db, players, player_slots_dict, year, week)
-        total_score += weekly_score
+class SeasonPoints:
+    """Dense (players x weeks) matrix of weekly fantasy points for one season.
 
-        # Accumulate weekly contributions into season contributions
-        for player_id, points in weekly_contributions.items():
-            season_contributions[player_id] = season_contributions.get(player_id, 0) + points
-        for player_id, points in weekly_player_points.items():
-            season_player_points[player_id] = season_player_points.get(player_id, 0) + points
-    return total_score, season_contributions, season_player_points
+    Built once per scoring run from a single weekly_stats read, then shared by the
+    per-week, per-season and weekly-ranking scorers. Column ``w - 1`` holds week
+    ``w``; a player who did not play (or is not in weekly_stats) scores 0.
+    """
 
-def get_weekly_rankings(db, year):
-    """Calculate weekly rankings for each team throughout the season."""
-    weekly_rankings = {}  # team_id -> list of weekly ranks (1-based)
+    def __init__(self, player_ids, points: np.ndarray):
+        self.player_ids = list(player_ids)
+        self.row = {pid: i for i, pid in enumerate(self.player_ids)}
+        self.points = points
+
+    def get(self, player_id, week) -> float:
+        i = self.row.get(player_id)
+        if i is None or not 1 <= week <= self.points.shape[1]:
+            return 0
+        return self.points[i, week - 1]
+
+    def matrix(self, players, weeks) -> np.ndarray:
+        """(len(players) x len(weeks)) slice; players missing from the matrix score 0."""
+        padded = np.vstack([self.points, np.zeros((1, self.points.shape[1]))])
+        rows = [self.row.get(p.id, len(self.player_ids)) for p in players]
+        return padded[np.ix_(rows, np.asarray(weeks, dtype=np.int64) - 1)]
+
+
+def build_season_points(db, players, year, weeks=total_weeks) -> SeasonPoints:
+    player_ids = list(dict.fromkeys(p.id for p in players))
+    points = np.zeros((len(player_ids), weeks), dtype=np.float64)
+    df = db.get_weekly_data_many(player_ids, seasons=[year])
+    if not df.empty:
+        column = "fantasy_points_ppr" if "fantasy_points_ppr" in df.columns else "FPTS"
+        df = df[~df.index.duplicated(keep="first")].reset_index()
+        df = df[df["week"].between(1, weeks)]
+        row = {pid: i for i, pid in enumerate(player_ids)}
+        rows = df["fantasypros_id"].map(row).to_numpy()
+        cols = df["week"].to_numpy(dtype=np.int64) - 1
+        points[rows, cols] = np.nan_to_num(df[column].to_numpy(dtype=np.float64, na_value=np.nan))
+    return SeasonPoints(player_ids, points)
+
+
+def get_points(db, player, year, week, season_points=None):
+    if season_points is None:
+        season_points = build_season_points(db, [player], year)
+    return season_points.get(player.id, week)
+
+def _best_possible(players, player_slots_dict, season_points, weeks):
+    """Solve one roster's optimal lineup for every week in ``weeks`` in one batch."""
+    points = season_points.matrix(players, weeks)
+    result = solve_lineups(points[None], [[p.allowed_positions for p in players]], player_slots_dict)
+    player_contributions = {}
+    player_points = {}
+    for i, player in enumerate(players):
+        player_points[player.id] = points[i].sum()
+        if (result.slots[0, i] >= 0).any():
+            player_contributions[player.id] = result.contributions[0, i].sum()
+    return result.scores[0].sum(), player_contributions, player_points
+
+def get_best_possible_score(db, players, player_slots_dict, year, week, season_points=None):
+    if season_points is None:
+        season_points = build_season_points(db, players, year)
+    return _best_possible(players, player_slots_dict, season_points, [week])
+
+def get_best_possible_score_season(db, players, player_slots_dict, year, season_points=None):
+    if season_points is None:
+        season_points = build_season_points(db, players, year)
+    return _best_possible(players, player_slots_dict, season_points, range(1, total_weeks + 1))
+
+def get_league_weekly_scores(db, year, season_points=None):
+    """Best possible lineup score for every team and week, solved in one batch.
+
+    Returns ``(bots, scores)`` where ``scores[t, w - 1]`` is ``bots[t]``'s week ``w``.
+    """
     bots = db.get_all_bots()
     settings = db.get_league_settings()
+    players = db.get_all_players()
+    rosters = [[player for player in players if player.current_bot_id == bot.id] for bot in bots]
+    if season_points is None:
+        season_points = build_season_points(db, [p for roster in rosters for p in roster], year)
+
+    # Every team x every week in one batch; short rosters are zero-padded
+    max_roster = max((len(roster) for roster in rosters), default=0)
+    points = np.zeros((len(bots), max_roster, total_weeks))
+    for t, roster in enumerate(rosters):
+        if roster:
+            points[t, :len(roster)] = season_points.matrix(roster, range(1, total_weeks + 1))
+    positions = [[p.allowed_positions for p in roster] for roster in rosters]
+    return bots, solve_lineups(points, positions, settings.player_slots).scores
+
+def get_season_scores(db, year, season_points=None):
+    """Best possible season score per bot id."""
+    bots, weekly_scores = get_league_weekly_scores(db, year, season_points)
+    return {bot.id: weekly_scores[t].sum() for t, bot in enumerate(bots)}
+
+def get_weekly_rankings(db, year, season_points=None):
+    """Calculate weekly rankings for each team throughout the season."""
+    weekly_rankings = {}  # team_id -> list of weekly ranks (1-based)
+    bots, weekly_scores = get_league_weekly_scores(db, year, season_points)
 
     for week in range(1, total_weeks + 1):
-        team_scores = []
-
-        for bot in bots:
-            # Get the players drafted by the team
-            team_players = [player for player in db.get_all_players() if player.current_bot_id == bot.id]
-
-            # Compute the team's best possible score for this week
-            best_possible_score, _, _ = get_best_possible_score(
-                db, team_players, settings.player_slots, year, week
-            )
-            
-            team_scores.append((bot.id, best_possible_score))
+        team_scores = [(bot.id, weekly_scores[t, week - 1]) for t, bot in enumerate(bots)]
         
         # Sort by score (descending) and assign ranks
         team_scores.sort(key=lambda x: x[1], reverse=True)
@@ -504,9 +500,7 @@ def main():
 
     # Connect to the database
     try:
-        # Update the DatabaseManager to use the provided path
-        DatabaseManager.DB_URL = f"sqlite:///{database_path}"
-        db = DatabaseManager()
+        db = DatabaseManager(path=database_path)
     except Exception as e:
         print(f"Error connecting to database '{database_path}': {e}")
         sys.exit(1)
@@ -523,21 +517,26 @@ def main():
         player_total_points = {}
         team_scores = []
         team_scores_with_ids = []
+        players = db.get_all_players()
+        # One weekly_stats read for every drafted player, shared by all scorers below
+        season_points = build_season_points(
+            db, [player for player in players if player.current_bot_id is not None], settings.year
+        )
 
         # Compute best possible score and player contributions for each team
         for bot in db.get_all_bots():
             # Get the players drafted by the team
-            team_players = [player for player in db.get_all_players() if player.current_bot_id == bot.id]
+            team_players = [player for player in players if player.current_bot_id == bot.id]
 
             if week is not None:
                 # Compute the team's best possible score for the specified week
                 best_possible_score, team_contributions, team_points = get_best_possible_score(
-                    db, team_players, settings.player_slots, settings.year, week
+                    db, team_players, settings.player_slots, settings.year, week, season_points
                 )
             else:
                 # Compute the team's best possible score over the season and player contributions
                 best_possible_score, team_contributions, team_points = get_best_possible_score_season(
-                    db, team_players, settings.player_slots, settings.year
+                    db, team_players, settings.player_slots, settings.year, season_points
                 )
 
             # Append to the list with team ID for weekly rankings, owner name for display
@@ -569,7 +568,7 @@ def main():
         # If scoring the full season, also print weekly rankings summary
         if week is None:
             print("\n" + "="*80)
-            weekly_rankings = get_weekly_rankings(db, settings.year)
+            weekly_rankings = get_weekly_rankings(db, settings.year, season_points)
             print_weekly_rankings_summary(db, weekly_rankings, team_scores_with_ids)
 
     finally:
@@ -596,9 +595,7 @@ def score_draft_for_visualization(database_path='gamestate.db', week=None):
 
     # Connect to the database
     try:
-        # Update the DatabaseManager to use the provided path
-        DatabaseManager.DB_URL = f"sqlite:///{database_path}"
-        db = DatabaseManager()
+        db = DatabaseManager(path=database_path)
     except Exception as e:
         raise RuntimeError(f"Error connecting to database '{database_path}': {e}")
 
@@ -615,6 +612,9 @@ def score_draft_for_visualization(database_path='gamestate.db', week=None):
         team_scores_with_ids = []
         bots = db.get_all_bots()
         players = db.get_all_players()
+        season_points = build_season_points(
+            db, [player for player in players if player.current_bot_id is not None], settings.year
+        )
 
         # Compute best possible score and player contributions for each team
         for bot in bots:
@@ -623,12 +623,12 @@ def score_draft_for_visualization(database_path='gamestate.db', week=None):
             if week is not None:
                 # Compute the team's best possible score for the specified week
                 best_possible_score, team_contributions, team_points = get_best_possible_score(
-                    db, team_players, settings.player_slots, settings.year, week
+                    db, team_players, settings.player_slots, settings.year, week, season_points
                 )
             else:
                 # Compute the team's best possible score over the season and player contributions
                 best_possible_score, team_contributions, team_points = get_best_possible_score_season(
-                    db, team_players, settings.player_slots, settings.year
+                    db, team_players, settings.player_slots, settings.year, season_points
                 )
 
             # Append to the list with team ID for weekly rankings, owner name for display
@@ -645,7 +645,7 @@ def score_draft_for_visualization(database_path='gamestate.db', week=None):
         # Calculate weekly rankings if full season
         weekly_rankings = None
         if week is None:
-            weekly_rankings = get_weekly_rankings(db, settings.year)
+            weekly_rankings = get_weekly_rankings(db, settings.year, season_points)
 
         # Create matplotlib visualization
         print_visualization_matplotlib(
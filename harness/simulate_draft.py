@@ -1,5 +1,5 @@
 from typing import Callable, List, Dict, Tuple
-from blitz_env.models import DatabaseManager, Player, Bot, LeagueSettings, GameStatus
+from blitz_env.models import DatabaseManager, Player, Bot, LeagueSettings, GameStatus, dispose_engine
 import matplotlib.pyplot as plt
 import matplotlib.patches as patches
 import textwrap
@@ -7,14 +7,16 @@ import os
 import random
 import shutil
 from blitz_env.bootstrap_data import get_season_db_path
+import numpy as np
 import pandas as pd
+from sqlalchemy import update
 
 
 def is_drafted(player: Player) -> bool:
     return player.availability in ('DRAFTED', 'ON_HOLD')
 
 
-def init_database(year: int):
+def init_database(year: int, season_path: str = None):
     """Reset the harness scratch DB from the prebuilt season.db and seed league state.
 
     Copies the tracked, read-only season.db to the scratch DB that DatabaseManager
@@ -22,19 +24,31 @@ def init_database(year: int):
     settings, game status). Stats/projections come from the copied season.db — no
     network, no per-run stats copying.
     """
-    season_db = get_season_db_path(year)
+    season_db = season_path or get_season_db_path(year)
     if not os.path.isfile(season_db):
         raise FileNotFoundError(
             f"season.db not found at '{season_db}'. Run "
             f"`make bootstrap-data-build-season YEAR={year}` first."
         )
 
-    # DatabaseManager.DB_URL looks like 'sqlite:///<path>'; copy the prebuilt DB there.
-    scratch_path = DatabaseManager.DB_URL.replace("sqlite:///", "", 1)
+    # The scratch URL looks like 'sqlite:///<path>'; copy the prebuilt DB there, dropping
+    # any pooled connections to the file being replaced.
+    scratch_url = DatabaseManager.resolve_url()
+    scratch_path = scratch_url.replace("sqlite:///", "", 1)
     if os.path.dirname(scratch_path):
         os.makedirs(os.path.dirname(scratch_path), exist_ok=True)
+    dispose_engine(scratch_url)
     shutil.copyfile(season_db, scratch_path)
 
+    reset_league(year)
+
+
+def reset_league(year: int):
+    """(Re)seed league state and clear all picks in the current scratch DB.
+
+    init_database does this after copying season.db; callers running many drafts
+    against one scratch copy (harness.monte_carlo) call it between drafts instead.
+    """
     db = DatabaseManager()  # create_all() adds the empty league-state tables
     try:
         # fresh league state
@@ -95,7 +109,7 @@ def default_draft_strategy() -> str:
         best_player = (
             db.session.query(Player)
             .filter(Player.availability == 'AVAILABLE')
-            .order_by(Player.rank)
+            .order_by(Player.rank.asc().nulls_last())
             .first()
         )
         return best_player.id if best_player else ""
@@ -136,33 +150,157 @@ def get_picking_team_id(pick: int) -> str:
         db.close()
 
 
-def run_draft(draft_strategy_map: Dict[str, Callable[[], str]]):
+def _rank_key(rank) -> tuple:
+    missing = rank is None or rank != rank  # NaN != NaN
+    return (missing, 0 if missing else rank)
+
+
+class DraftState:
+    """In-memory draft state that drives run_draft without a DB round-trip per pick.
+
+    Holds the player availability bitmap, the precomputed (snake) pick order and a
+    rank-sorted index of players, all loaded once from the DB. Picks are applied here
+    and queued; flush() writes the queued picks plus the game status back in a single
+    commit (write-behind).
+    """
+
+    def __init__(self, player_ids: List[str], ranks: List[int], bot_ids: List[str],
+                 total_rounds: int, is_snake: bool = True, current_pick: int = 1,
+                 drafted_ids=()):
+        # unranked players (NULL/NaN rank) sort last, as in default_draft_strategy
+        order = sorted(range(len(player_ids)), key=lambda i: _rank_key(ranks[i]))
+        self.player_ids = [player_ids[i] for i in order]  # rank-sorted
+        self.index = {pid: i for i, pid in enumerate(self.player_ids)}
+        self.available = np.ones(len(self.player_ids), dtype=bool)
+        for pid in drafted_ids:
+            if pid in self.index:
+                self.available[self.index[pid]] = False
+        self._cursor = 0  # every rank-sorted slot before this is taken
+
+        self.bot_ids = list(bot_ids)  # by draft order
+        self.is_snake = is_snake
+        self.total_picks = total_rounds * len(self.bot_ids)
+        # pick_order[i] is the bot on the clock for pick i + 1
+        self.pick_order = [self._bot_id_for(pick) for pick in range(1, self.total_picks + 1)]
+
+        self.current_pick = current_pick
+        self.pending: List[Tuple[str, str, int]] = []  # (player_id, bot_id, pick) not yet flushed
+
+    @classmethod
+    def from_db(cls, db: DatabaseManager) -> "DraftState":
+        settings: LeagueSettings = db.get_league_settings()
+        if not settings:
+            raise RuntimeError("No league settings found; run init_database first.")
+        bots = sorted(db.get_all_bots(), key=lambda b: b.draft_order)
+        players = db.get_all_players()
+        status: GameStatus = db.get_game_status()
+        return cls(
+            player_ids=[p.id for p in players],
+            ranks=[p.rank for p in players],
+            bot_ids=[b.id for b in bots],
+            total_rounds=settings.total_rounds,
+            is_snake=settings.is_snake_draft if settings.is_snake_draft is not None else True,
+            current_pick=status.current_draft_pick or 1,
+            drafted_ids=[p.id for p in players if is_drafted(p)],
+        )
+
+    @property
+    def current_bot_id(self) -> str:
+        return self.bot_id_for_pick(self.current_pick)
+
+    def _bot_id_for(self, pick: int) -> str:
+        # same seat arithmetic as get_picking_team_index
+        num_bots = len(self.bot_ids)
+        round_number, pos_in_round = divmod(pick - 1, num_bots)
+        if self.is_snake and round_number % 2 == 1:
+            pos_in_round = num_bots - 1 - pos_in_round
+        return self.bot_ids[pos_in_round]
+
+    def bot_id_for_pick(self, pick: int) -> str:
+        if not self.bot_ids:
+            return "0"
+        if pick <= self.total_picks:
+            return self.pick_order[pick - 1]
+        return self._bot_id_for(pick)
+
+    def is_complete(self) -> bool:
+        return self.current_pick > self.total_picks
+
+    def is_available(self, player_id: str) -> bool:
+        i = self.index.get(player_id)
+        return i is not None and bool(self.available[i])
+
+    def best_available(self) -> str:
+        """Highest-ranked player still available ("" if the pool is empty)."""
+        while self._cursor < len(self.player_ids) and not self.available[self._cursor]:
+            self._cursor += 1
+        return self.player_ids[self._cursor] if self._cursor < len(self.player_ids) else ""
+
+    def make_pick(self, player_id: str):
+        """Apply the current bot's pick (if any) and advance to the next pick."""
+        if player_id:
+            i = self.index.get(player_id)
+            if i is not None:
+                if not self.available[i]:
+                    raise Exception(f"Player id: {player_id} already drafted")
+                self.available[i] = False
+                self.pending.append((player_id, self.current_bot_id, self.current_pick))
+        self.current_pick += 1
+
+    def flush(self, db: DatabaseManager):
+        """Write queued picks and the current game status to the DB in one commit."""
+        if self.pending:
+            db.session.execute(update(Player), [
+                {"id": pid, "availability": "DRAFTED", "current_bot_id": bot_id, "pick_chosen": pick}
+                for pid, bot_id, pick in self.pending
+            ])
+            self.pending = []
+        status = db.get_game_status()
+        status.current_draft_pick = self.current_pick
+        status.current_bot_id = self.current_bot_id
+        db.session.commit()
+
+
+def in_memory_strategy(strategy: Callable[[DraftState], str]) -> Callable[[DraftState], str]:
+    """Mark a draft strategy as reading only the in-memory DraftState.
+
+    Such strategies are called as ``strategy(state)`` and run_draft does not flush
+    to the DB before their pick. Unmarked strategies are the usual zero-argument bot
+    ``draft_player`` callables that read the DB, so queued picks are flushed first.
+    """
+    strategy.in_memory = True
+    return strategy
+
+
+@in_memory_strategy
+def best_available_strategy(state: DraftState) -> str:
+    """In-memory equivalent of default_draft_strategy: the best-ranked available player."""
+    return state.best_available()
+
+
+def run_draft(draft_strategy_map: Dict[str, Callable], checkpoint_every: int = None):
     """
     Execute the draft until completion using the provided per-bot strategies.
+
+    The loop runs against an in-memory DraftState. Picks are written to the DB only
+    before a DB-reading strategy is on the clock, every ``checkpoint_every`` picks
+    (if set), and once at the end.
     """
     db = DatabaseManager()
     try:
-        while not db.is_draft_complete():
-            status: GameStatus = db.get_game_status()
-            current_pick = status.current_draft_pick
-            current_bot_id = status.current_bot_id
-
-            draft_strategy = draft_strategy_map.get(current_bot_id, default_draft_strategy)
-            player_id = draft_strategy()
-
-            # Validate selection
-            player = db.get_player_by_id(player_id) if player_id else None
-            if player and is_drafted(player):
-                raise Exception(f"Player id: {player_id} already drafted")
-
-            # Apply pick
-            if player_id:
-                db.draft_player(player_id, current_bot_id, current_pick)
-
-            # Advance to next pick
-            next_pick = current_pick + 1
-            next_bot_id = get_picking_team_id(next_pick)
-            db.update_draft_pick(next_pick, next_bot_id)
+        state = DraftState.from_db(db)
+        while not state.is_complete():
+            draft_strategy = draft_strategy_map.get(state.current_bot_id, best_available_strategy)
+            if getattr(draft_strategy, "in_memory", False):
+                player_id = draft_strategy(state)
+            else:
+                state.flush(db)
+                player_id = draft_strategy()
+
+            state.make_pick(player_id)
+            if checkpoint_every and len(state.pending) >= checkpoint_every:
+                state.flush(db)
+        state.flush(db)
     finally:
         db.close()
 
@@ -175,12 +313,12 @@ def simulate_draft(draft_player: Callable[[], str], year: int):
     init_database(year)
     db = DatabaseManager()
     try:
-        draft_strategy_map: Dict[str, Callable[[], str]] = {}
+        draft_strategy_map: Dict[str, Callable] = {}
         bots: List[Bot] = db.get_all_bots()
 
-        # Default everyone to the generic strategy
+        # Default everyone to the generic (in-memory) best-available strategy
         for bot in bots:
-            draft_strategy_map[bot.id] = default_draft_strategy
+            draft_strategy_map[bot.id] = best_available_strategy
 
         # Make a random bot the "User"—use the provided draft callback for that bot
         user_bot = random.choice(bots)
@@ -188,14 +326,14 @@ def simulate_draft(draft_player: Callable[[], str], year: int):
         user_bot.name = "Your Bot"
         draft_strategy_map[user_bot.id] = draft_player
 
-        # All other bots use the built-in default_draft_strategy (set above).
+        # All other bots use the built-in best_available_strategy (set above).
 
         db.session.commit()
-
-        run_draft(draft_strategy_map)
     finally:
         db.close()
 
+    run_draft(draft_strategy_map)
+
 
 def wrap_text(text: str, width: int) -> str:
     return '\n'.join(textwrap.wrap(text, width))
@@ -20,6 +20,7 @@ import (
 
 	"google.golang.org/grpc"
 	"google.golang.org/grpc/credentials/insecure"
+	"google.golang.org/grpc/metadata"
 	"google.golang.org/protobuf/types/known/emptypb"
 )
 
@@ -292,7 +293,11 @@ func (e *BotEngine) callWeeklyFantasyActionsRPC(ctx context.Context, port string
 	client := common.NewAgentServiceClient(conn)
 
 	ctx, _ = context.WithTimeout(ctx, 60*time.Second)
-	selection, err := client.PerformWeeklyFantasyActions(ctx, nil)
+	var trailer metadata.MD
+	done := LogElapsed("PerformWeeklyFantasyActions RPC")
+	selection, err := client.PerformWeeklyFantasyActions(ctx, nil, grpc.Trailer(&trailer))
+	done()
+	LogBotMetrics("PerformWeeklyFantasyActions RPC", trailer)
 	if err != nil {
 		fmt.Println("Failed calling bot")
 		return nil, err
@@ -319,7 +324,11 @@ func (e *BotEngine) callDraftRPC(ctx context.Context, port string) (*common.Draf
 	client := common.NewAgentServiceClient(conn)
 
 	ctx, _ = context.WithTimeout(ctx, 60*time.Second)
-	selections, err := client.DraftPlayer(ctx, &emptypb.Empty{})
+	var trailer metadata.MD
+	done := LogElapsed("DraftPlayer RPC")
+	selections, err := client.DraftPlayer(ctx, &emptypb.Empty{}, grpc.Trailer(&trailer))
+	done()
+	LogBotMetrics("DraftPlayer RPC", trailer)
 	if err != nil {
 		fmt.Println("Failed calling bot")
 		return nil, err
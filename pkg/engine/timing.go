@@ -3,8 +3,14 @@ package engine
 import (
 	"fmt"
 	"time"
+
+	"google.golang.org/grpc/metadata"
 )
 
+// BotMetricsTrailerKey is the gRPC trailer py_grpc_server attaches its per-call
+// metrics to (JSON: spawn/import/compute/serialization ms, peak RSS, SQLite queries).
+const BotMetricsTrailerKey = "botblitz-metrics"
+
 // LogElapsed starts a stopwatch and returns a function that, when called, prints how
 // long elapsed since LogElapsed was invoked. It is meant for profiling where time goes
 // during an evaluation/engine run (draft vs season, per week, waivers vs scoring,
@@ -25,3 +31,11 @@ func LogElapsed(format string, args ...any) func() {
 		fmt.Printf("⏱  %s took %s\n", label, time.Since(start).Round(time.Millisecond))
 	}
 }
+
+// LogBotMetrics prints the per-call metrics a bot container reported in its gRPC
+// trailer, tagged like LogElapsed so the two can be read side by side.
+func LogBotMetrics(label string, trailer metadata.MD) {
+	for _, m := range trailer.Get(BotMetricsTrailerKey) {
+		fmt.Printf("⏱  %s bot metrics %s\n", label, m)
+	}
+}
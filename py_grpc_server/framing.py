@@ -0,0 +1,42 @@
+"""Length-prefixed frames exchanged between server.py and its bot workers.
+
+A frame is a 1-byte kind, a 4-byte big-endian payload length, then the payload.
+The server sends one ACTION frame per call; the worker answers with optional
+STDOUT/STDERR/METRICS frames followed by exactly one RESULT or ERROR frame.
+"""
+import struct
+
+ACTION = b"A"
+RESULT = b"R"
+ERROR = b"X"
+STDOUT = b"O"
+STDERR = b"E"
+METRICS = b"M"
+
+_HEADER = struct.Struct(">cI")
+
+
+def write_frame(f, kind: bytes, payload: bytes):
+    f.write(_HEADER.pack(kind, len(payload)) + payload)
+
+
+def _read_exact(f, n: int) -> bytes:
+    buf = b""
+    while len(buf) < n:
+        chunk = f.read(n - len(buf))
+        if not chunk:
+            return None
+        buf += chunk
+    return buf
+
+
+def read_frame(f):
+    """Next (kind, payload) from ``f``, or None if the other side closed the pipe."""
+    header = _read_exact(f, _HEADER.size)
+    if header is None:
+        return None
+    kind, length = _HEADER.unpack(header)
+    payload = _read_exact(f, length) if length else b""
+    if payload is None:
+        return None
+    return kind, payload
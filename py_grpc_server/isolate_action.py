@@ -1,19 +1,98 @@
-import os, sys
+import time
+STARTED_AT = time.time()
+
+import io, json, os, sys, traceback
+from contextlib import redirect_stdout, redirect_stderr
+import metrics
+metrics.install_sqlite_hooks()
 from blitz_env import DraftSelection
 from bot import draft_player, perform_weekly_fantasy_actions
 from google.protobuf.json_format import MessageToJson
+from framing import ACTION, RESULT, ERROR, STDOUT, STDERR, METRICS, read_frame, write_frame
+IMPORTED_AT = time.time()
+
+# Cap on the debug output shipped back per call for each of stdout and stderr
+MAX_DEBUG_CHARS = int(os.getenv("BOTBLITZ_MAX_DEBUG_CHARS", "65536"))
+
+
+class BoundedBuffer(io.TextIOBase):
+    """Text sink that keeps the first ``limit`` characters and counts the rest."""
+
+    def __init__(self, limit=MAX_DEBUG_CHARS):
+        self.limit = limit
+        self.parts = []
+        self.size = 0
+        self.dropped = 0
+
+    def writable(self):
+        return True
 
-fd = int(sys.argv[1])
-action = str(sys.argv[2])
+    def write(self, s):
+        room = self.limit - self.size
+        if room > 0:
+            self.parts.append(s[:room])
+            self.size += min(len(s), room)
+        self.dropped += max(0, len(s) - max(room, 0))
+        return len(s)
 
-with os.fdopen(fd, "w") as f:
-    serialized_response = ""
+    def getvalue(self):
+        text = "".join(self.parts)
+        if self.dropped:
+            text += f"\n... [{self.dropped} more characters truncated]"
+        return text
+
+
+def run_action(action):
     if action == "draft":
         player_id = draft_player()
-        response = DraftSelection(player_id=player_id)
-        serialized_response = MessageToJson(response)
+        return DraftSelection(player_id=player_id)
     elif action == "perform_weekly_fantasy_actions":
-        response = perform_weekly_fantasy_actions()
-        serialized_response = MessageToJson(response)
+        return perform_weekly_fantasy_actions()
+    raise ValueError(f"Unknown action: {action}")
+
+
+def serve(request_fd, response_fd, max_calls):
+    # Warm worker: `bot` is already imported above, so each call only pays for the
+    # bot's own logic. Exits after max_calls (0 = never) so the pool can recycle it.
+    calls = 0
+    with os.fdopen(request_fd, "rb") as requests, os.fdopen(response_fd, "wb") as responses:
+        while max_calls == 0 or calls < max_calls:
+            frame = read_frame(requests)
+            if frame is None:
+                break
+            kind, payload = frame
+            calls += 1
+            out, err = BoundedBuffer(), BoundedBuffer()
+            timer = metrics.CallTimer()
+            serialize_ms = 0.0
+            try:
+                with redirect_stdout(out), redirect_stderr(err), timer:
+                    response = run_action(payload.decode())
+                start = time.perf_counter()
+                result = (RESULT, response.SerializeToString())
+                serialize_ms = metrics.ms(time.perf_counter() - start)
+            except Exception:
+                result = (ERROR, traceback.format_exc().encode())
+            call_metrics = {
+                "started_at": STARTED_AT,
+                "imported_at": IMPORTED_AT,
+                "worker_call": calls,
+                "serialize_ms": serialize_ms,
+                **timer.as_dict(),
+            }
+            write_frame(responses, STDOUT, out.getvalue().encode())
+            write_frame(responses, STDERR, err.getvalue().encode())
+            write_frame(responses, METRICS, json.dumps(call_metrics).encode())
+            write_frame(responses, *result)
+            responses.flush()
+
 
-    f.write(serialized_response)
\ No newline at end of file
+if __name__ == "__main__":
+    if sys.argv[1] == "--serve":
+        serve(int(sys.argv[2]), int(sys.argv[3]), int(sys.argv[4]))
+    else:
+        # One-shot mode (manual debugging): write the JSON response to the given fd.
+        fd = int(sys.argv[1])
+        action = str(sys.argv[2])
+        with os.fdopen(fd, "w") as f:
+            f.write(MessageToJson(run_action(action)))
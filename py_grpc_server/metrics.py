@@ -0,0 +1,87 @@
+"""Per-RPC timing and resource metrics for the bot server.
+
+Workers time their start-up, the bot call and serialization, and count SQLite
+queries issued through SQLAlchemy (DatabaseManager, pandas.read_sql on its engine).
+server.py emits one JSON line per RPC and attaches the same JSON to the gRPC
+trailer ``botblitz-metrics`` so the Go engine can log it next to its timings.
+"""
+import json
+import resource
+import threading
+import time
+
+TRAILER_KEY = "botblitz-metrics"
+
+_sqlite = {"queries": 0, "seconds": 0.0}
+_sqlite_lock = threading.Lock()
+_hooks_installed = False
+
+
+def ms(seconds: float) -> float:
+    return round(seconds * 1000, 3)
+
+
+def install_sqlite_hooks():
+    """Count and time every statement run through any SQLAlchemy engine in this process."""
+    global _hooks_installed
+    if _hooks_installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("botblitz_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["botblitz_query_start"].pop()
+        with _sqlite_lock:
+            _sqlite["queries"] += 1
+            _sqlite["seconds"] += elapsed
+
+    _hooks_installed = True
+
+
+def sqlite_counters():
+    """(queries, seconds) so far in this process."""
+    with _sqlite_lock:
+        return _sqlite["queries"], _sqlite["seconds"]
+
+
+def peak_rss_kb() -> int:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+class CallTimer:
+    """Times one bot call and snapshots the SQLite counters around it."""
+
+    def __enter__(self):
+        self.queries, self.sql_seconds = sqlite_counters()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.compute_ms = ms(time.perf_counter() - self.start)
+        queries, sql_seconds = sqlite_counters()
+        self.sqlite_queries = queries - self.queries
+        self.sqlite_ms = ms(sql_seconds - self.sql_seconds)
+        return False
+
+    def as_dict(self):
+        return {
+            "compute_ms": self.compute_ms,
+            "sqlite_queries": self.sqlite_queries,
+            "sqlite_ms": self.sqlite_ms,
+            "peak_rss_kb": peak_rss_kb(),
+        }
+
+
+def emit(action: str, metrics: dict, context=None) -> str:
+    """Print the metrics as a JSON line and attach them to the RPC's trailing metadata."""
+    line = json.dumps({"event": "bot_rpc", "action": action, **metrics}, sort_keys=True)
+    print(line, flush=True)
+    if context is not None:
+        context.set_trailing_metadata(((TRAILER_KEY, line),))
+    return line
@@ -1,73 +1,91 @@
 from concurrent import futures
 import logging
-import subprocess, os, json
-from google.protobuf.json_format import ParseDict
-from blitz_env import DraftSelection, AttemptedFantasyActions
+import os
+import time
+from blitz_env import DraftSelection, AttemptedFantasyActions, snapshot
 
 import grpc
 from agent_pb2_grpc import AgentServiceServicer, add_AgentServiceServicer_to_server
+import metrics
+from worker_pool import BotError, WorkerPool
 
 # When BOTBLITZ_EVAL_INLINE=1 is set (evaluation path only), the bot module is imported
 # once at server startup so subsequent calls pay no Python cold-start cost. The
-# subprocess isolation path (production default) remains unchanged.
+# subprocess isolation path (production default) runs each call in a warm,
+# pre-forked worker process instead.
 _INLINE = os.getenv("BOTBLITZ_EVAL_INLINE") == "1"
 if _INLINE:
+    metrics.install_sqlite_hooks()
+    _import_start = time.perf_counter()
     import bot as _bot_module
+    _IMPORT_MS = metrics.ms(time.perf_counter() - _import_start)
     print("BOTBLITZ_EVAL_INLINE: bot module loaded, using in-process execution")
+    # Read the reference tables once; DatabaseManager accessors are then answered
+    # from memory and only league state is queried per call (see blitz_env.snapshot).
+    _snapshot_start = time.perf_counter()
+    try:
+        snapshot.load()
+    except Exception as e:
+        print(f"BOTBLITZ_EVAL_INLINE: reference snapshot unavailable ({e}); reading from SQLite")
+    _SNAPSHOT_MS = metrics.ms(time.perf_counter() - _snapshot_start)
+
+def _print_output(stdout: str, stderr: str):
+    print("Debug stdout:", stdout[:2000])
+    print("Debug stderr:", stderr[:2000])
+
 
 class AgentServiceServicer(AgentServiceServicer):
 
     def __init__(self):
+        self.pool = None if _INLINE else WorkerPool()
         print("Initialized gRPC server")
 
-    def perform_action_in_isolation(self, action):
-        # Create pipe for result communication
-        r, w = os.pipe()
-
-        # Start the subprocess
-        proc = subprocess.Popen(
-            ["python3", "isolate_action.py", str(w), action],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            pass_fds=(w,),
-        )
-
-        # Close the write end in the parent process
-        os.close(w)
-
-        # Send input and wait for completion in one call
-        stdout, stderr = proc.communicate()
-
-        # Now read the result from the pipe
-        with os.fdopen(r) as fr:
-            result = fr.read()
-
-        print("Debug stdout:", stdout[:2000])
-        print("Debug stderr:", stderr[:2000])
-        print("Result from pipe:", result[:200])
-
-        # Parse the result
-        if not result.strip():
-            raise Exception("No response from bot: " + stderr)
-
-        result_dict = json.loads(result)
-        return result_dict
+    def perform_action_in_isolation(self, action, response, context=None):
+        # Hand the action to a warm, pre-forked worker (see worker_pool.py); the
+        # result comes back as a serialized `response` message.
+        start = time.perf_counter()
+        try:
+            result, stdout, stderr, call_metrics = self.pool.call(action)
+            _print_output(stdout, stderr)
+            parse_start = time.perf_counter()
+            try:
+                response.ParseFromString(result)
+            except Exception as e:
+                raise BotError(f"Bot result is not a valid {type(response).__name__}: {e}", call_metrics) from e
+            call_metrics["parse_ms"] = metrics.ms(time.perf_counter() - parse_start)
+        except BotError as e:
+            # a crashing bot's output is the debug output that matters most
+            if e.stdout or e.stderr:
+                _print_output(e.stdout, e.stderr)
+            print("Bot error:", str(e)[:2000])
+            metrics.emit(action, {**e.metrics, "error": True, "rpc_ms": metrics.ms(time.perf_counter() - start)}, context)
+            raise
+
+        call_metrics["rpc_ms"] = metrics.ms(time.perf_counter() - start)
+        print("Result from pipe:", str(response)[:200])
+        metrics.emit(action, call_metrics, context)
+        return response
+
+    def perform_action_inline(self, action, fn, context=None):
+        timer = metrics.CallTimer()
+        with timer:
+            response = fn()
+        metrics.emit(action, {"import_ms": _IMPORT_MS, "snapshot_ms": _SNAPSHOT_MS, "inline": True, **timer.as_dict()}, context)
+        return response
 
     def DraftPlayer(self, request, context):
         if _INLINE:
-            player_id = _bot_module.draft_player()
+            player_id = self.perform_action_inline("draft", _bot_module.draft_player, context)
             return DraftSelection(player_id=player_id)
-        result_dict = self.perform_action_in_isolation("draft")
-        player_selection = ParseDict(result_dict, DraftSelection())
+        player_selection = self.perform_action_in_isolation("draft", DraftSelection(), context)
         return DraftSelection(player_id=player_selection.player_id)
 
     def PerformWeeklyFantasyActions(self, request, context):
         if _INLINE:
-            return _bot_module.perform_weekly_fantasy_actions()
-        result_dict = self.perform_action_in_isolation("perform_weekly_fantasy_actions")
-        return ParseDict(result_dict, AttemptedFantasyActions())
+            return self.perform_action_inline(
+                "perform_weekly_fantasy_actions", _bot_module.perform_weekly_fantasy_actions, context)
+        return self.perform_action_in_isolation(
+            "perform_weekly_fantasy_actions", AttemptedFantasyActions(), context)
 
 def serve():
     server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
@@ -0,0 +1,166 @@
+"""Pre-forked pool of warm bot workers for server.py.
+
+Spawning ``python3 isolate_action.py`` per RPC paid interpreter start-up plus the
+``bot`` import (pandas, SQLAlchemy, ...) on every call. Instead, the pool keeps
+``size`` worker processes started ahead of time: each has already imported ``bot``
+and blocks on its request pipe. A call hands the action to an idle worker over a
+framed pipe (see framing.py) and reads back its (bounded) stdout, stderr and the serialized protobuf result.
+
+Workers exit after ``max_calls`` calls (default 1, i.e. a fresh process per call,
+so no bot state leaks between calls) and a replacement is started immediately,
+warming up while the engine runs the rest of the turn. Note that module-level code
+in ``bot`` therefore runs when the worker starts, not when the call arrives.
+
+Tunables: ``BOTBLITZ_POOL_SIZE`` (default 1) and ``BOTBLITZ_WORKER_MAX_CALLS``
+(default 1; 0 = never recycle).
+"""
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from framing import ACTION, RESULT, ERROR, STDOUT, STDERR, METRICS, read_frame, write_frame
+from metrics import ms
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class BotError(Exception):
+    """The bot raised; ``metrics``, ``stdout`` and ``stderr`` hold what the worker
+    reported for the call."""
+
+    def __init__(self, message, metrics=None, stdout="", stderr=""):
+        super().__init__(message)
+        self.metrics = metrics or {}
+        self.stdout = stdout
+        self.stderr = stderr
+
+
+class BotWorker:
+    def __init__(self, max_calls: int, cwd: str = _HERE, script: str = "isolate_action.py"):
+        request_r, request_w = os.pipe()
+        response_r, response_w = os.pipe()
+        self.spawned_at = time.time()
+        self.proc = subprocess.Popen(
+            [sys.executable, script, "--serve", str(request_r), str(response_w), str(max_calls)],
+            cwd=cwd,
+            stdin=subprocess.DEVNULL,
+            pass_fds=(request_r, response_w),
+        )
+        # Close the child's ends in the parent
+        os.close(request_r)
+        os.close(response_w)
+        self.requests = os.fdopen(request_w, "wb", buffering=0)
+        self.responses = os.fdopen(response_r, "rb")
+        self.max_calls = max_calls
+        self.calls = 0
+
+    @property
+    def exhausted(self) -> bool:
+        return self.max_calls and self.calls >= self.max_calls
+
+    def call(self, action: str):
+        """Run ``action`` in the worker; returns (serialized result, stdout, stderr, metrics)."""
+        self.calls += 1
+        sent_at = time.time()
+        write_frame(self.requests, ACTION, action.encode())
+        stdout, stderr, reported = "", "", {}
+        while True:
+            frame = read_frame(self.responses)
+            if frame is None:
+                self.close()
+                raise BotError(f"Bot worker exited (code {self.proc.returncode}) without a response",
+                               stdout=stdout, stderr=stderr)
+            kind, payload = frame
+            if kind == STDOUT:
+                stdout = payload.decode(errors="replace")
+            elif kind == STDERR:
+                stderr = payload.decode(errors="replace")
+            elif kind == METRICS:
+                reported = json.loads(payload)
+            elif kind in (RESULT, ERROR):
+                metrics = self._metrics(reported, sent_at)
+                if kind == ERROR:
+                    raise BotError("Bot raised an exception: " + payload.decode(errors="replace"), metrics,
+                                   stdout, stderr)
+                return payload, stdout, stderr, metrics
+
+    def _metrics(self, reported: dict, sent_at: float) -> dict:
+        started_at = reported.pop("started_at", self.spawned_at)
+        imported_at = reported.pop("imported_at", started_at)
+        return {
+            "worker_pid": self.proc.pid,
+            # interpreter start-up, then blitz_env + bot imports
+            "spawn_ms": ms(started_at - self.spawned_at),
+            "import_ms": ms(imported_at - started_at),
+            # time this call spent waiting for the worker to finish warming up
+            "warmup_wait_ms": ms(max(0.0, imported_at - sent_at)),
+            "roundtrip_ms": ms(time.time() - sent_at),
+            **reported,
+        }
+
+    def close(self):
+        for f in (self.requests, self.responses):
+            try:
+                f.close()
+            except OSError:
+                pass
+        try:
+            self.proc.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+
+class WorkerPool:
+    def __init__(self, size: int = None, max_calls: int = None, **worker_kwargs):
+        self.size = max(1, size or int(os.getenv("BOTBLITZ_POOL_SIZE", "1")))
+        if max_calls is None:
+            max_calls = int(os.getenv("BOTBLITZ_WORKER_MAX_CALLS", "1"))
+        self.max_calls = max_calls
+        self.worker_kwargs = worker_kwargs
+        self._lock = threading.Lock()
+        self._idle = [self._spawn() for _ in range(self.size)]
+
+    def _spawn(self) -> BotWorker:
+        return BotWorker(self.max_calls, **self.worker_kwargs)
+
+    def _acquire(self) -> BotWorker:
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(0)
+        # More concurrent calls than warm workers: start one on demand
+        return self._spawn()
+
+    def _release(self, worker: BotWorker, healthy: bool):
+        if healthy and not worker.exhausted:
+            with self._lock:
+                self._idle.append(worker)
+            return
+        # Start the replacement first so it warms up while the old worker is reaped
+        with self._lock:
+            refill = len(self._idle) < self.size
+        if refill:
+            replacement = self._spawn()
+            with self._lock:
+                self._idle.append(replacement)
+        worker.close()
+
+    def call(self, action: str):
+        """Run ``action`` on a warm worker; returns (result, stdout, stderr, metrics)."""
+        worker = self._acquire()
+        healthy = False
+        try:
+            result = worker.call(action)
+            healthy = True
+            return result
+        finally:
+            self._release(worker, healthy)
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.close()
@@ -1,3 +1,8 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from blitz_env.bootstrap_data import build_season
 
@@ -9,3 +14,82 @@ def season_db_2025(tmp_path):
     path = tmp_path / "season.db"
     build_season(2025, stats_path=STATS_CACHE_2025, season_path=str(path))
     return str(path)
+
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+class StandInServer:
+    """Local stand-in for FantasyPros: serves fixture pages by path prefix."""
+
+    def __init__(self, pages):
+        self.pages = pages          # {"/nfl/stats/": html, ...}
+        self.hits = []              # request paths (with query), in arrival order
+        self.fail_first = 0         # answer the first N requests with 503
+        self.delay = 0.0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                with server._lock:
+                    server.hits.append(self.path)
+                    failing = len(server.hits) <= server.fail_first
+                    server.in_flight += 1
+                    server.max_in_flight = max(server.max_in_flight, server.in_flight)
+                try:
+                    time.sleep(server.delay)
+                    body = next((html for prefix, html in server.pages.items()
+                                 if self.path.startswith(prefix)), None)
+                    if failing or body is None:
+                        self.send_response(503 if failing else 404)
+                        self.end_headers()
+                        return
+                    data = body.encode()
+                    self.send_response(200)
+                    self.send_header("Content-Type", "text/html")
+                    self.send_header("Content-Length", str(len(data)))
+                    self.end_headers()
+                    self.wfile.write(data)
+                finally:
+                    with server._lock:
+                        server.in_flight -= 1
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def fantasypros_server(monkeypatch, tmp_path):
+    """Stand-in FantasyPros server; blitz_env.fetch is pointed at it with no backoff
+    and a private raw-response cache."""
+    from blitz_env import fetch
+
+    def read(name):
+        with open(os.path.join(FIXTURES, name)) as f:
+            return f.read()
+
+    server = StandInServer({
+        "/nfl/stats/": read("fp_stats_rb.html"),
+        "/nfl/projections/": read("fp_projections_rb.html"),
+        "/db_playerids.csv": read("db_playerids_sample.csv"),
+    })
+    monkeypatch.setenv("BOTBLITZ_FANTASYPROS_URL", server.url)
+    monkeypatch.setenv("BOTBLITZ_PLAYER_IDS_URL", f"{server.url}/db_playerids.csv")
+    monkeypatch.setenv("BOTBLITZ_FETCH_BACKOFF", "0")
+    monkeypatch.setenv("BOTBLITZ_HTTP_CACHE", str(tmp_path / "http_cache"))
+    monkeypatch.delenv("BOTBLITZ_HTTP_OFFLINE", raising=False)
+    fetch.reset_session()
+    yield server
+    fetch.reset_session()
+    server.close()
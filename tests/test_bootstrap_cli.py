@@ -12,3 +12,21 @@ def test_cli_build_season(tmp_path):
     conn = sqlite3.connect(season_db)
     assert conn.execute("SELECT COUNT(*) FROM players").fetchone()[0] > 0
     conn.close()
+
+
+
+def test_cli_build_season_warns_before_discarding_league_state(tmp_path, capsys):
+    season_db = tmp_path / "season.db"
+    args = ["build-season", "--year", "2025",
+            "--stats-path", "data/stats/2025/stats.db", "--season-path", str(season_db)]
+    assert main(args) == 0
+    conn = sqlite3.connect(season_db)
+    conn.execute("CREATE TABLE bots (id TEXT)")
+    conn.commit()
+    conn.close()
+    capsys.readouterr()
+    assert main(args) == 0
+    assert "discards its league state (bots)" in capsys.readouterr().out
+    conn = sqlite3.connect(season_db)
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'bots'").fetchone()[0] == 0
+    conn.close()
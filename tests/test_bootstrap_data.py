@@ -1,3 +1,4 @@
+import os
 import sqlite3
 from blitz_env.bootstrap_data import build_season
 
@@ -27,3 +28,151 @@ def test_build_season_materializes_reference_and_players(tmp_path):
     assert "matchups" not in tables
     assert "bots" not in tables
     conn.close()
+
+
+def test_build_season_types_keys_and_indexes_reference_tables(tmp_path):
+    from blitz_env.bootstrap_data import SEASON_SCHEMA_VERSION, get_schema_version
+
+    season_db = str(tmp_path / "season.db")
+    build_season(2025, stats_path=STATS_CACHE_2025, season_path=season_db)
+    assert get_schema_version(season_db) == SEASON_SCHEMA_VERSION
+
+    conn = sqlite3.connect(season_db)
+    for table in ("season_stats", "preseason_projections", "weekly_stats", "weekly_projections"):
+        types = dict(conn.execute(f"SELECT name, type FROM pragma_table_info('{table}')"))
+        assert types["year"] == types["season"] == types["week"] == "INTEGER"
+        assert conn.execute(f"SELECT COUNT(*) FROM {table} WHERE typeof(season) != 'integer'").fetchone()[0] == 0
+    indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='index'")}
+    assert "idx_weekly_stats_fantasypros_id_season_week" in indexes
+    assert "idx_season_stats_fantasypros_id_season" in indexes
+    plan = conn.execute("EXPLAIN QUERY PLAN SELECT * FROM weekly_stats WHERE fantasypros_id = '19788'").fetchall()
+    assert "USING INDEX" in plan[0][-1]
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0] > 0
+    conn.close()
+
+
+def test_build_season_reports_phase_timings_and_replaces_atomically(tmp_path):
+    from blitz_env.bootstrap_data import BUILD_PHASES
+
+    season_db = tmp_path / "season.db"
+    season_db.write_bytes(b"stale")
+    timings = {}
+    build_season(2025, stats_path=STATS_CACHE_2025, season_path=str(season_db), timings=timings)
+
+    assert list(timings) == list(BUILD_PHASES)
+    assert all(ms >= 0 for ms in timings.values())
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["season.db"]  # no .build / journal left
+    conn = sqlite3.connect(season_db)
+    assert conn.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert conn.execute("PRAGMA freelist_count").fetchone()[0] == 0
+    conn.close()
+
+
+def test_build_all_builds_in_parallel_and_skips_unchanged_seasons(tmp_path):
+    import shutil
+    from blitz_env.bootstrap_data import build_all, read_manifest
+
+    def paths(year):
+        stats = tmp_path / "stats" / f"{year}.db"
+        return str(stats), str(tmp_path / str(year) / "season.db")
+
+    (tmp_path / "stats").mkdir()
+    for year in (2024, 2025):
+        shutil.copy(STATS_CACHE_2025, paths(year)[0])
+
+    first = build_all([2025, 2024], workers=2, paths=paths)
+    assert {y: r["status"] for y, r in first.items()} == {2024: "built", 2025: "built"}
+    assert read_manifest(paths(2025)[1])["inputs"] == first[2025]["inputs"]
+
+    # only 2025's scrape cache moved
+    conn = sqlite3.connect(paths(2025)[0])
+    conn.execute("UPDATE weekly_stats SET FPTS = FPTS + 1 WHERE rowid = (SELECT MIN(rowid) FROM weekly_stats)")
+    conn.commit()
+    conn.close()
+    second = build_all([2024, 2025], workers=2, paths=paths)
+    assert {y: r["status"] for y, r in second.items()} == {2024: "skipped", 2025: "built"}
+    assert second[2025]["inputs"]["stats_tables"]["weekly_stats"] != first[2025]["inputs"]["stats_tables"]["weekly_stats"]
+    assert second[2025]["inputs"]["stats_tables"]["season_stats"] == first[2025]["inputs"]["stats_tables"]["season_stats"]
+
+    # league state written to season.db after the build does not trigger a rebuild...
+    conn = sqlite3.connect(paths(2024)[1])
+    conn.execute("UPDATE players SET availability = 'DRAFTED' WHERE id = '19788'")
+    conn.commit()
+    conn.close()
+    assert build_all([2024], paths=paths)[2024]["status"] == "skipped"
+    # ...and is not wiped when the inputs change, unless forced
+    conn = sqlite3.connect(paths(2024)[0])
+    conn.execute("UPDATE weekly_stats SET FPTS = FPTS + 1 WHERE rowid = (SELECT MIN(rowid) FROM weekly_stats)")
+    conn.commit()
+    conn.close()
+    kept = build_all([2024], paths=paths)[2024]
+    assert kept["status"] == "kept" and kept["league_state"] == ["players"]
+    conn = sqlite3.connect(paths(2024)[1])
+    assert conn.execute("SELECT availability FROM players WHERE id = '19788'").fetchone()[0] == "DRAFTED"
+    conn.close()
+    assert build_all([2024], paths=paths, force=True)[2024]["status"] == "built"
+    assert build_all([2024], paths=paths)[2024]["status"] == "skipped"
+
+
+def test_refresh_replaces_one_week_in_place(tmp_path):
+    import shutil
+    from blitz_env.bootstrap_data import refresh
+
+    stats_db = str(tmp_path / "stats.db")
+    season_db = str(tmp_path / "season.db")
+    shutil.copy(STATS_CACHE_2025, stats_db)
+    build_season(2025, stats_path=stats_db, season_path=season_db)
+
+    conn = sqlite3.connect(season_db)
+    conn.execute("UPDATE players SET availability = 'DRAFTED', current_bot_id = 'bot-1' WHERE id = '19788'")
+    conn.execute("CREATE TABLE matchups (week INTEGER)")
+    conn.execute("INSERT INTO weekly_stats (year, season, week, fantasypros_id, FPTS) VALUES (2025, 2025, 1, 'stale', 1)")
+    conn.commit()
+    conn.close()
+    conn = sqlite3.connect(stats_db)
+    conn.execute("UPDATE weekly_stats SET FPTS = 99.5 WHERE week = '1' AND fantasypros_id = '19788'")
+    conn.execute("ALTER TABLE weekly_stats ADD COLUMN TOUCHES REAL")
+    conn.commit()
+    conn.close()
+
+    copied = refresh(2025, 1, stats_path=stats_db, season_path=season_db)
+    assert copied["weekly_stats"] > 0
+
+    conn = sqlite3.connect(season_db)
+    assert conn.execute("SELECT availability, current_bot_id FROM players WHERE id = '19788'").fetchone() == ("DRAFTED", "bot-1")
+    assert conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE name = 'matchups'").fetchone()[0] == 1
+    assert conn.execute("SELECT FPTS, season FROM weekly_stats WHERE week = 1 AND fantasypros_id = '19788'").fetchall() == [(99.5, 2025)]
+    assert conn.execute("SELECT COUNT(*) FROM weekly_stats WHERE fantasypros_id = 'stale'").fetchone()[0] == 0
+    assert conn.execute("SELECT COUNT(*) FROM weekly_stats WHERE week = 1").fetchone()[0] == copied["weekly_stats"]
+    assert "TOUCHES" in {r[1] for r in conn.execute("PRAGMA table_info(weekly_stats)")}
+    plan = conn.execute("EXPLAIN QUERY PLAN DELETE FROM weekly_stats WHERE year = 2025 AND week = 1").fetchall()
+    assert "idx_weekly_stats_year_week_fantasypros_id" in plan[0][-1]
+    conn.close()
+
+
+def test_refresh_updates_the_build_manifest(tmp_path, monkeypatch):
+    import shutil
+    from blitz_env import bootstrap_data
+    from blitz_env.bootstrap_data import build_if_changed, input_hashes, read_manifest, refresh
+
+    stats_db = str(tmp_path / "stats.db")
+    season_db = str(tmp_path / "season.db")
+    shutil.copy(STATS_CACHE_2025, stats_db)
+    build_if_changed(2025, stats_path=stats_db, season_path=season_db)
+
+    conn = sqlite3.connect(stats_db)
+    conn.execute("UPDATE weekly_stats SET FPTS = 99.5 WHERE week = '1' AND fantasypros_id = '19788'")
+    conn.commit()
+    conn.close()
+    digested = []
+    real_digest = bootstrap_data._table_digest
+    monkeypatch.setattr(bootstrap_data, "_table_digest",
+                        lambda conn, table: digested.append(table) or real_digest(conn, table))
+    copied = refresh(2025, 1, stats_path=stats_db, season_path=season_db)
+    assert sorted(digested) == sorted(copied)  # only the weekly tables it copied
+    monkeypatch.undo()
+
+    manifest = read_manifest(season_db)
+    assert manifest["inputs"] == input_hashes(2025, stats_db)
+    assert manifest["output"] == {"bytes": os.path.getsize(season_db)}
+    assert build_if_changed(2025, stats_path=stats_db, season_path=season_db)["status"] == "skipped"
@@ -0,0 +1,86 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from blitz_env.bulk_upsert import upsert_dataframe
+
+KEYS = ["year", "week", "fantasypros_id", "position"]
+
+
+def _week(ids, fpts):
+    return pd.DataFrame({
+        "year": 2025, "week": 1, "fantasypros_id": ids, "position": "RB",
+        "FPTS": fpts,
+    })
+
+
+def test_upsert_creates_then_updates(tmp_path):
+    db = str(tmp_path / "stats" / "stats.db")
+    first = upsert_dataframe(db, "weekly_stats", _week(["1", "2"], [10.0, np.nan]), KEYS)
+    assert (first.inserted, first.updated) == (2, 0)
+
+    second = upsert_dataframe(db, "weekly_stats", _week(["2", "3"], [7.5, 3.0]), KEYS)
+    assert (second.inserted, second.updated) == (1, 1)
+
+    with sqlite3.connect(db) as conn:
+        rows = dict(conn.execute("SELECT fantasypros_id, FPTS FROM weekly_stats").fetchall())
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+    assert rows == {"1": 10.0, "2": 7.5, "3": 3.0}
+    assert mode == "delete"
+
+
+def test_upsert_counts_duplicate_keys_once(tmp_path):
+    db = str(tmp_path / "stats.db")
+    upsert_dataframe(db, "weekly_stats", _week(["1"], [1.0]), KEYS)
+    # "2" appears twice in one batch: one insert, and the last row wins
+    result = upsert_dataframe(db, "weekly_stats", _week(["1", "2", "2"], [4.0, 5.0, 6.0]), KEYS)
+    assert (result.inserted, result.updated) == (1, 1)
+    with sqlite3.connect(db) as conn:
+        assert dict(conn.execute("SELECT fantasypros_id, FPTS FROM weekly_stats")) == {"1": 4.0, "2": 6.0}
+
+
+def test_upsert_counts_null_keys_as_inserts(tmp_path):
+    db = str(tmp_path / "stats.db")
+    df = _week(["1", None], [1.0, 2.0])
+    assert upsert_dataframe(db, "weekly_stats", df, KEYS) == (2, 0)
+    # a NULL key never conflicts, so the same frame again updates one row and adds one
+    assert upsert_dataframe(db, "weekly_stats", df, KEYS) == (1, 1)
+
+
+def test_upsert_adds_new_columns(tmp_path):
+    db = str(tmp_path / "stats.db")
+    upsert_dataframe(db, "weekly_stats", _week(["1"], [1.0]), KEYS)
+    df = _week(["1"], [2.0]).assign(ROST=0.05)
+    assert upsert_dataframe(db, "weekly_stats", df, KEYS).updated == 1
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT FPTS, ROST FROM weekly_stats").fetchall() == [(2.0, 0.05)]
+        types = dict(conn.execute("SELECT name, type FROM pragma_table_info('weekly_stats')"))
+    assert types["ROST"] == "REAL"
+
+
+def test_upsert_applies_typed_reference_schema(tmp_path):
+    db = str(tmp_path / "stats.db")
+    df = _week(["1"], [1.0]).astype({"year": str, "week": str}).assign(pos_rank="4", FPTS=pd.array([12], dtype="Int16"))
+    upsert_dataframe(db, "weekly_stats", df, KEYS)
+    with sqlite3.connect(db) as conn:
+        row = conn.execute(
+            "SELECT typeof(year), typeof(season), typeof(week), typeof(fantasypros_id), "
+            "typeof(pos_rank), typeof(FPTS), season FROM weekly_stats"
+        ).fetchone()
+    assert row == ("integer", "integer", "integer", "text", "integer", "real", 2025)
+
+
+def test_upsert_indexes_year_week_for_refresh(tmp_path):
+    db = str(tmp_path / "stats.db")
+    with sqlite3.connect(db) as conn:  # a legacy table, as collect_stats' to_sql left it
+        _week(["1"], [1.0]).astype({"week": str}).to_sql("weekly_stats", conn, index=False)
+    upsert_dataframe(db, "weekly_stats", _week(["2"], [2.0]), KEYS)
+    with sqlite3.connect(db) as conn:
+        indexes = {r[0] for r in conn.execute("SELECT name FROM pragma_index_list('weekly_stats')")}
+        plan = conn.execute("EXPLAIN QUERY PLAN SELECT * FROM weekly_stats "
+                            "WHERE year IN (2025, '2025') AND week IN (1, '1')").fetchall()
+        rows = conn.execute("SELECT COUNT(*) FROM weekly_stats "
+                            "WHERE year IN (2025, '2025') AND week IN (1, '1')").fetchone()[0]
+    assert "idx_weekly_stats_year_week" in indexes
+    assert "USING INDEX" in plan[0][-1] and rows == 2
@@ -0,0 +1,77 @@
+import os
+
+import pandas as pd
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+
+from blitz_env import columnar
+from blitz_env.bootstrap_data import main
+from blitz_env.models import DatabaseManager
+
+
+@pytest.fixture
+def sidecar(season_db_2025):
+    return columnar.export(season_db_2025)
+
+
+def test_export_partitions_next_to_season_db(season_db_2025, sidecar):
+    assert sidecar == os.path.splitext(season_db_2025)[0] + ".arrow"
+    assert os.path.isfile(os.path.join(sidecar, "weekly_stats", "season=2025", "week=1.arrow"))
+    assert os.path.isfile(os.path.join(sidecar, "season_stats", "season=2024.arrow"))
+    meta = columnar.manifest(sidecar)
+    db = DatabaseManager(path=season_db_2025)
+    try:
+        assert meta["tables"]["weekly_stats"] == len(db._read_for_players("weekly_stats"))
+    finally:
+        db.close()
+
+
+def test_read_frame_matches_season_db(season_db_2025, sidecar):
+    db = DatabaseManager(path=season_db_2025)
+    try:
+        expected = db.get_seasonal_data_many(seasons=[2023, 2024])
+    finally:
+        db.close()
+    frame = columnar.read_frame("season_stats", seasons=[2023, 2024], path=sidecar)
+    assert str(frame["season"].dtype) == "Int64"
+    got = frame.set_index(["fantasypros_id", "season"]).sort_index()
+    assert got.index.equals(expected.index)
+    pd.testing.assert_series_equal(got["FPTS"], expected["FPTS"].astype("float64"))
+
+
+def test_open_table_is_memory_mapped_and_pruned(sidecar):
+    # total_allocated_bytes() is process-wide and other tests' Arrow-backed frames may
+    # still hold memory, so compare against the count before the call
+    allocated = pa.total_allocated_bytes()
+    table = columnar.open_table("weekly_stats", seasons=[2025], weeks=[1], path=sidecar)
+    assert table.num_rows > 0
+    assert set(table.column("week").to_pylist()) == {1}
+    assert pa.total_allocated_bytes() == allocated  # buffers live in the mapped files
+    assert columnar.open_table("weekly_stats", seasons=[1999], path=sidecar).num_rows == 0
+
+
+def test_refresh_rewrites_only_the_weeks_partition(season_db_2025, sidecar):
+    import sqlite3
+
+    week1 = os.path.join(sidecar, "weekly_stats", "season=2025", "week=1.arrow")
+    season_file = os.path.join(sidecar, "season_stats", "season=2024.arrow")
+    untouched = os.stat(season_file).st_mtime_ns
+    conn = sqlite3.connect(season_db_2025)
+    conn.execute("DELETE FROM weekly_stats WHERE season = 2025 AND week = 1 AND fantasypros_id != '19788'")
+    conn.execute("UPDATE weekly_stats SET FPTS = 42 WHERE fantasypros_id = '19788'")
+    conn.commit()
+    conn.close()
+
+    assert columnar.refresh(season_db_2025, 2025, 1, tables=["weekly_stats"]) == {"weekly_stats": 1}
+    frame = columnar.read_frame("weekly_stats", seasons=[2025], weeks=[1], path=sidecar)
+    assert frame["FPTS"].tolist() == [42.0]
+    assert columnar.manifest(sidecar)["tables"]["weekly_stats"] == len(
+        columnar.read_frame("weekly_stats", path=sidecar))
+    assert os.stat(season_file).st_mtime_ns == untouched
+    assert os.path.isfile(week1)
+
+
+def test_cli_export_columnar(season_db_2025):
+    assert main(["export-columnar", "--year", "2025", "--season-path", season_db_2025]) == 0
+    assert "season_stats" in columnar.manifest(columnar.sidecar_path(season_db_2025))["tables"]
@@ -1,4 +1,4 @@
-from blitz_env.models import DatabaseManager, Player
+from blitz_env.models import Bot, DatabaseManager, Player
 
 def _db(path):
     DatabaseManager.DB_URL = f"sqlite:///{path}"
@@ -31,3 +31,134 @@ def test_seasons_filter(season_db_2025):
         assert db.get_weekly_data(chase, seasons=[1999]).empty
     finally:
         db.close()
+
+def test_weekly_data_many_matches_per_player_reads(season_db_2025):
+    db = _db(season_db_2025)
+    try:
+        roster = [db.get_player_by_id(pid) for pid in ("19788", "17298", "23133")]
+        many = db.get_weekly_data_many(roster, seasons=[2025])
+        assert list(many.index.names) == ["fantasypros_id", "season", "week"]
+        for p in roster:
+            single = db.get_weekly_data(p, seasons=[2025])
+            assert len(many.loc[p.id]) == len(single)
+            assert many.loc[p.id]["FPTS"].tolist() == single.sort_values(["season", "week"])["FPTS"].tolist()
+
+        # ids work too; None reads the whole league
+        assert len(db.get_weekly_data_many(["19788"])) == len(db.get_weekly_data(roster[0]))
+        assert len(db.get_weekly_data_many()) >= len(many)
+        assert db.get_weekly_data_many([]).empty
+    finally:
+        db.close()
+
+def test_seasons_filter_runs_in_sql(season_db_2025):
+    from sqlalchemy import event
+
+    db = _db(season_db_2025)
+    statements = []
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+    event.listen(db.engine, "before_cursor_execute", _record)
+    try:
+        seasonal = db.get_seasonal_data_many(["19788", "17298"], seasons=[2023, 2024])
+        weekly = db.get_weekly_projections_many(["19788"], season=2025, week=1)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", _record)
+        db.close()
+    selects = [(sql, params) for sql, params in statements if "FROM season_stats" in sql or "FROM weekly_projections" in sql]
+    assert any("season IN" in sql and 2023 in params for sql, params in selects if "season_stats" in sql)
+    assert any("week = " in sql for sql, _ in selects if "weekly_projections" in sql)
+    assert set(seasonal.index.get_level_values("season")) <= {2023, 2024}
+    assert set(weekly.index.get_level_values("week")) <= {1}
+
+def test_seasonal_data_many_indexed_by_player_and_season(season_db_2025):
+    db = _db(season_db_2025)
+    try:
+        seasonal = db.get_seasonal_data_many(["19788", "17298"], seasons=[2022, 2023, 2024])
+        assert list(seasonal.index.names) == ["fantasypros_id", "season"]
+        assert set(seasonal.index.get_level_values("season")) <= {2022, 2023, 2024}
+        assert set(seasonal.index.get_level_values("fantasypros_id")) == {"19788", "17298"}
+    finally:
+        db.close()
+
+def test_engines_are_pooled_per_path(season_db_2025, tmp_path, monkeypatch):
+    import shutil
+    from blitz_env import models
+
+    other = tmp_path / "other.db"
+    shutil.copyfile(season_db_2025, other)
+
+    calls = []
+    real_create_all = models.Base.metadata.create_all
+    monkeypatch.setattr(models.Base.metadata, "create_all",
+                        lambda engine, **kw: (calls.append(str(engine.url)), real_create_all(engine, **kw)))
+
+    a1, a2 = DatabaseManager(path=season_db_2025), DatabaseManager(path=season_db_2025)
+    b = DatabaseManager(path=str(other))
+    try:
+        assert a1.engine is a2.engine
+        assert a1.session is not a2.session
+        assert b.engine is not a1.engine and b.path == str(other)
+        # one schema check per path, not per instance
+        assert calls.count(f"sqlite:///{other}") == 1
+        assert calls.count(f"sqlite:///{season_db_2025}") <= 1
+    finally:
+        for db in (a1, a2, b):
+            db.close()
+
+def test_env_var_binds_default_instances(season_db_2025, monkeypatch):
+    monkeypatch.setattr(DatabaseManager, "DB_URL", "sqlite:///does-not-matter.db")
+    monkeypatch.setenv(DatabaseManager.ENV_VAR, season_db_2025)
+    db = DatabaseManager()
+    try:
+        assert db.path == season_db_2025
+        assert db.get_player_by_id("19788").full_name == "Ja'Marr Chase"
+    finally:
+        db.close()
+
+def test_read_only_mode_is_immutable_and_mmapped(season_db_2025, monkeypatch):
+    import pytest
+    from sqlalchemy.exc import OperationalError
+
+    monkeypatch.setenv(DatabaseManager.READONLY_ENV_VAR, "1")
+    monkeypatch.setenv(DatabaseManager.ENV_VAR, season_db_2025)
+    db = DatabaseManager()
+    try:
+        assert db.read_only and db.path == season_db_2025
+        assert not db.get_weekly_data("19788", seasons=[2025]).empty
+        with db.engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA query_only").scalar() == 1
+            assert conn.exec_driver_sql("PRAGMA mmap_size").scalar() > 0
+            with pytest.raises(OperationalError):
+                conn.exec_driver_sql("CREATE TABLE scratch (a)")
+    finally:
+        db.close()
+
+def test_read_only_mode_refuses_the_league_db(tmp_path, monkeypatch):
+    import pytest
+
+    monkeypatch.setenv(DatabaseManager.READONLY_ENV_VAR, "1")
+    monkeypatch.delenv(DatabaseManager.ENV_VAR, raising=False)
+    monkeypatch.setattr(DatabaseManager, "DB_URL", "sqlite:///gamestate.db")
+    with pytest.raises(ValueError, match="league DB"):
+        DatabaseManager()
+    with pytest.raises(ValueError, match="league DB"):
+        DatabaseManager(path=str(tmp_path / "gamestate.db"))
+
+def test_reference_db_attached_beside_writable_league_db(season_db_2025, tmp_path):
+    import sqlite3
+
+    league = tmp_path / "league.db"
+    db = DatabaseManager(path=str(league), reference=season_db_2025)
+    try:
+        # reads fall through to the attached season.db
+        assert db.get_player_by_id("19788").full_name == "Ja'Marr Chase"
+        weekly = db.get_weekly_data("19788", seasons=[2025])
+        assert str(weekly["week"].dtype) == "Int64" and not weekly.empty
+        # league state is created and written in the small DB only
+        db.session.add(Bot(id="b1", name="bot", owner="me", draft_order=0))
+        db.session.commit()
+    finally:
+        db.close()
+    with sqlite3.connect(league) as conn:
+        tables = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+    assert "bots" in tables and "players" in tables and "weekly_stats" not in tables
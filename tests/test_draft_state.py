@@ -0,0 +1,135 @@
+import pandas as pd
+import pytest
+from blitz_env.models import DatabaseManager, Player, dispose_engine
+from harness.simulate_draft import DraftState, in_memory_strategy
+
+
+def _state(rounds=3, snake=True):
+    return DraftState(
+        player_ids=["a", "b", "c", "d", "e", "f", "g"],
+        ranks=[5, 1, 3, 2, 7, 4, 6],
+        bot_ids=["x", "y"],
+        total_rounds=rounds,
+        is_snake=snake,
+    )
+
+
+def test_snake_order_and_best_available():
+    state = _state()
+    assert state.pick_order == ["x", "y", "y", "x", "x", "y"]
+    assert _state(snake=False).pick_order == ["x", "y", "x", "y", "x", "y"]
+    # one past the end keeps the snake arithmetic (round 4 runs forward again)
+    assert state.bot_id_for_pick(7) == "y"
+
+    assert state.best_available() == "b"
+    state.make_pick("b")
+    state.make_pick("c")  # out of rank order
+    assert state.best_available() == "d"
+    assert not state.is_available("c")
+    assert state.pending == [("b", "x", 1), ("c", "y", 2)]
+    with pytest.raises(Exception, match="already drafted"):
+        state.make_pick("b")
+
+
+@pytest.fixture
+def sd(season_db_2025, tmp_path, monkeypatch):
+    """harness.simulate_draft with a fresh scratch DB from the 2025 season.db."""
+    import harness.simulate_draft as sd
+    monkeypatch.setenv(DatabaseManager.ENV_VAR, str(tmp_path / "gamestate.db"))
+    monkeypatch.setattr(sd, "get_season_db_path", lambda year: season_db_2025)
+    sd.init_database(2025)
+    yield sd
+    dispose_engine(DatabaseManager.resolve_url())
+
+
+def test_unranked_players_sort_last():
+    state = DraftState(
+        player_ids=["a", "b", "c", "d"],
+        ranks=[None, 2, float("nan"), 1],
+        bot_ids=["x"],
+        total_rounds=4,
+    )
+    assert state.player_ids[:2] == ["d", "b"]
+    assert set(state.player_ids[2:]) == {"a", "c"}
+    for expected in ("d", "b"):
+        assert state.best_available() == expected
+        state.make_pick(expected)
+    assert state.best_available() in {"a", "c"}
+
+
+def test_run_draft_flushes_only_before_db_strategies(sd, monkeypatch):
+    seen = []
+
+    def db_bot():
+        db = DatabaseManager()
+        try:
+            drafted = pd.read_sql("SELECT COUNT(*) c FROM players WHERE availability='DRAFTED'", db.engine)
+            status = db.get_game_status()
+            seen.append((int(drafted.iloc[0]["c"]), status.current_draft_pick, status.current_bot_id))
+            p = (db.session.query(Player).filter(Player.availability == "AVAILABLE")
+                 .order_by(Player.rank).first())
+            return p.id
+        finally:
+            db.close()
+
+    flushes = []
+    real_flush = DraftState.flush
+    monkeypatch.setattr(DraftState, "flush", lambda self, db: (flushes.append(len(self.pending)), real_flush(self, db)))
+
+    sd.run_draft({"5": db_bot})
+
+    # the DB bot always sees every earlier pick and is itself on the clock
+    assert seen and all(count == pick - 1 and bot == "5" for count, pick, bot in seen)
+    assert len(flushes) == len(seen) + 1  # one per DB-bot turn, plus the final flush
+
+    db = DatabaseManager()
+    try:
+        drafted = db.session.query(Player).filter(Player.availability == "DRAFTED").all()
+        settings = db.get_league_settings()
+        assert len(drafted) == settings.total_rounds * 13
+        assert sorted(p.pick_chosen for p in drafted) == list(range(1, len(drafted) + 1))
+        assert db.get_game_status().current_draft_pick == len(drafted) + 1
+    finally:
+        db.close()
+
+
+def test_in_memory_strategies_receive_state(sd):
+
+    @in_memory_strategy
+    def worst_available(state):
+        for pid in reversed(state.player_ids):
+            if state.is_available(pid):
+                return pid
+        return ""
+
+    sd.run_draft({"0": worst_available})
+
+    db = DatabaseManager()
+    try:
+        first = db.session.query(Player).filter(Player.pick_chosen == 1).one()
+        second = db.session.query(Player).filter(Player.pick_chosen == 2).one()
+        assert first.current_bot_id == "0" and first.rank > 300
+        assert second.rank == 1  # bot "1" falls back to best_available_strategy
+    finally:
+        db.close()
+
+
+def test_full_draft_against_reference_db(season_db_2025, tmp_path, monkeypatch):
+    import sqlite3
+    import harness.simulate_draft as sd
+
+    monkeypatch.setenv(DatabaseManager.ENV_VAR, str(tmp_path / "league.db"))
+    monkeypatch.setenv(DatabaseManager.REFERENCE_ENV_VAR, season_db_2025)
+    sd.reset_league(2025)
+    sd.run_draft({})
+
+    db = DatabaseManager()
+    try:
+        drafted = db.session.query(Player).filter(Player.availability == "DRAFTED").count()
+        assert drafted == db.get_league_settings().total_rounds * 13
+    finally:
+        db.close()
+        dispose_engine(db.url)
+    # draft state lives in the league DB; the reference season.db is untouched
+    with sqlite3.connect(season_db_2025) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM players WHERE availability != 'AVAILABLE'").fetchone()[0] == 0
@@ -0,0 +1,46 @@
+import pytest
+
+from blitz_env import fetch
+from blitz_env.projections_db import fp_projections
+from blitz_env.stats_db import fp_stats_dynamic, fp_weekly_years
+
+
+def test_stats_page_parses_from_stand_in_server(fantasypros_server):
+    df = fp_stats_dynamic("rb", year=2024, range="week", week=3)
+    assert list(df["fantasypros_id"]) == ["16393", "22902", "99999"]
+    assert df.loc[0, "RUSHING_YDS"] == 2005
+    assert df.loc[0, "ROST"] == pytest.approx(0.998)
+    assert fantasypros_server.hits[0].startswith("/nfl/stats/rb.php?")
+
+
+def test_retries_transient_errors(fantasypros_server):
+    fantasypros_server.fail_first = 2
+    df = fp_projections(page="rb", sport="nfl", year=2024, week="1", scoring="PPR")
+    assert list(df["team"][:2]) == ["PHI", "DET"]
+    assert len(fantasypros_server.hits) == 3
+
+
+def test_weekly_years_fetches_concurrently_within_limit(fantasypros_server, monkeypatch):
+    monkeypatch.setenv("BOTBLITZ_FETCH_CONCURRENCY", "3")
+    fetch.reset_session()
+    fantasypros_server.delay = 0.05
+    df = fp_weekly_years("rb", [2023, 2024])
+    assert len(fantasypros_server.hits) == 2 * 18
+    assert 1 < fantasypros_server.max_in_flight <= 3
+    # results keep the serial (year, week) order
+    assert list(df.drop_duplicates(["season", "week"])[["season", "week"]].itertuples(index=False)) == [
+        (year, week) for year in (2023, 2024) for week in range(1, 19)
+    ]
+
+
+def test_map_concurrent_can_collect_exceptions():
+    def one(i):
+        if i == 2:
+            raise ValueError("bad page")
+        return i * 10
+
+    out = fetch.map_concurrent(one, range(4), max_workers=2, return_exceptions=True)
+    assert out[:2] == [0, 10] and out[3] == 30
+    assert isinstance(out[2], ValueError)
+    with pytest.raises(ValueError):
+        fetch.map_concurrent(one, range(4), max_workers=2)
@@ -0,0 +1,58 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from blitz_env.bulk_upsert import upsert_dataframe
+from blitz_env.fp_numeric import coerce_numeric, widen_floats
+
+
+def _raw():
+    return pd.DataFrame({
+        "fantasypros_id": ["1", "2", "3"],
+        "RUSHING_YDS": ["2,005", "-3", ""],
+        "FPTS": ["322.3", "0.7", "12"],
+        "ROST": ["99.8%", "0.1%", None],
+        "RUSHING_Y/A": ["4", "5", "6"],
+    })
+
+
+def test_coerce_numeric_types_columns_by_header():
+    df = coerce_numeric(_raw(), ["fantasypros_id"], counts=True)
+    assert df["fantasypros_id"].tolist() == ["1", "2", "3"]
+    assert str(df["RUSHING_YDS"].dtype) == "Int16"
+    assert df["RUSHING_YDS"].tolist()[:2] == [2005, -3] and df["RUSHING_YDS"].isna().tolist()[2]
+    assert df["FPTS"].dtype == np.float32
+    assert df["RUSHING_Y/A"].dtype == np.float32  # a rate, even when the page shows whole numbers
+    assert df["ROST"].dtype == np.float32
+    np.testing.assert_allclose(df["ROST"].to_numpy()[:2], [0.998, 0.001], rtol=1e-6)
+    assert np.isnan(df["ROST"].to_numpy()[2])
+    # projections: every column is float32
+    assert coerce_numeric(_raw(), ["fantasypros_id"])["RUSHING_YDS"].dtype == np.float32
+
+
+def test_pages_with_different_value_ranges_concatenate_without_upcasting():
+    week1 = coerce_numeric(pd.DataFrame({"RUSHING_YDS": ["12", "3"], "FPTS": ["4", "10"]}), [], counts=True)
+    week2 = coerce_numeric(pd.DataFrame({"RUSHING_YDS": ["1,850", ""], "FPTS": ["7.5", ""]}), [], counts=True)
+    assert dict(week1.dtypes) == dict(week2.dtypes)
+    both = pd.concat([week1, week2], ignore_index=True)
+    assert str(both["RUSHING_YDS"].dtype) == "Int16"
+    assert both["FPTS"].dtype == np.float32
+
+
+def test_count_columns_fall_back_to_float_on_fractional_values(capsys):
+    df = coerce_numeric(pd.DataFrame({"RUSHING_YDS": ["1.5", "70000"], "RUSHING_TD": ["1", ""]}),
+                        [], counts=True)
+    assert df["RUSHING_YDS"].dtype == np.float64 and df["RUSHING_YDS"].tolist() == [1.5, 70000.0]
+    assert str(df["RUSHING_TD"].dtype) == "Int16"
+    assert "RUSHING_YDS" in capsys.readouterr().out
+
+
+def test_float32_columns_store_the_page_decimals(tmp_path):
+    df = coerce_numeric(_raw(), ["fantasypros_id"])
+    assert widen_floats(df)["FPTS"].tolist() == [322.3, 0.7, 12.0]
+
+    db = str(tmp_path / "stats.db")
+    upsert_dataframe(db, "weekly_stats", df, ["fantasypros_id"])
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT FPTS, ROST FROM weekly_stats ORDER BY fantasypros_id").fetchall()[0] == (322.3, 0.998)
@@ -0,0 +1,62 @@
+import os
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("lxml")
+pytest.importorskip("bs4")
+
+from blitz_env.fp_table import projections_frame, stats_frame  # noqa: E402
+from blitz_env.projections_db import fp_projections_parse_nfl, fp_projections_parse_nfl_bs4  # noqa: E402
+from blitz_env.stats_db import fp_stats_parse, fp_stats_parse_bs4  # noqa: E402
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+PARAMS = {"year": 2024, "range": "week", "week": 3, "scoring": "PPR"}
+
+
+def _read(name):
+    with open(os.path.join(FIXTURES, name), "rb") as f:
+        return f.read()
+
+
+def test_stats_reader_matches_beautifulsoup():
+    content = _read("fp_stats_rb.html")
+    fast = stats_frame(content, "rb", PARAMS)
+    pd.testing.assert_frame_equal(fast, fp_stats_parse_bs4(content, "rb", PARAMS))
+    assert list(fast["team"]) == ["PHI", "DET", "FA"]
+    assert list(fast["fantasypros_id"]) == ["16393", "22902", "99999"]
+
+
+def test_projections_reader_matches_beautifulsoup():
+    content = _read("fp_projections_rb.html")
+    fast = projections_frame(content, "rb", PARAMS)
+    pd.testing.assert_frame_equal(fast, fp_projections_parse_nfl_bs4(content, "rb", PARAMS))
+    assert fast.columns[-1] == "FPTS" and "RECEIVING_YDS" in fast.columns
+
+
+def test_parsers_fall_back_to_beautifulsoup(monkeypatch, capsys):
+    import blitz_env.fp_table as fp_table
+
+    def broken(*args):
+        raise ImportError("no lxml")
+
+    content = _read("fp_stats_rb.html")
+    expected = fp_stats_parse(content, "rb", PARAMS)
+    monkeypatch.setattr(fp_table, "stats_frame", broken)
+    monkeypatch.setattr(fp_table, "projections_frame", broken)
+    pd.testing.assert_frame_equal(fp_stats_parse(content, "rb", PARAMS), expected)
+
+    response = {"content": _read("fp_projections_rb.html"), "params": PARAMS, "response": None}
+    assert len(fp_projections_parse_nfl(response, "rb")["projections"]) == 3
+    assert capsys.readouterr().out.count("using BeautifulSoup") == 2
+
+
+def test_reader_bugs_are_not_hidden_by_the_fallback(monkeypatch):
+    import blitz_env.fp_table as fp_table
+
+    def buggy(*args):
+        raise KeyError("a bug in the fast reader")
+
+    monkeypatch.setattr(fp_table, "stats_frame", buggy)
+    with pytest.raises(KeyError):
+        fp_stats_parse(_read("fp_stats_rb.html"), "rb", PARAMS)
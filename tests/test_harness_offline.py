@@ -33,3 +33,26 @@ def test_offline_draft_and_score(season_db_2025, tmp_path, monkeypatch):
         "SELECT COUNT(*) c FROM players WHERE availability='DRAFTED'", db.engine)
     db.close()
     assert int(drafted.iloc[0]["c"]) > 0
+
+def test_season_points_matrix_matches_weekly_stats(season_db_2025):
+    from harness.score_game import build_season_points, get_best_possible_score_season
+
+    DatabaseManager.DB_URL = f"sqlite:///{season_db_2025}"
+    db = DatabaseManager()
+    try:
+        roster = (db.session.query(Player).order_by(Player.rank).limit(30).all())
+        season_points = build_season_points(db, roster, 2025)
+        assert season_points.points.shape == (30, 17)
+
+        for p in roster[:5]:
+            weekly = db.get_weekly_data(p, seasons=[2025])
+            for _, row in weekly.iterrows():
+                assert season_points.get(p.id, int(row["week"])) == row["FPTS"]
+        assert season_points.get("no-such-player", 1) == 0
+
+        slots = {"QB": 1, "RB": 2, "WR": 2, "SUPERFLEX": 1, "FLEX": 1, "K": 1, "DST": 1, "BENCH": 3}
+        shared, _, _ = get_best_possible_score_season(db, roster, slots, 2025, season_points)
+        standalone, _, _ = get_best_possible_score_season(db, roster, slots, 2025)
+        assert shared == standalone > 0
+    finally:
+        db.close()
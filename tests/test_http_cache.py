@@ -0,0 +1,89 @@
+import datetime
+
+import pytest
+
+from blitz_env import http_cache
+from blitz_env.http_cache import CacheMiss, current_season, season_ttl, week_start
+from blitz_env.stats_db import fp_stats_dynamic
+
+
+def test_past_seasons_are_served_from_cache(fantasypros_server):
+    first = fp_stats_dynamic("rb", year=2023, range="week", week=1)
+    second = fp_stats_dynamic("rb", year=2023, range="week", week=1)
+    assert len(fantasypros_server.hits) == 1
+    assert second.equals(first)
+    # different params are a different cache entry
+    fp_stats_dynamic("rb", year=2023, range="week", week=2)
+    assert len(fantasypros_server.hits) == 2
+
+
+def test_current_season_expires(fantasypros_server, monkeypatch):
+    monkeypatch.setenv("BOTBLITZ_HTTP_CACHE_TTL", "0")
+    year = current_season()
+    # season totals keep moving all season (a completed week would be kept)
+    fp_stats_dynamic("rb", year=year)
+    fp_stats_dynamic("rb", year=year)
+    assert len(fantasypros_server.hits) == 2
+
+
+def test_offline_replay(fantasypros_server, monkeypatch):
+    online = fp_stats_dynamic("rb", year=current_season(), range="week", week=1)
+    monkeypatch.setenv("BOTBLITZ_HTTP_OFFLINE", "1")
+    monkeypatch.setenv("BOTBLITZ_HTTP_CACHE_TTL", "0")
+    replayed = fp_stats_dynamic("rb", year=current_season(), range="week", week=1)
+    assert replayed.equals(online)
+    with pytest.raises(CacheMiss):
+        fp_stats_dynamic("rb", year=current_season(), range="week", week=2)
+    assert len(fantasypros_server.hits) == 1
+
+
+def test_failed_responses_are_not_cached(fantasypros_server, monkeypatch):
+    monkeypatch.setenv("BOTBLITZ_FETCH_RETRIES", "0")
+    from blitz_env import fetch
+    fetch.reset_session()
+    fantasypros_server.fail_first = 1
+    with pytest.raises(Exception, match="503"):
+        fp_stats_dynamic("rb", year=2022)
+    fp_stats_dynamic("rb", year=2022)
+    assert len(fantasypros_server.hits) == 2
+
+
+def test_bodies_are_content_addressed(tmp_path, monkeypatch):
+    monkeypatch.setenv("BOTBLITZ_HTTP_CACHE", str(tmp_path))
+    page = http_cache.CachedResponse("http://x/a", 200, b"<table></table>")
+    http_cache.store("http://x/a", {"week": 1}, page)
+    http_cache.store("http://x/a", {"week": 2}, page)
+    assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # one shard dir + one blob
+    assert http_cache.load("http://x/a", {"week": 2}).content == b"<table></table>"
+
+
+def test_season_ttl():
+    assert current_season(datetime.date(2026, 2, 1)) == 2025
+    assert current_season(datetime.date(2026, 9, 1)) == 2026
+    assert season_ttl(current_season() - 1) is None
+    assert season_ttl(current_season()) > 0
+
+
+def test_completed_weeks_keep_the_long_ttl():
+    # 2025: Labor Day is Sep 1, week 1 opens Tue Sep 2 (kickoff Thu Sep 4)
+    assert week_start(2025, 1) == datetime.date(2025, 9, 2)
+    mid_week_4 = datetime.date(2025, 9, 26)
+    assert season_ttl(2025, 2, today=mid_week_4) is None       # done, corrections in
+    assert season_ttl(2025, 3, today=mid_week_4) > 0           # corrections still landing
+    assert season_ttl(2025, 4, today=mid_week_4) > 0           # in progress
+    assert season_ttl(2025, None, today=mid_week_4) > 0        # season totals keep moving
+    assert season_ttl(2025, "draft", today=mid_week_4) > 0
+
+
+def test_scrape_offline_does_not_leak_into_the_process(monkeypatch):
+    import os
+    from blitz_env import bootstrap_data, collect_stats
+
+    seen = []
+    monkeypatch.delenv("BOTBLITZ_HTTP_OFFLINE", raising=False)
+    monkeypatch.setattr(collect_stats, "main", lambda argv: seen.append(http_cache.offline()))
+    monkeypatch.setattr(bootstrap_data, "get_stats_cache_path", lambda year: os.devnull + "-dir/stats.db")
+    monkeypatch.setattr(os, "makedirs", lambda *a, **k: None)
+    bootstrap_data.scrape(2025, offline=True)
+    assert seen == [True]
+    assert "BOTBLITZ_HTTP_OFFLINE" not in os.environ
@@ -0,0 +1,54 @@
+import numpy as np
+from blitz_env.lineup import solve_lineups, best_lineup
+
+SLOTS = {"QB": 1, "RB": 2, "WR": 2, "SUPERFLEX": 1, "FLEX": 1, "K": 1, "DST": 1, "BENCH": 3}
+
+
+def test_multi_position_player_beats_greedy():
+    # Greedy fills QB first with the QB/WR player and strands the RB; exact puts him at WR.
+    slots = {"QB": 1, "WR": 1, "SUPERFLEX": 1}
+    total, starters = best_lineup([30, 20, 10], [["QB", "WR"], ["QB"], ["RB"]], slots)
+    assert total == 60
+    assert starters == {0: "WR", 1: "QB", 2: "SUPERFLEX"}
+
+
+def test_bench_never_scores_and_fillable_slots_start_negative_scores():
+    # like the engine's scoring: a fillable slot is never left empty to dodge a negative score
+    total, starters = best_lineup([-3, 12], [["K"], ["QB"]], {"K": 1, "QB": 1, "BENCH": 5})
+    assert total == 9
+    assert starters == {0: "K", 1: "QB"}
+    total, starters = best_lineup([-3, -1, 12], [["WR"], ["RB"], ["QB"]], {"QB": 1, "FLEX": 1, "TE": 1})
+    assert total == 11  # FLEX takes the least negative option; TE has nobody eligible
+    assert starters == {1: "FLEX", 2: "QB"}
+
+
+def test_flex_and_superflex_fill_from_leftovers():
+    points = [25, 18, 15, 14, 12, 11, 9, 8, 7, 6]
+    positions = [["QB"], ["QB"], ["RB"], ["RB"], ["RB"], ["WR"], ["WR"], ["WR"], ["K"], ["DST"]]
+    total, starters = best_lineup(points, positions, SLOTS)
+    # QB 25, SUPERFLEX 18, RB 15+14, FLEX 12 (RB3), WR 11+9, K 7, DST 6; WR3 (8) benched
+    assert total == 25 + 18 + 15 + 14 + 12 + 11 + 9 + 7 + 6
+    assert 7 not in starters
+
+
+def test_batch_matches_single_solves_and_accepts_json():
+    rng = np.random.default_rng(0)
+    pool = ["QB", "RB", "WR", "TE", "K", "DST"]
+    teams, players, weeks = 4, 12, 5
+    points = rng.uniform(-2, 30, size=(teams, players, weeks))
+    positions = [[f'["{rng.choice(pool)}"]' for _ in range(players)] for _ in range(teams)]
+
+    result = solve_lineups(points, positions, '{"QB": 1, "RB": 2, "WR": 2, "SUPERFLEX": 1, "FLEX": 1, "K": 1, "DST": 1, "BENCH": 3}')
+    assert result.scores.shape == (teams, weeks)
+    assert np.allclose(result.contributions.sum(axis=1), result.scores)
+    for t in range(teams):
+        for w in range(weeks):
+            total, _ = best_lineup(points[t, :, w], positions[t], SLOTS)
+            assert np.isclose(result.scores[t, w], total)
+
+
+def test_short_rosters_are_padded():
+    points = np.array([[10.0, 5.0], [7.0, 99.0]])
+    result = solve_lineups(points, [[["QB"], ["RB"]], [["QB"]]], {"QB": 1, "RB": 1})
+    assert result.scores.tolist() == [15.0, 7.0]
+    assert result.slots[1, 1] == -1
@@ -19,3 +19,33 @@ def test_load_players_missing_year_raises_actionable_error():
     msg = str(exc.value)
     assert "player_ranks_2099.csv" in msg
     assert "fetch_ranks.R" in msg
+
+
+def test_load_players_is_lazy_and_cached():
+    from blitz_env.load_players import players_frame, ranks_path
+
+    players = load_players(2025)
+    assert players._players is None and len(players) == len(players.frame)
+    assert players.frame is players_frame(ranks_path(2025))   # parsed once per file
+    first = players[0]
+    assert first.rank == 1 and list(first.allowed_positions) == [players.frame["allowed_positions"][0][0]]
+
+
+def test_insert_players_matches_protos(tmp_path):
+    import json
+    import sqlite3
+
+    from sqlalchemy import create_engine
+    from blitz_env.load_players import insert_players
+    from blitz_env.models import Player
+
+    path = tmp_path / "season.db"
+    engine = create_engine(f"sqlite:///{path}")
+    Player.__table__.create(engine)
+    engine.dispose()
+    with sqlite3.connect(path) as conn:
+        assert insert_players(conn, 2025) == len(load_players(2025))
+        row = conn.execute("SELECT full_name, allowed_positions, player_bye_week, availability "
+                           "FROM players WHERE id = '19788'").fetchone()
+    chase = next(p for p in load_players(2025) if p.id == "19788")
+    assert row == (chase.full_name, json.dumps(list(chase.allowed_positions)), chase.player_bye_week, "AVAILABLE")
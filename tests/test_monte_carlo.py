@@ -0,0 +1,31 @@
+import pandas as pd
+import pytest
+
+from harness.monte_carlo import main, run_monte_carlo, summarize
+
+
+def test_monte_carlo_runs_parallel_drafts(season_db_2025):
+    results = run_monte_carlo(
+        {"standard": "bots/nfl2025/standard-bot.py"},
+        2025, n_drafts=4, workers=2, seed=7, season_path=season_db_2025,
+    )
+    assert len(results) == 4 * 13
+    assert set(results["strategy"]) == {"standard", "best_available"}
+    # exactly one candidate seat per draft
+    candidates = results[results["is_candidate"]]
+    assert len(candidates) == 4
+    assert (results["score"] >= 0).all()
+
+    summary = summarize(results)
+    assert summary.loc["standard", "count"] == 4
+    assert summary.loc["best_available", "count"] == 4 * 12
+
+
+def test_cli_samples_the_given_opponents(season_db_2025, tmp_path):
+    out = tmp_path / "results.csv"
+    assert main(["--year", "2025", "--drafts", "2", "--workers", "1", "--seed", "3",
+                 "--season-path", season_db_2025, "--out", str(out),
+                 "--opponents", "best_available", "bots/nfl2025/standard-bot.py"]) == 0
+    assert set(pd.read_csv(out)["strategy"]) == {"best_available", "standard-bot.py"}
+    with pytest.raises(SystemExit):
+        main(["--year", "2025", "--opponents", "no-such-bot.py"])
@@ -0,0 +1,62 @@
+import os
+
+import pandas as pd
+import pytest
+
+from blitz_env import player_ids
+from blitz_env.download_injuries import NFLInjuryScraper
+from blitz_env.player_ids import PlayerResolver, get_resolver, normalize_names
+
+CROSSWALK = os.path.join(os.path.dirname(__file__), "fixtures", "db_playerids_sample.csv")
+
+
+@pytest.fixture
+def resolver():
+    return PlayerResolver(pd.read_csv(CROSSWALK))
+
+
+def _injuries():
+    return pd.DataFrame({
+        "player_name": ["Josh Allen", "JaMarr Chase", "Marvin Harrison", "Mike Williams",
+                        "Christian McCafrey", "Nobody Atall"],
+        "position": ["QB", "WR", "WR", "WR", "RB", "TE"],
+        "team": ["BUF", "CIN", "ARI", "NYJ", "SF", "DAL"],
+        "injury": ["Knee"] * 6,
+    })
+
+
+def test_normalize_names_drops_punctuation_and_suffixes():
+    names = pd.Series(["Marvin Harrison Jr.", "Ja'Marr  Chase", "D.K. Metcalf", None])
+    assert normalize_names(names).tolist()[:3] == ["marvin harrison", "jamarr chase", "dk metcalf"]
+
+
+def test_resolve_exact_team_tiebreak_and_fuzzy(resolver):
+    out = resolver.resolve(_injuries())
+    assert out["fantasypros_id"].tolist()[:5] == ["17298", "19788", "23133", "99999", "15602"]
+    assert pd.isna(out["fantasypros_id"].iloc[5])
+    assert out["sleeper_id"].iloc[0] == "4984" and out["gsis_id"].iloc[0] == "00-0034857"
+    assert resolver.last_match == (4, 1, 1)
+    assert list(out.columns[:4]) == ["player_name", "position", "team", "injury"]
+
+
+def test_attach_adds_ids_by_fantasypros_id(resolver):
+    out = resolver.attach(pd.DataFrame({"fantasypros_id": ["19788", "0"]}))
+    assert out["gsis_id"].tolist()[0] == "00-0036900" and pd.isna(out["gsis_id"].iloc[1])
+
+
+def test_crosswalk_fetched_once_and_cached(fantasypros_server, monkeypatch):
+    player_ids.reset_resolver()
+    try:
+        scraper = NFLInjuryScraper(year=2025, week=6)
+        first = scraper.match_player_ids(_injuries())
+        NFLInjuryScraper(year=2025, week=7).match_player_ids(_injuries())
+        assert sum(h.startswith("/db_playerids.csv") for h in fantasypros_server.hits) == 1
+        assert first["fantasypros_id"].iloc[0] == "17298"
+
+        # a new process replays it from the raw-response cache, even offline
+        player_ids.reset_resolver()
+        monkeypatch.setenv("BOTBLITZ_HTTP_OFFLINE", "1")
+        assert len(get_resolver().table) == 7
+        assert sum(h.startswith("/db_playerids.csv") for h in fantasypros_server.hits) == 1
+    finally:
+        player_ids.reset_resolver()
@@ -0,0 +1,45 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from blitz_env.positions import POSITION_BITS, eligible_for, position_mask, slot_mask
+
+
+def _players():
+    return pd.DataFrame({
+        "id": ["1", "2", "3", "4", "5"],
+        "allowed_positions": ['["QB"]', '["RB"]', '["WR", "TE"]', '["K"]', None],
+    })
+
+
+def test_masks():
+    assert position_mask('["WR", "TE"]') == POSITION_BITS["WR"] | POSITION_BITS["TE"]
+    assert position_mask(["RB"]) == POSITION_BITS["RB"]
+    assert position_mask(None) == 0
+    assert slot_mask("FLEX") == POSITION_BITS["RB"] | POSITION_BITS["WR"] | POSITION_BITS["TE"]
+    assert slot_mask(["QB", "BENCH"]) == POSITION_BITS["QB"]
+
+
+def test_eligible_for_parses_json_when_mask_missing():
+    df = _players()
+    assert df[eligible_for(df, "FLEX")]["id"].tolist() == ["2", "3"]
+    assert df[eligible_for(df, ["QB", "K"])]["id"].tolist() == ["1", "4"]
+    assert not eligible_for(df, "DST").any()
+
+
+def test_eligible_for_uses_position_mask_column():
+    df = _players().assign(allowed_positions=None, position_mask=[1, 2, 12, 16, 0])
+    np.testing.assert_array_equal(eligible_for(df, "TE"), [False, False, True, False, False])
+
+
+def test_build_season_materializes_positions(season_db_2025):
+    conn = sqlite3.connect(season_db_2025)
+    try:
+        players = pd.read_sql("SELECT * FROM players", conn)
+        expected = players["allowed_positions"].map(position_mask)
+        assert (players["position_mask"] == expected).all()
+        rbs = {r[0] for r in conn.execute("SELECT player_id FROM player_positions WHERE position = 'RB'")}
+        assert rbs == set(players.loc[eligible_for(players, "RB"), "id"])
+    finally:
+        conn.close()
@@ -0,0 +1,82 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from blitz_env.models import DatabaseManager
+from blitz_env.reference_schema import conform, write_table
+
+
+def _season_rows():
+    # What union_align hands collect_stats: string keys, "" weeks, None-filled stats
+    return pd.DataFrame({
+        "year": ["2024", "2024"], "week": ["", ""],
+        "fantasypros_id": ["19788", "17298"], "player_name": ["Ja'Marr Chase", "Josh Allen"],
+        "position": ["WR", "QB"], "team": ["CIN", "BUF"], "pos_rank": ["1", "1"],
+        "FPTS": pd.array([322.3, np.nan], dtype="float32"),
+        "PASSING_YDS": [None, None],
+    })
+
+
+def test_conform_types_every_column():
+    df = conform("season_stats", _season_rows())
+    assert str(df["year"].dtype) == str(df["season"].dtype) == "Int64"
+    assert df["season"].tolist() == [2024, 2024]
+    assert df["week"].isna().all()
+    assert str(df["pos_rank"].dtype) == "Int64"
+    assert df["FPTS"].dtype == np.float64 and df["FPTS"].iloc[0] == 322.3
+    assert df["PASSING_YDS"].dtype == np.float64
+    assert df["fantasypros_id"].tolist() == ["19788", "17298"]
+
+
+def test_conform_keeps_injury_ids_as_text():
+    df = conform("weekly_injuries", pd.DataFrame({
+        "year": [2025], "week": [1], "player_name": ["Josh Allen"], "sleeper_id": [4984.0],
+    }))
+    assert df["sleeper_id"].tolist() == ["4984"]
+    with pytest.raises(ValueError):
+        conform("players", df)
+
+
+def test_write_table_declares_affinities(tmp_path):
+    db = tmp_path / "stats.db"
+    write_table(_season_rows(), "season_stats", create_engine(f"sqlite:///{db}"))
+    with sqlite3.connect(db) as conn:
+        declared = dict(conn.execute("SELECT name, type FROM pragma_table_info('season_stats')"))
+        stored = conn.execute("SELECT typeof(year), typeof(season), typeof(FPTS), typeof(fantasypros_id) "
+                              "FROM season_stats LIMIT 1").fetchone()
+    assert declared["year"] == declared["season"] == declared["week"] == "INTEGER"
+    assert declared["FPTS"] == "FLOAT" and declared["player_name"] == "TEXT"
+    assert stored == ("integer", "integer", "real", "text")
+
+
+def test_typed_season_db_reads_without_conversion(season_db_2025, monkeypatch):
+    with sqlite3.connect(season_db_2025) as conn:
+        assert dict(conn.execute("SELECT name, type FROM pragma_table_info('weekly_stats')"))["FPTS"] == "REAL"
+
+    def no_conversion(*args, **kwargs):
+        raise AssertionError("typed reads should not re-parse keys")
+
+    db = DatabaseManager(path=season_db_2025)
+    try:
+        monkeypatch.setattr(pd, "to_numeric", no_conversion)
+        weekly = db.get_weekly_data("19788", seasons=[2025])
+        assert not weekly.empty
+        assert str(weekly["season"].dtype) == str(weekly["week"].dtype) == "Int64"
+    finally:
+        db.close()
+
+
+def test_unversioned_db_is_normalized_on_read(tmp_path):
+    path = tmp_path / "legacy.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE weekly_stats (year TEXT, week TEXT, fantasypros_id TEXT, FPTS REAL)")
+        conn.execute("INSERT INTO weekly_stats VALUES ('2025', '3', '19788', 21.5)")
+    db = DatabaseManager(path=str(path))
+    try:
+        weekly = db.get_weekly_data("19788", seasons=[2025])
+        assert weekly[["season", "week"]].values.tolist() == [[2025, 3]]
+    finally:
+        db.close()
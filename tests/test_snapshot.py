@@ -0,0 +1,99 @@
+import pandas as pd
+import pytest
+from sqlalchemy import event
+
+from blitz_env import snapshot
+from blitz_env.models import DatabaseManager
+
+
+@pytest.fixture
+def db(season_db_2025):
+    db = DatabaseManager(path=season_db_2025)
+    yield db
+    snapshot.clear()
+    db.close()
+
+
+ROSTER = ["19788", "17298", "23133"]
+
+
+def _as_floats(df):
+    # all-NULL columns of a small SQL read come back as object (None); float64 in the snapshot
+    return df.astype({c: "float64" for c in df if df[c].dtype == object and df[c].isna().all()})
+
+
+def test_accessors_match_sql_reads(db):
+    from_sql = db.get_weekly_data_many(ROSTER, seasons=[2025])
+    single = db.get_seasonal_data("19788")
+    snap = snapshot.load(db)
+    assert snapshot.get(db) is snap and "weekly_stats" in snap
+
+    pd.testing.assert_frame_equal(db.get_weekly_data_many(ROSTER, seasons=[2025]), _as_floats(from_sql))
+    pd.testing.assert_frame_equal(
+        db.get_seasonal_data("19788").sort_values("season", ignore_index=True),
+        _as_floats(single).sort_values("season", ignore_index=True))
+    assert db.get_weekly_data("nobody").empty
+
+
+def test_reference_reads_issue_no_queries(db):
+    snapshot.load(db)
+    statements = []
+    listener = lambda conn, cursor, stmt, *a: statements.append(stmt)
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        for _ in range(3):
+            db.get_weekly_projections_many(ROSTER, season=2025, week=1)
+            db.get_preseason_projections("19788", 2025)
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+    assert statements == []
+
+
+def test_players_merges_live_draft_state(db):
+    snap = snapshot.load(db)
+    db.draft_player("19788", "bot-1", 1)
+    players = snap.players(db).set_index("id")
+    assert players.loc["19788", "current_bot_id"] == "bot-1"
+    assert players.loc["19788", "full_name"] == "Ja'Marr Chase"
+
+
+def test_frames_are_not_mutated_through_accessors(db):
+    snap = snapshot.load(db)
+    df = snap.table("weekly_stats")
+    df["FPTS"] = 0.0
+    assert (snap.table("weekly_stats")["FPTS"] != 0.0).any()
+    snapshot.clear(db.path)
+    assert snapshot.get(db) is None
+
+
+def test_replaced_or_disposed_db_is_not_served_stale(db, season_db_2025, tmp_path):
+    import os
+    import shutil
+    from blitz_env.models import dispose_engine
+
+    snapshot.load(db)
+    copy = tmp_path / "replacement.db"
+    shutil.copyfile(season_db_2025, copy)
+    os.replace(copy, season_db_2025)
+    assert snapshot.get(db) is None  # new inode: the accessors fall back to SQL
+
+    snapshot.load(db)
+    dispose_engine(db.url)  # e.g. init_database before copying over the file in place
+    assert snapshot.get(db) is None
+
+
+def test_rewritten_reference_db_is_not_served_stale(season_db_2025, tmp_path):
+    import os
+
+    db = DatabaseManager(path=str(tmp_path / "league.db"), reference=season_db_2025)
+    try:
+        snapshot.load(db)
+        assert snapshot.get(db) is not None
+        db.draft_player("19788", "bot-1", 1)  # league writes keep the snapshot
+        assert snapshot.get(db) is not None
+        st = os.stat(season_db_2025)
+        os.utime(season_db_2025, ns=(st.st_atime_ns, st.st_mtime_ns + 1))  # a refresh
+        assert snapshot.get(db) is None
+    finally:
+        snapshot.clear()
+        db.close()
@@ -0,0 +1,122 @@
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+SERVER_DIR = os.path.join(os.path.dirname(__file__), "..", "py_grpc_server")
+sys.path.insert(0, SERVER_DIR)
+
+from blitz_env import DraftSelection  # noqa: E402
+from metrics import TRAILER_KEY, emit  # noqa: E402
+from worker_pool import BotError, WorkerPool  # noqa: E402
+
+FAKE_BOT = '''
+import os
+from blitz_env import AttemptedFantasyActions
+
+def draft_player():
+    from sqlalchemy import create_engine, text
+    with create_engine("sqlite://").connect() as conn:
+        conn.execute(text("SELECT 1"))
+    print("thinking")
+    print("x" * 100000)
+    return f"player-{os.getpid()}"
+
+def perform_weekly_fantasy_actions():
+    import sys
+    print("about to fail")
+    print("warning: bad roster", file=sys.stderr)
+    raise RuntimeError("boom")
+'''
+
+
+def _pick(result):
+    return DraftSelection.FromString(result).player_id
+
+
+@pytest.fixture
+def bot_dir(tmp_path, monkeypatch):
+    # Workers run from their own directory; make blitz_env importable there
+    monkeypatch.setenv("PYTHONPATH", os.path.abspath(os.path.join(SERVER_DIR, "..")))
+    for name in ("isolate_action.py", "framing.py", "metrics.py"):
+        shutil.copy(os.path.join(SERVER_DIR, name), tmp_path / name)
+    (tmp_path / "bot.py").write_text(FAKE_BOT)
+    return str(tmp_path)
+
+
+def test_workers_are_recycled_after_each_call(bot_dir):
+    pool = WorkerPool(size=1, max_calls=1, cwd=bot_dir)
+    try:
+        result, stdout, _, metrics = pool.call("draft")
+        assert stdout.startswith("thinking\n")
+        assert stdout.endswith("more characters truncated]")
+        first = _pick(result)
+        assert metrics["sqlite_queries"] == 1
+        assert metrics["worker_call"] == 1
+        for key in ("spawn_ms", "import_ms", "compute_ms", "serialize_ms", "peak_rss_kb"):
+            assert metrics[key] >= 0
+        second = _pick(pool.call("draft")[0])
+        assert first != second
+    finally:
+        pool.close()
+
+
+def test_workers_are_reused_up_to_max_calls(bot_dir):
+    pool = WorkerPool(size=1, max_calls=2, cwd=bot_dir)
+    try:
+        ids = [_pick(pool.call("draft")[0]) for _ in range(3)]
+        assert ids[0] == ids[1] != ids[2]
+    finally:
+        pool.close()
+
+
+def test_bot_exception_surfaces_and_pool_recovers(bot_dir):
+    pool = WorkerPool(size=1, max_calls=0, cwd=bot_dir)
+    try:
+        with pytest.raises(BotError, match="boom") as raised:
+            pool.call("perform_weekly_fantasy_actions")
+        assert raised.value.metrics["worker_call"] == 1
+        assert raised.value.stdout == "about to fail\n"
+        assert raised.value.stderr == "warning: bad roster\n"
+        assert _pick(pool.call("draft")[0]).startswith("player-")
+    finally:
+        pool.close()
+
+
+def test_metrics_are_emitted_as_json_line_and_trailer(capsys):
+    class Context:
+        def set_trailing_metadata(self, md):
+            self.trailer = md
+
+    context = Context()
+    line = emit("draft", {"compute_ms": 1.5}, context)
+    assert json.loads(capsys.readouterr().out) == {"event": "bot_rpc", "action": "draft", "compute_ms": 1.5}
+    assert context.trailer == ((TRAILER_KEY, line),)
+
+
+def test_server_prints_output_of_failed_calls(monkeypatch, capsys):
+    monkeypatch.delenv("BOTBLITZ_EVAL_INLINE", raising=False)
+    import server
+
+    class Pool:
+        def __init__(self, outcome):
+            self.outcome = outcome
+
+        def call(self, action):
+            if isinstance(self.outcome, Exception):
+                raise self.outcome
+            return self.outcome
+
+    servicer = server.AgentServiceServicer.__new__(server.AgentServiceServicer)
+    servicer.pool = Pool(BotError("Bot raised an exception: boom", {}, "about to fail", "bad roster"))
+    with pytest.raises(BotError):
+        servicer.perform_action_in_isolation("draft", DraftSelection())
+    out = capsys.readouterr().out
+    assert "Debug stdout: about to fail" in out and "Debug stderr: bad roster" in out
+
+    servicer.pool = Pool((b"\xff\xff not a message", "printed", "", {}))
+    with pytest.raises(BotError, match="not a valid DraftSelection"):
+        servicer.perform_action_in_isolation("draft", DraftSelection())
+    assert "Debug stdout: printed" in capsys.readouterr().out